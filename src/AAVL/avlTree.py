@@ -1,9 +1,22 @@
+import os
 import random
 import string
+import sys
 import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Executado como script (python3 AAVL/avlTree.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import (MULTIPLOS, SUBSTITUIR, IteradorArvore, NoComRegistros, Registro, agrupar_duplicatas, conferir_duplicatas,
+                     guardar_duplicata)
 
 # Classe que define um nó da árvore AVL.
-class NoAVL:
+class NoAVL(NoComRegistros):
+    __slots__ = ('chave', 'dado1', 'dado2', 'esquerda', 'direita', 'altura', 'extras')  # Sem __dict__ por nó
+
     def __init__(self, chave, dado1, dado2):
         self.chave = chave       # Chave do nó
         self.dado1 = dado1       # Primeiro dado (valor inteiro)
@@ -11,6 +24,7 @@ class NoAVL:
         self.esquerda = None     # Filho à esquerda
         self.direita = None      # Filho à direita
         self.altura = 1          # Altura do nó (inicializada como 1)
+        self.extras = None       # Pares (dado1, dado2) dos demais registros com a mesma chave
 
 # Função auxiliar para obter a altura de um nó.
 def obter_altura(no):
@@ -56,98 +70,389 @@ def rotacao_esquerda(x):
 
     return y
 
-# Função que insere um nó na árvore AVL.
-def inserir(raiz, chave, dado1, dado2):
-    if raiz is None:
-        return NoAVL(chave, dado1, dado2)
-
-    if chave < raiz.chave:
-        raiz.esquerda = inserir(raiz.esquerda, chave, dado1, dado2)
+# Corrige um nó desbalanceado (fator > 1 ou < -1) com rotação simples ou dupla.
+# Retorna a nova raiz da subárvore e quantas rotações simples foram feitas.
+def balancear(no, balanceamento):
+    if balanceamento > 1:
+        if obter_fator_balanceamento(no.esquerda) < 0:
+            no.esquerda = rotacao_esquerda(no.esquerda)
+            return rotacao_direita(no), 2
+        return rotacao_direita(no), 1
+    if obter_fator_balanceamento(no.direita) > 0:
+        no.direita = rotacao_direita(no.direita)
+        return rotacao_esquerda(no), 2
+    return rotacao_esquerda(no), 1
+
+# Faz o pai (ou a raiz, quando não há pai) apontar para o novo nó no lugar do antigo e retorna a raiz da árvore.
+def substituir_filho(raiz, pai, antigo, novo):
+    if pai is None:
+        return novo
+    if pai.esquerda is antigo:
+        pai.esquerda = novo
     else:
-        raiz.direita = inserir(raiz.direita, chave, dado1, dado2)
+        pai.direita = novo
+    return raiz
 
-    raiz.altura = 1 + max(obter_altura(raiz.esquerda), obter_altura(raiz.direita))
+# Atualiza as alturas e rebalanceia os nós do caminho, de baixo para cima.
+# Para assim que a altura de uma subárvore não muda, pois os ancestrais não são afetados.
+# Retorna a raiz da árvore e o número de rotações feitas.
+def rebalancear_caminho(raiz, caminho):
+    rotacoes = 0
+    for i in range(len(caminho) - 1, -1, -1):
+        no = caminho[i]
+        altura_antiga = no.altura
+        altura_esquerda = no.esquerda.altura if no.esquerda is not None else 0
+        altura_direita = no.direita.altura if no.direita is not None else 0
+        balanceamento = altura_esquerda - altura_direita
+        if balanceamento > 1 or balanceamento < -1:
+            novo, feitas = balancear(no, balanceamento)
+            rotacoes += feitas
+            raiz = substituir_filho(raiz, caminho[i - 1] if i > 0 else None, no, novo)
+            altura_nova = novo.altura
+        else:
+            altura_nova = 1 + (altura_esquerda if altura_esquerda > altura_direita else altura_direita)
+            no.altura = altura_nova
+        if altura_nova == altura_antiga:
+            break
+    return raiz, rotacoes
 
-    balanceamento = obter_fator_balanceamento(raiz)
+# Função que insere um nó na árvore AVL.
+def inserir(raiz, chave, dado1, dado2, duplicatas=MULTIPLOS):
+    return inserir_contando(raiz, chave, dado1, dado2, duplicatas)[0]
 
-    # Casos de desequilíbrio
-    if balanceamento > 1:
-        if chave < raiz.esquerda.chave:
-            return rotacao_direita(raiz)
-        else:
-            raiz.esquerda = rotacao_esquerda(raiz.esquerda)
-            return rotacao_direita(raiz)
-    if balanceamento < -1:
-        if chave > raiz.direita.chave:
-            return rotacao_esquerda(raiz)
+# Insere um nó e retorna a nova raiz e o número de rotações feitas.
+# A descida guarda o caminho em uma pilha explícita e o rebalanceamento é feito na volta, sem recursão.
+# Uma chave repetida não cria nó: o registro fica no nó existente, então a altura depende só das chaves distintas.
+def inserir_contando(raiz, chave, dado1, dado2, duplicatas=MULTIPLOS):
+    if raiz is None:
+        return NoAVL(chave, dado1, dado2), 0
+
+    caminho = []
+    atual = raiz
+    while atual is not None:
+        if chave == atual.chave:
+            guardar_duplicata(atual, dado1, dado2, duplicatas)
+            return raiz, 0
+        caminho.append(atual)
+        atual = atual.esquerda if chave < atual.chave else atual.direita
+
+    novo = NoAVL(chave, dado1, dado2)
+    pai = caminho[-1]
+    if chave < pai.chave:
+        pai.esquerda = novo
+    else:
+        pai.direita = novo
+
+    return rebalancear_caminho(raiz, caminho)
+
+# Função que remove um nó com a chave informada da árvore AVL.
+# Retorna a nova raiz, se algum nó foi removido e o número de rotações feitas.
+# Um nó com dois filhos é trocado pelo seu sucessor (menor chave da subárvore direita).
+def remover(raiz, chave):
+    caminho = []
+    atual = raiz
+    while atual is not None and atual.chave != chave:
+        caminho.append(atual)
+        atual = atual.esquerda if chave < atual.chave else atual.direita
+    if atual is None:
+        return raiz, False, 0
+
+    pai = caminho[-1] if caminho else None
+    if atual.esquerda is None or atual.direita is None:
+        filho = atual.esquerda if atual.esquerda is not None else atual.direita
+        raiz = substituir_filho(raiz, pai, atual, filho)
+    else:
+        indice = len(caminho)
+        caminho.append(atual)  # Posição que será ocupada pelo sucessor
+        sucessor = atual.direita
+        while sucessor.esquerda is not None:
+            caminho.append(sucessor)
+            sucessor = sucessor.esquerda
+        if sucessor is not atual.direita:
+            caminho[-1].esquerda = sucessor.direita
+            sucessor.direita = atual.direita
+        sucessor.esquerda = atual.esquerda
+        sucessor.altura = atual.altura
+        caminho[indice] = sucessor
+        raiz = substituir_filho(raiz, pai, atual, sucessor)
+
+    atual.esquerda = atual.direita = None
+    raiz, rotacoes = rebalancear_caminho(raiz, caminho)
+    return raiz, True, rotacoes
+
+# Constrói uma árvore perfeitamente balanceada a partir de uma sequência de registros ordenados pela chave.
+# Cada registro é visitado uma única vez e a pilha explícita evita o limite de recursão.
+# Registros de mesma chave são juntados em um único nó, conforme o modo de duplicatas.
+def construir_balanceada(registros, duplicatas=MULTIPLOS):
+    registros = agrupar_duplicatas(registros, duplicatas)
+    if not registros:
+        return None
+    raiz = None
+    pilha = [(0, len(registros), None, False)]  # (início, fim, pai, é filho à direita)
+    while pilha:
+        inicio, fim, pai, direita = pilha.pop()
+        meio = (inicio + fim) // 2
+        chave, dado1, dado2, extras = registros[meio]
+        no = NoAVL(chave, dado1, dado2)
+        no.extras = extras
+        no.altura = (fim - inicio).bit_length()  # Altura exata de uma subárvore com fim - inicio nós divididos ao meio
+        if pai is None:
+            raiz = no
+        elif direita:
+            pai.direita = no
         else:
-            raiz.direita = rotacao_direita(raiz.direita)
-            return rotacao_esquerda(raiz)
-
+            pai.esquerda = no
+        if meio + 1 < fim:
+            pilha.append((meio + 1, fim, no, True))
+        if inicio < meio:
+            pilha.append((inicio, meio, no, False))
     return raiz
 
 # Classe que define a árvore AVL.
 class ArvoreAVL:
-    def __init__(self):
+    # duplicatas: MULTIPLOS guarda todos os registros de uma chave no mesmo nó; SUBSTITUIR mantém só o último (upsert).
+    def __init__(self, duplicatas=MULTIPLOS):
+        conferir_duplicatas(duplicatas)
         self.raiz = None
+        self.duplicatas = duplicatas
+        self.rotacoes = 0  # Total de rotações simples feitas pelas inserções e remoções
 
     # Insere um nó na árvore AVL.
     def inserir(self, chave, dado1, dado2):
-        self.raiz = inserir(self.raiz, chave, dado1, dado2)
+        self.raiz, rotacoes = inserir_contando(self.raiz, chave, dado1, dado2, self.duplicatas)
+        self.rotacoes += rotacoes
+
+    # Substitui o conteúdo da árvore por uma árvore perfeitamente balanceada construída em O(n) a partir de registros já ordenados pela chave.
+    def carregar_ordenados(self, registros):
+        self.raiz = construir_balanceada(registros, self.duplicatas)
+
+    # Remove o nó com a chave informada (com todos os seus registros). Retorna True se a chave existia na árvore.
+    def remover(self, chave):
+        self.raiz, removido, rotacoes = remover(self.raiz, chave)
+        self.rotacoes += rotacoes
+        return removido
 
     # Realiza uma busca na árvore por uma chave e retorna o nó encontrado, o tempo gasto na busca e o número de interações.
     def buscar(self, chave):
-        tempo_inicio = time.time()  # Registra o tempo de início da busca
-        no, tempo_busca, interacoes = self._buscar(self.raiz, chave, 0)
-        tempo_fim = time.time()
-        return no, tempo_fim - tempo_inicio, interacoes
-
-    def _buscar(self, no, chave, interacoes):
-        if no is None:
-            return None, 0, interacoes  # Retorna None quando a chave não é encontrada
-        interacoes += 1
-        if no.chave == chave:
-            return no, 0, interacoes  # Retorna o nó e o número de interações quando a chave é encontrada
-        elif chave < no.chave:
-            return self._buscar(no.esquerda, chave, interacoes)
+        tempo_inicio = time.perf_counter_ns()  # Registra o tempo de início da busca
+        no = self.raiz
+        interacoes = 0
+        while no is not None:
+            interacoes += 1
+            if no.chave == chave:
+                break  # Chave encontrada
+            no = no.esquerda if chave < no.chave else no.direita
+        tempo_fim = time.perf_counter_ns()
+        return no, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    # Retorna todos os registros com a chave informada em uma única descida, o tempo gasto e o número de interações.
+    def buscar_todos(self, chave):
+        no, tempo, interacoes = self.buscar(chave)
+        return (no.registros() if no else []), tempo, interacoes
+
+    # Retorna um iterador preguiçoso, em ordem crescente, sobre os nós com chave entre inicio e fim (inclusive).
+    def buscar_intervalo(self, inicio, fim):
+        return IteradorArvore(self.raiz, inicio, fim)
+
+    # Percorre todos os nós em ordem crescente ou decrescente de chave.
+    def em_ordem(self):
+        return IteradorArvore(self.raiz)
+
+    def em_ordem_reversa(self):
+        return IteradorArvore(self.raiz, reverso=True)
+
+    def __iter__(self):
+        return self.em_ordem()
+
+    # Busca várias chaves em uma única varredura da árvore: as chaves são ordenadas e cada nó visitado reparte
+    # o intervalo de chaves entre as subárvores, de modo que prefixos de caminho comuns são percorridos uma só vez.
+    # Retorna, na ordem das chaves recebidas, pares (nó ou None, interações que a busca individual teria feito),
+    # o tempo total e o número de nós efetivamente visitados.
+    def buscar_lote(self, chaves):
+        tempo_inicio = time.perf_counter_ns()
+        resultados = [None] * len(chaves)
+        ordem = sorted(range(len(chaves)), key=chaves.__getitem__)
+        ordenadas = [chaves[i] for i in ordem]
+        interacoes = 0
+        pilha = [(self.raiz, 0, len(ordenadas), 0)] if ordenadas else []  # (nó, início, fim, profundidade)
+        while pilha:
+            no, inicio, fim, profundidade = pilha.pop()
+            if no is None:
+                for j in range(inicio, fim):
+                    resultados[ordem[j]] = (None, profundidade)
+                continue
+            interacoes += 1
+            profundidade += 1
+            iguais_inicio = bisect_left(ordenadas, no.chave, inicio, fim)
+            iguais_fim = bisect_right(ordenadas, no.chave, iguais_inicio, fim)
+            for j in range(iguais_inicio, iguais_fim):
+                resultados[ordem[j]] = (no, profundidade)
+            if iguais_fim < fim:
+                pilha.append((no.direita, iguais_fim, fim, profundidade))
+            if inicio < iguais_inicio:
+                pilha.append((no.esquerda, inicio, iguais_inicio, profundidade))
+        tempo_fim = time.perf_counter_ns()
+        return resultados, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+# Versão compacta da árvore AVL: cada nó é um índice nos arrays paralelos, os filhos são índices (-1 = vazio)
+# e todos os dado2 ficam em um único buffer de bytes endereçado por deslocamento.
+# Como na versão com objetos, uma chave repetida não cria nó: o registro vai para os arrays fora da árvore
+# (sem filhos e sem pai) e o índice dele fica na lista de repetidos do nó da chave.
+class ArvoreAVLCompacta:
+    def __init__(self):
+        self.raiz = -1
+        self.chaves = array('q')
+        self.dados1 = array('q')
+        self.esquerda = array('q')
+        self.direita = array('q')
+        self.alturas = array('B')
+        self.dados2 = bytearray()
+        self.inicios_dado2 = array('Q', [0])  # O dado2 do nó i ocupa dados2[inicios_dado2[i]:inicios_dado2[i + 1]]
+        self.repetidos = {}  # Índice do nó -> índices dos demais registros com a mesma chave, na ordem de inserção
+        self.rotacoes = 0
+
+    def __len__(self):
+        return len(self.chaves)
+
+    # Insere um nó na árvore AVL, com o mesmo algoritmo iterativo da versão com objetos.
+    def inserir(self, chave, dado1, dado2):
+        novo = len(self.chaves)
+        self.chaves.append(chave)
+        self.dados1.append(dado1)
+        self.esquerda.append(-1)
+        self.direita.append(-1)
+        self.alturas.append(1)
+        self.dados2 += dado2.encode('ascii')
+        self.inicios_dado2.append(len(self.dados2))
+        if self.raiz == -1:
+            self.raiz = novo
+            return
+
+        chaves, esquerda, direita = self.chaves, self.esquerda, self.direita
+        caminho = []
+        atual = self.raiz
+        while atual != -1:
+            if chaves[atual] == chave:
+                self.repetidos.setdefault(atual, []).append(novo)
+                return
+            caminho.append(atual)
+            atual = esquerda[atual] if chave < chaves[atual] else direita[atual]
+        pai = caminho[-1]
+        if chave < chaves[pai]:
+            esquerda[pai] = novo
         else:
-            return self._buscar(no.direita, chave, interacoes)
+            direita[pai] = novo
+
+        alturas = self.alturas
+        for i in range(len(caminho) - 1, -1, -1):
+            no = caminho[i]
+            altura_antiga = alturas[no]
+            balanceamento = self._altura(esquerda[no]) - self._altura(direita[no])
+            if balanceamento > 1 or balanceamento < -1:
+                novo_no = self._balancear(no, balanceamento)
+                if i == 0:
+                    self.raiz = novo_no
+                elif esquerda[caminho[i - 1]] == no:
+                    esquerda[caminho[i - 1]] = novo_no
+                else:
+                    direita[caminho[i - 1]] = novo_no
+                break  # Após a rotação a subárvore volta à altura que tinha antes da inserção
+            self._atualizar_altura(no)
+            if alturas[no] == altura_antiga:
+                break
+
+    def _altura(self, no):
+        return self.alturas[no] if no != -1 else 0
+
+    def _atualizar_altura(self, no):
+        self.alturas[no] = 1 + max(self._altura(self.esquerda[no]), self._altura(self.direita[no]))
+
+    def _rotacao_direita(self, y):
+        x = self.esquerda[y]
+        self.esquerda[y] = self.direita[x]
+        self.direita[x] = y
+        self._atualizar_altura(y)
+        self._atualizar_altura(x)
+        return x
+
+    def _rotacao_esquerda(self, x):
+        y = self.direita[x]
+        self.direita[x] = self.esquerda[y]
+        self.esquerda[y] = x
+        self._atualizar_altura(x)
+        self._atualizar_altura(y)
+        return y
+
+    def _balancear(self, no, balanceamento):
+        if balanceamento > 1:
+            filho = self.esquerda[no]
+            if self._altura(self.esquerda[filho]) < self._altura(self.direita[filho]):
+                self.esquerda[no] = self._rotacao_esquerda(filho)
+                self.rotacoes += 1
+            self.rotacoes += 1
+            return self._rotacao_direita(no)
+        filho = self.direita[no]
+        if self._altura(self.direita[filho]) < self._altura(self.esquerda[filho]):
+            self.direita[no] = self._rotacao_direita(filho)
+            self.rotacoes += 1
+        self.rotacoes += 1
+        return self._rotacao_esquerda(no)
+
+    def registro(self, indice):
+        dado2 = self.dados2[self.inicios_dado2[indice]:self.inicios_dado2[indice + 1]].decode('ascii')
+        return Registro(self.chaves[indice], self.dados1[indice], dado2)
+
+    # Realiza uma busca na árvore por uma chave e retorna o registro encontrado, o tempo gasto na busca e o número de interações.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves, esquerda, direita = self.chaves, self.esquerda, self.direita
+        atual = self.raiz
+        interacoes = 0
+        while atual != -1:
+            interacoes += 1
+            if chaves[atual] == chave:
+                tempo_fim = time.perf_counter_ns()
+                return self.registro(atual), (tempo_fim - tempo_inicio) / 1e9, interacoes
+            atual = esquerda[atual] if chave < chaves[atual] else direita[atual]
+        tempo_fim = time.perf_counter_ns()
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    # Retorna todos os registros com a chave, o tempo gasto e o número de interações.
+    def buscar_todos(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves, esquerda, direita = self.chaves, self.esquerda, self.direita
+        atual = self.raiz
+        interacoes = 0
+        registros = []
+        while atual != -1:
+            interacoes += 1
+            if chaves[atual] == chave:
+                registros = [self.registro(indice) for indice in [atual] + self.repetidos.get(atual, [])]
+                break
+            atual = esquerda[atual] if chave < chaves[atual] else direita[atual]
+        tempo_fim = time.perf_counter_ns()
+        return registros, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+# Monta as linhas de resultado de um lote de buscas. O tempo de cada chave é a média do lote.
+def formatar_resultados(chaves, resultados, tempo_total):
+    tempo_medio = tempo_total / len(chaves) if chaves else 0
+    linhas = []
+    for chave, (no, interacoes) in zip(chaves, resultados):
+        situacao = "encontrada" if no else "não encontrada"
+        linhas.append(f"Chave: {chave}, {situacao}, Tempo médio de pesquisa: {tempo_medio:.6f} segundos, Interacoes: {interacoes}")
+    return linhas
 
 # Classe para buscar chaves que existem na árvore.
 class BuscadorChavesExistentes:
     def buscar_chaves(self, arvore, chaves):
-        resultados = []
-        tempo_total = 0
-        interacoes_total = 0
-
-        for chave in chaves:
-            resultado, tempo_busca, interacoes = arvore.buscar(chave)
-            tempo_total += tempo_busca
-            interacoes_total += interacoes
-            if resultado:
-                resultados.append(f"Chave: {chave}, encontrada, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Interacoes: {interacoes}")
-            else:
-                resultados.append(f"Chave: {chave}, não encontrada, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Interacoes: {interacoes}")
-
-        return resultados, tempo_total, interacoes_total
+        resultados, tempo_total, interacoes_total = arvore.buscar_lote(chaves)
+        return formatar_resultados(chaves, resultados, tempo_total), tempo_total, interacoes_total
 
 # Classe para buscar chaves que não existem na árvore.
 class BuscadorChavesNaoExistentes:
     def buscar_chaves(self, arvore, num_entradas, chaves):
-        resultados = []
-        tempo_total = 0
-        interacoes_total = 0
-
-        for chave in chaves:
-            resultado, tempo_busca, interacoes = arvore.buscar(chave)
-            tempo_total += tempo_busca
-            interacoes_total += interacoes
-            if resultado:
-                resultados.append(f"Chave: {chave}, encontrada, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Interacoes: {interacoes}")
-            else:
-                resultados.append(f"Chave: {chave}, não encontrada, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Interacoes: {interacoes}")
-
-        return resultados, tempo_total, interacoes_total
+        resultados, tempo_total, interacoes_total = arvore.buscar_lote(chaves)
+        return formatar_resultados(chaves, resultados, tempo_total), tempo_total, interacoes_total
 
 # Gera dados aleatórios com chaves, valores inteiros e combinações de letras.
 def gerar_dados(num_entradas, ordenadas=False):
@@ -155,15 +460,14 @@ def gerar_dados(num_entradas, ordenadas=False):
     for i in range(num_entradas):
         chave = i + 1 if ordenadas else random.randint(1, num_entradas)
         dado1 = random.randint(1, 100)
-        dado2 = ''.join(random.choice(string.ascii_letters) for _ in range(100))
+        dado2 = ''.join(random.choices(string.ascii_letters, k=100))
         dados.append((chave, dado1, dado2))
     return dados
 
 # Função para criar um arquivo com os dados gerados.
 def criar_arquivo_dados(dados, nome_arquivo):
     with open(nome_arquivo, 'w') as arquivo:
-        for entrada in dados:
-            arquivo.write(f"{entrada[0]} {entrada[1]} {entrada[2]}\n")
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
 
 # Função principal do programa.
 def main():
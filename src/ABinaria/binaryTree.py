@@ -1,54 +1,260 @@
+import os
 import random
 import string
+import sys
 import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+#executado como script (python3 ABinaria/binaryTree.py), o diretório src não está no caminho de importação
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import (MULTIPLOS, SUBSTITUIR, IteradorArvore, NoComRegistros, Registro, agrupar_duplicatas, conferir_duplicatas,
+                     guardar_duplicata)
+
+class NoArvoreBinaria(NoComRegistros): #cada nó possui uma chave e dois dados associados
+    __slots__ = ('chave', 'dado1', 'dado2', 'esquerda', 'direita', 'extras') #sem __dict__ por nó
 
-class NoArvoreBinaria: #cada nó possui uma chave e dois dados associados
     def __init__(self, chave, dado1, dado2):
         self.chave = chave
         self.dado1 = dado1
         self.dado2 = dado2
         self.esquerda = None
         self.direita = None
+        self.extras = None #pares (dado1, dado2) dos demais registros com a mesma chave
 
 class ArvoreBinariaBusca:
-    def __init__(self):
+    #duplicatas: MULTIPLOS guarda todos os registros de uma chave no mesmo nó; SUBSTITUIR mantém só o último (upsert)
+    def __init__(self, duplicatas=MULTIPLOS):
+        conferir_duplicatas(duplicatas)
         self.raiz = None
+        self.duplicatas = duplicatas
 
-    #inserir novo nó na árvore
+    #inserir novo nó na árvore (uma chave repetida não cria nó, o registro fica no nó existente)
     def inserir(self, chave, dado1, dado2):
-        novo_no = NoArvoreBinaria(chave, dado1, dado2)
         if self.raiz is None:
-            self.raiz = novo_no
+            self.raiz = NoArvoreBinaria(chave, dado1, dado2)
         else:
             atual = self.raiz
             while True:
                 if chave < atual.chave:
                     if atual.esquerda is None:
-                        atual.esquerda = novo_no
+                        atual.esquerda = NoArvoreBinaria(chave, dado1, dado2)
                         break
                     atual = atual.esquerda
                 elif chave > atual.chave:
                     if atual.direita is None:
-                        atual.direita = novo_no
+                        atual.direita = NoArvoreBinaria(chave, dado1, dado2)
                         break
                     atual = atual.direita
+                else:
+                    guardar_duplicata(atual, dado1, dado2, self.duplicatas)
+                    break
     
+    #substitui o conteúdo da árvore por uma árvore perfeitamente balanceada, construída em O(n) a partir de registros já ordenados pela chave.
+    #registros de mesma chave são juntados em um único nó, conforme o modo de duplicatas
+    def carregar_ordenados(self, registros):
+        registros = agrupar_duplicatas(registros, self.duplicatas)
+        self.raiz = None
+        #pilha explícita com (início, fim, pai, é filho à direita) no lugar da recursão
+        pilha = [(0, len(registros), None, False)] if registros else []
+        while pilha:
+            inicio, fim, pai, direita = pilha.pop()
+            meio = (inicio + fim) // 2
+            chave, dado1, dado2, extras = registros[meio]
+            no = NoArvoreBinaria(chave, dado1, dado2)
+            no.extras = extras
+            if pai is None:
+                self.raiz = no
+            elif direita:
+                pai.direita = no
+            else:
+                pai.esquerda = no
+            if meio + 1 < fim:
+                pilha.append((meio + 1, fim, no, True))
+            if inicio < meio:
+                pilha.append((inicio, meio, no, False))
+
     #procurar opor uma chave
     def buscar(self, chave):
-        tempo_inicio = time.time()
+        tempo_inicio = time.perf_counter_ns()
         atual = self.raiz
         interacoes = 0
         while atual is not None:
             interacoes += 1
             if chave == atual.chave:
-                tempo_fim = time.time()
-                return atual, tempo_fim - tempo_inicio, interacoes
+                tempo_fim = time.perf_counter_ns()
+                return atual, (tempo_fim - tempo_inicio) / 1e9, interacoes
             elif chave < atual.chave:
                 atual = atual.esquerda
             else:
                 atual = atual.direita
-        tempo_fim = time.time()
-        return None, tempo_fim - tempo_inicio, interacoes
+        tempo_fim = time.perf_counter_ns()
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    #remove o nó da chave (com todos os registros dela) e retorna se ele existia
+    #com dois filhos, o sucessor (menor nó da subárvore direita) é religado no lugar do nó removido, sem copiar dados entre nós
+    def remover(self, chave):
+        pai = None
+        atual = self.raiz
+        while atual is not None and atual.chave != chave:
+            pai = atual
+            atual = atual.esquerda if chave < atual.chave else atual.direita
+        if atual is None:
+            return False
+
+        if atual.esquerda is None or atual.direita is None:
+            substituto = atual.esquerda if atual.esquerda is not None else atual.direita
+        else:
+            pai_sucessor = atual
+            substituto = atual.direita
+            while substituto.esquerda is not None:
+                pai_sucessor = substituto
+                substituto = substituto.esquerda
+            if pai_sucessor is not atual:
+                pai_sucessor.esquerda = substituto.direita
+                substituto.direita = atual.direita
+            substituto.esquerda = atual.esquerda
+
+        if pai is None:
+            self.raiz = substituto
+        elif pai.esquerda is atual:
+            pai.esquerda = substituto
+        else:
+            pai.direita = substituto
+        atual.esquerda = atual.direita = None
+        return True
+
+    #retorna todos os registros com a chave informada em uma única descida, o tempo gasto e o número de interações
+    def buscar_todos(self, chave):
+        atual, tempo, interacoes = self.buscar(chave)
+        return (atual.registros() if atual else []), tempo, interacoes
+
+    #retorna um iterador preguiçoso, em ordem crescente, sobre os nós com chave entre inicio e fim (inclusive)
+    def buscar_intervalo(self, inicio, fim):
+        return IteradorArvore(self.raiz, inicio, fim)
+
+    #percorre todos os nós em ordem crescente ou decrescente de chave
+    def em_ordem(self):
+        return IteradorArvore(self.raiz)
+
+    def em_ordem_reversa(self):
+        return IteradorArvore(self.raiz, reverso=True)
+
+    def __iter__(self):
+        return self.em_ordem()
+
+    #busca várias chaves em uma única varredura: as chaves são ordenadas e cada nó visitado reparte o intervalo de chaves
+    #entre as subárvores, então os prefixos de caminho comuns são percorridos uma só vez.
+    #retorna, na ordem das chaves recebidas, pares (nó ou None, interações que a busca individual teria feito),
+    #o tempo total e o número de nós efetivamente visitados
+    def buscar_lote(self, chaves):
+        tempo_inicio = time.perf_counter_ns()
+        resultados = [None] * len(chaves)
+        ordem = sorted(range(len(chaves)), key=chaves.__getitem__)
+        ordenadas = [chaves[i] for i in ordem]
+        interacoes = 0
+        pilha = [(self.raiz, 0, len(ordenadas), 0)] if ordenadas else [] #(nó, início, fim, profundidade)
+        while pilha:
+            atual, inicio, fim, profundidade = pilha.pop()
+            if atual is None:
+                for j in range(inicio, fim):
+                    resultados[ordem[j]] = (None, profundidade)
+                continue
+            interacoes += 1
+            profundidade += 1
+            iguais_inicio = bisect_left(ordenadas, atual.chave, inicio, fim)
+            iguais_fim = bisect_right(ordenadas, atual.chave, iguais_inicio, fim)
+            for j in range(iguais_inicio, iguais_fim):
+                resultados[ordem[j]] = (atual, profundidade)
+            if iguais_fim < fim:
+                pilha.append((atual.direita, iguais_fim, fim, profundidade))
+            if inicio < iguais_inicio:
+                pilha.append((atual.esquerda, inicio, iguais_inicio, profundidade))
+        tempo_fim = time.perf_counter_ns()
+        return resultados, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+#versão compacta da árvore: cada nó é um índice nos arrays paralelos, os filhos são índices (-1 = vazio)
+#e todos os dado2 ficam em um único buffer de bytes endereçado por deslocamento.
+#uma chave repetida não cria nó: o registro vai para os arrays fora da árvore e o índice dele fica na lista de repetidos do nó da chave
+class ArvoreBinariaBuscaCompacta:
+    def __init__(self):
+        self.raiz = -1
+        self.chaves = array('q')
+        self.dados1 = array('q')
+        self.esquerda = array('q')
+        self.direita = array('q')
+        self.dados2 = bytearray()
+        self.inicios_dado2 = array('Q', [0]) #o dado2 do nó i ocupa dados2[inicios_dado2[i]:inicios_dado2[i + 1]]
+        self.repetidos = {} #índice do nó -> índices dos demais registros com a mesma chave, na ordem de inserção
+
+    def __len__(self):
+        return len(self.chaves)
+
+    #inserir novo nó na árvore (uma chave repetida entra na lista de repetidos do nó existente)
+    def inserir(self, chave, dado1, dado2):
+        novo = len(self.chaves)
+        self.chaves.append(chave)
+        self.dados1.append(dado1)
+        self.esquerda.append(-1)
+        self.direita.append(-1)
+        self.dados2 += dado2.encode('ascii')
+        self.inicios_dado2.append(len(self.dados2))
+        if self.raiz == -1:
+            self.raiz = novo
+            return
+        chaves, esquerda, direita = self.chaves, self.esquerda, self.direita
+        atual = self.raiz
+        while True:
+            if chave < chaves[atual]:
+                if esquerda[atual] == -1:
+                    esquerda[atual] = novo
+                    return
+                atual = esquerda[atual]
+            elif chave == chaves[atual]:
+                self.repetidos.setdefault(atual, []).append(novo)
+                return
+            else:
+                if direita[atual] == -1:
+                    direita[atual] = novo
+                    return
+                atual = direita[atual]
+
+    def registro(self, indice):
+        dado2 = self.dados2[self.inicios_dado2[indice]:self.inicios_dado2[indice + 1]].decode('ascii')
+        return Registro(self.chaves[indice], self.dados1[indice], dado2)
+
+    #procurar por uma chave
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves, esquerda, direita = self.chaves, self.esquerda, self.direita
+        atual = self.raiz
+        interacoes = 0
+        while atual != -1:
+            interacoes += 1
+            if chave == chaves[atual]:
+                tempo_fim = time.perf_counter_ns()
+                return self.registro(atual), (tempo_fim - tempo_inicio) / 1e9, interacoes
+            atual = esquerda[atual] if chave < chaves[atual] else direita[atual]
+        tempo_fim = time.perf_counter_ns()
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    #retorna todos os registros com a chave, o tempo gasto e o número de interações
+    def buscar_todos(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves, esquerda, direita = self.chaves, self.esquerda, self.direita
+        atual = self.raiz
+        interacoes = 0
+        registros = []
+        while atual != -1:
+            interacoes += 1
+            if chave == chaves[atual]:
+                registros = [self.registro(indice) for indice in [atual] + self.repetidos.get(atual, [])]
+                break
+            atual = esquerda[atual] if chave < chaves[atual] else direita[atual]
+        tempo_fim = time.perf_counter_ns()
+        return registros, (tempo_fim - tempo_inicio) / 1e9, interacoes
 
 #busca números que existem na árvore
 class BuscaNumerosQueExistem:
@@ -57,15 +263,14 @@ class BuscaNumerosQueExistem:
         self.arvore = arvore
         self.num_buscas = num_buscas
         self.num_entradas = num_entradas
+        self.interacoes_total = 0 #nós visitados pelo lote inteiro
 
-    #gerador de chaves aleatórias, busca cada uma delas na árvore
+    #gerador de chaves aleatórias, busca todas elas de uma vez na árvore (o tempo de cada chave é a média do lote)
     def buscar_numeros_que_existem(self):
-        resultados = []
-        for _ in range(self.num_buscas):
-            chave = random.choice(range(1, self.num_entradas + 1))
-            resultado, tempo, interacoes = self.arvore.buscar(chave)
-            resultados.append((chave, resultado, tempo, interacoes))
-        return resultados
+        chaves = [random.randint(1, self.num_entradas) for _ in range(self.num_buscas)]
+        resultados, tempo_total, self.interacoes_total = self.arvore.buscar_lote(chaves)
+        tempo_medio = tempo_total / len(chaves) if chaves else 0
+        return [(chave, resultado, tempo_medio, interacoes) for chave, (resultado, interacoes) in zip(chaves, resultados)]
 
 #Busca números que não existem na árvore
 class BuscaNumerosQueNaoExistem:
@@ -75,19 +280,19 @@ class BuscaNumerosQueNaoExistem:
         self.dados = dados
         self.num_buscas = num_buscas
         self.num_entradas = num_entradas
+        self.interacoes_total = 0 #nós visitados pelo lote inteiro
 
-    #gerador de chaves aleatórias que não existem na árvore, busca cada uma delas
+    #gerador de chaves aleatórias que não existem na árvore, busca todas elas de uma vez
     def buscar_numeros_que_nao_existem(self):
         numeros_unicos = set(entry[0] for entry in self.dados)
-        numeros_nao_encontrados = []
-
-        while len(numeros_nao_encontrados) < self.num_buscas:
+        chaves = []
+        while len(chaves) < self.num_buscas:
             num_aleatorio = random.randint(1, self.num_entradas * 2)
             if num_aleatorio not in numeros_unicos:
-                resultado, tempo, interacoes = self.arvore.buscar(num_aleatorio)
-                if not resultado:
-                    numeros_nao_encontrados.append((num_aleatorio, tempo, interacoes))
-        return numeros_nao_encontrados
+                chaves.append(num_aleatorio)
+        resultados, tempo_total, self.interacoes_total = self.arvore.buscar_lote(chaves)
+        tempo_medio = tempo_total / len(chaves) if chaves else 0
+        return [(chave, tempo_medio, interacoes) for chave, (resultado, interacoes) in zip(chaves, resultados) if not resultado]
 
 #gerar dados aleatórios para preencher a árvore
 def gerar_dados(num_entradas, ordenado=False):
@@ -98,15 +303,14 @@ def gerar_dados(num_entradas, ordenado=False):
 
     for chave in chaves:
         dado1 = random.randint(1, 100)
-        dado2 = ''.join(random.choice(string.ascii_letters) for _ in range(10))
+        dado2 = ''.join(random.choices(string.ascii_letters, k=10))
         dados.append((chave, dado1, dado2))
     return dados
 
 #cria arquivo de dados
 def criar_arquivo_de_dados(dados, nome_arquivo):
     with open(nome_arquivo, 'w') as arquivo:
-        for entrada in dados:
-            arquivo.write(f"{entrada[0]} {entrada[1]} {entrada[2]}\n")
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
 
 def main():
     #solicitar informações do usuário
@@ -151,8 +355,8 @@ def main():
     tempo_total_existente = sum(tempo for _, _, tempo, _ in resultados_existente)
     tempo_total_nao_existente = sum(tempo for _, tempo, _ in resultados_nao_existente)
 
-    interacoes_total_existente = sum(interacoes for _, _, _, interacoes in resultados_existente)
-    interacoes_total_nao_existente = sum(interacoes for _, _, interacoes in resultados_nao_existente)
+    interacoes_total_existente = busca_existente.interacoes_total
+    interacoes_total_nao_existente = busca_nao_existente.interacoes_total
 
     print()
     print(f"Tempo total das buscas pelos números que existem: {tempo_total_existente:.6f} segundos")
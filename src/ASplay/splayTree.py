@@ -0,0 +1,199 @@
+import os
+import random
+import string
+import sys
+import time
+
+# Executado como script (python3 ASplay/splayTree.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import MULTIPLOS, NoComRegistros, conferir_duplicatas, guardar_duplicata
+
+# Classe que define um nó da árvore splay.
+class NoSplay(NoComRegistros):
+    __slots__ = ('chave', 'dado1', 'dado2', 'esquerda', 'direita', 'extras')
+
+    def __init__(self, chave, dado1, dado2):
+        self.chave = chave       # Chave do nó
+        self.dado1 = dado1       # Primeiro dado (valor inteiro)
+        self.dado2 = dado2       # Segundo dado (combinação de letras)
+        self.esquerda = None     # Filho à esquerda
+        self.direita = None      # Filho à direita
+        self.extras = None       # Pares (dado1, dado2) dos demais registros com a mesma chave
+
+# Árvore splay: cada busca ou inserção traz o último nó do caminho para a raiz (splay descendente, sem recursão).
+# Não guarda altura nem fator de balanceamento; o custo é amortizado O(log n) e as chaves mais acessadas ficam perto da raiz.
+class ArvoreSplay:
+    def __init__(self, duplicatas=MULTIPLOS):
+        conferir_duplicatas(duplicatas)
+        self.raiz = None
+        self.duplicatas = duplicatas
+        self.rotacoes = 0
+        self.tamanho = 0
+
+    def __len__(self):
+        return self.tamanho
+
+    # Splay descendente: desce em direção à chave, pendurando os nós visitados em uma árvore da esquerda (chaves menores)
+    # e outra da direita (chaves maiores), e faz uma rotação nos casos zig-zig. No fim, o último nó visitado vira a raiz.
+    # Retorna o número de nós visitados no caminho.
+    def _splay(self, chave):
+        atual = self.raiz
+        if atual is None:
+            return 0
+        cabeca = NoSplay(None, None, None)  # cabeca.direita = árvore da esquerda, cabeca.esquerda = árvore da direita
+        maior_esquerda = menor_direita = cabeca
+        interacoes = 0
+        while True:
+            interacoes += 1
+            if chave < atual.chave:
+                filho = atual.esquerda
+                if filho is None:
+                    break
+                if chave < filho.chave:
+                    interacoes += 1
+                    atual.esquerda = filho.direita
+                    filho.direita = atual
+                    atual = filho
+                    self.rotacoes += 1
+                    if atual.esquerda is None:
+                        break
+                menor_direita.esquerda = atual
+                menor_direita = atual
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                filho = atual.direita
+                if filho is None:
+                    break
+                if chave > filho.chave:
+                    interacoes += 1
+                    atual.direita = filho.esquerda
+                    filho.esquerda = atual
+                    atual = filho
+                    self.rotacoes += 1
+                    if atual.direita is None:
+                        break
+                maior_esquerda.direita = atual
+                maior_esquerda = atual
+                atual = atual.direita
+            else:
+                break
+        maior_esquerda.direita = atual.esquerda
+        menor_direita.esquerda = atual.direita
+        atual.esquerda = cabeca.direita
+        atual.direita = cabeca.esquerda
+        self.raiz = atual
+        return interacoes
+
+    # Insere um registro: a árvore é dividida em torno da chave e o novo nó vira a raiz.
+    def inserir(self, chave, dado1, dado2):
+        if self.raiz is None:
+            self.raiz = NoSplay(chave, dado1, dado2)
+            self.tamanho = 1
+            return
+        self._splay(chave)
+        raiz = self.raiz
+        if raiz.chave == chave:
+            guardar_duplicata(raiz, dado1, dado2, self.duplicatas)
+            return
+        novo = NoSplay(chave, dado1, dado2)
+        if chave < raiz.chave:
+            novo.esquerda = raiz.esquerda
+            novo.direita = raiz
+            raiz.esquerda = None
+        else:
+            novo.direita = raiz.direita
+            novo.esquerda = raiz
+            raiz.direita = None
+        self.raiz = novo
+        self.tamanho += 1
+
+    # Realiza uma busca na árvore por uma chave e retorna o nó encontrado, o tempo gasto na busca e o número de interações.
+    # A busca também reorganiza a árvore: o nó encontrado (ou o último do caminho) passa a ser a raiz.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        interacoes = self._splay(chave)
+        raiz = self.raiz
+        tempo_fim = time.perf_counter_ns()
+        if raiz is not None and raiz.chave == chave:
+            return raiz, (tempo_fim - tempo_inicio) / 1e9, interacoes
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    # Retorna todos os registros com a chave, o tempo gasto e o número de interações.
+    def buscar_todos(self, chave):
+        no, tempo, interacoes = self.buscar(chave)
+        return (no.registros() if no else []), tempo, interacoes
+
+    # Percorre a árvore em ordem crescente de chave, sem recursão e sem reorganizá-la.
+    def em_ordem(self):
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            atual = pilha.pop()
+            yield atual
+            atual = atual.direita
+
+    def __iter__(self):
+        return self.em_ordem()
+
+# Gera dados aleatórios com chaves, valores inteiros e combinações de letras.
+def gerar_dados(num_entradas, ordenadas=False):
+    dados = []
+    chaves = list(range(1, num_entradas + 1))
+    if not ordenadas:
+        random.shuffle(chaves)
+    for chave in chaves:
+        dado1 = random.randint(1, 100)
+        dado2 = ''.join(random.choices(string.ascii_letters, k=100))
+        dados.append((chave, dado1, dado2))
+    return dados
+
+# Função para criar um arquivo com os dados gerados.
+def criar_arquivo_dados(dados, nome_arquivo):
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
+
+# Função principal do programa.
+def main():
+    num_entradas = int(input("Número de chaves no arquivo: "))
+    quant_buscas = int(input("Quantidade de chaves aleatórias a buscar: "))
+    opcao_ordenadas = input("Chaves ordenadas? (S/N): ").strip().lower()
+    dados_ordenados = opcao_ordenadas == 's'
+
+    dados = gerar_dados(num_entradas, ordenadas=dados_ordenados)
+    criar_arquivo_dados(dados, 'dados.txt')
+
+    tempo_inicio = time.perf_counter()
+    arvore = ArvoreSplay()
+    for chave, dado1, dado2 in dados:
+        arvore.inserir(chave, dado1, dado2)
+    print(f"Tempo de inserção: {time.perf_counter() - tempo_inicio:.6f} segundos, Rotações: {arvore.rotacoes}")
+
+    chaves_existem = random.sample(range(1, num_entradas + 1), quant_buscas)
+    chaves_nao_existem = random.sample(range(num_entradas + 1, num_entradas + 1 + quant_buscas * 2), quant_buscas)
+
+    totais = {}
+    for titulo, chaves in (("existem", chaves_existem), ("não existem", chaves_nao_existem)):
+        print(f"\nBusca pelos números que {titulo}:")
+        tempo_total = 0
+        interacoes_total = 0
+        rotacoes_inicio = arvore.rotacoes
+        for chave in chaves:
+            resultado, tempo_busca, interacoes = arvore.buscar(chave)
+            tempo_total += tempo_busca
+            interacoes_total += interacoes
+            situacao = "encontrada" if resultado else "não encontrada"
+            print(f"Chave: {chave}, {situacao}, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Interacoes: {interacoes}")
+        totais[titulo] = (tempo_total, interacoes_total, arvore.rotacoes - rotacoes_inicio)
+
+    print(f"\nTempo total das buscas pelos números que existem: {totais['existem'][0]:.6f} segundos")
+    print(f"Tempo total das buscas pelos números que não existem: {totais['não existem'][0]:.6f} segundos")
+    print(f"Número total de interações em todas as buscas: {totais['existem'][1] + totais['não existem'][1]}")
+    print(f"Rotações feitas pelas buscas: {totais['existem'][2] + totais['não existem'][2]}")
+
+if __name__ == "__main__":
+    main()
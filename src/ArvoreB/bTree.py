@@ -0,0 +1,306 @@
+import os
+import random
+import string
+import struct
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+# Executado como script (python3 ArvoreB/bTree.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import Registro
+
+TAMANHO_PAGINA = 4096    # Tamanho fixo de cada página do arquivo (em bytes)
+TAMANHO_DADO2 = 100      # Largura fixa do campo dado2 dentro da página
+CAPACIDADE_CACHE = 64    # Número de páginas mantidas em memória
+
+# Cabeçalho (página 0): identificador, tamanho da página, largura do dado2, ordem, raiz, número de páginas e de registros.
+FORMATO_CABECALHO = struct.Struct('<4sIIIIIQ')
+IDENTIFICADOR = b'ARVB'
+# Início de cada página de nó: se é folha e quantas chaves possui.
+FORMATO_NO = struct.Struct('<BH')
+FORMATO_FILHO = struct.Struct('<I')
+
+# Calcula a ordem mínima t da árvore B para que 2t - 1 registros e 2t filhos caibam em uma página.
+def calcular_ordem(tamanho_pagina, tamanho_dado2):
+    tamanho_registro = struct.calcsize(f'<qi{tamanho_dado2}s')
+    ordem = (tamanho_pagina - FORMATO_NO.size + tamanho_registro) // (2 * tamanho_registro + 2 * FORMATO_FILHO.size)
+    if ordem < 2:
+        raise ValueError("Página pequena demais para a largura do dado2 informada")
+    return ordem
+
+# Classe que define uma página (nó) da árvore B.
+class PaginaB:
+    def __init__(self, numero, folha=True):
+        self.numero = numero     # Posição da página no arquivo
+        self.folha = folha       # Indica se a página é uma folha
+        self.chaves = []         # Chaves ordenadas da página
+        self.dados = []          # Pares (dado1, dado2) de cada chave
+        self.filhos = []         # Números das páginas filhas
+
+# Cache de páginas com política LRU e escrita adiada (write-back) das páginas alteradas.
+class CachePaginas:
+    def __init__(self, arquivo, tamanho_pagina, tamanho_dado2, capacidade):
+        self.arquivo = arquivo
+        self.tamanho_pagina = tamanho_pagina
+        self.capacidade = max(1, capacidade)
+        self.formato_registro = struct.Struct(f'<qi{tamanho_dado2}s')
+        self.paginas = OrderedDict()
+        self.alteradas = set()
+        self.leituras_disco = 0
+        self.escritas_disco = 0
+
+    # Retorna a página pedida, lendo do disco apenas quando ela não está na cache.
+    def ler(self, numero):
+        pagina = self.paginas.get(numero)
+        if pagina is not None:
+            self.paginas.move_to_end(numero)
+            return pagina
+        self.arquivo.seek(numero * self.tamanho_pagina)
+        pagina = self._decodificar(numero, self.arquivo.read(self.tamanho_pagina))
+        self.leituras_disco += 1
+        self._guardar(pagina)
+        return pagina
+
+    # Registra uma página nova ou alterada para ser gravada depois.
+    def escrever(self, pagina):
+        if pagina.numero in self.paginas:
+            self.paginas.move_to_end(pagina.numero)
+        else:
+            self._guardar(pagina)
+        self.alteradas.add(pagina.numero)
+
+    # Grava no disco todas as páginas alteradas.
+    def descarregar(self):
+        for numero in sorted(self.alteradas):
+            self._gravar(self.paginas[numero])
+        self.alteradas.clear()
+
+    def _guardar(self, pagina):
+        self.paginas[pagina.numero] = pagina
+        while len(self.paginas) > self.capacidade:
+            numero, removida = self.paginas.popitem(last=False)
+            if numero in self.alteradas:
+                self._gravar(removida)
+                self.alteradas.discard(numero)
+
+    def _gravar(self, pagina):
+        partes = [FORMATO_NO.pack(1 if pagina.folha else 0, len(pagina.chaves))]
+        for chave, (dado1, dado2) in zip(pagina.chaves, pagina.dados):
+            partes.append(self.formato_registro.pack(chave, dado1, dado2))
+        for filho in pagina.filhos:
+            partes.append(FORMATO_FILHO.pack(filho))
+        conteudo = b''.join(partes)
+        self.arquivo.seek(pagina.numero * self.tamanho_pagina)
+        self.arquivo.write(conteudo.ljust(self.tamanho_pagina, b'\0'))
+        self.escritas_disco += 1
+
+    def _decodificar(self, numero, conteudo):
+        folha, quantidade = FORMATO_NO.unpack_from(conteudo, 0)
+        pagina = PaginaB(numero, folha == 1)
+        posicao = FORMATO_NO.size
+        for chave, dado1, dado2 in self.formato_registro.iter_unpack(conteudo[posicao:posicao + quantidade * self.formato_registro.size]):
+            pagina.chaves.append(chave)
+            pagina.dados.append((dado1, dado2))
+        if not pagina.folha:
+            posicao += quantidade * self.formato_registro.size
+            pagina.filhos = [filho for (filho,) in FORMATO_FILHO.iter_unpack(conteudo[posicao:posicao + (quantidade + 1) * FORMATO_FILHO.size])]
+        return pagina
+
+# Classe que define a árvore B armazenada em páginas de tamanho fixo em um arquivo binário.
+class ArvoreB:
+    def __init__(self, nome_arquivo, capacidade_cache=CAPACIDADE_CACHE, tamanho_pagina=TAMANHO_PAGINA, tamanho_dado2=TAMANHO_DADO2):
+        self.nome_arquivo = nome_arquivo
+        existe = os.path.exists(nome_arquivo) and os.path.getsize(nome_arquivo) > 0
+        self.arquivo = open(nome_arquivo, 'r+b' if existe else 'w+b')
+        if existe:
+            self._ler_cabecalho()
+        else:
+            self.tamanho_pagina = tamanho_pagina
+            self.tamanho_dado2 = tamanho_dado2
+            self.ordem = calcular_ordem(tamanho_pagina, tamanho_dado2)
+            self.raiz = 0            # 0 indica árvore vazia (a página 0 é o cabeçalho)
+            self.num_paginas = 1
+            self.num_registros = 0
+            self._gravar_cabecalho()
+        self.cache = CachePaginas(self.arquivo, self.tamanho_pagina, self.tamanho_dado2, capacidade_cache)
+
+    # Insere um registro na árvore B, dividindo as páginas cheias no caminho da descida.
+    def inserir(self, chave, dado1, dado2):
+        dado = (dado1, self._codificar(dado2))
+        if self.raiz == 0:
+            raiz = self._nova_pagina(folha=True)
+            raiz.chaves.append(chave)
+            raiz.dados.append(dado)
+            self.cache.escrever(raiz)
+            self.raiz = raiz.numero
+            self.num_registros += 1
+            return
+
+        raiz = self.cache.ler(self.raiz)
+        if len(raiz.chaves) == 2 * self.ordem - 1:
+            nova_raiz = self._nova_pagina(folha=False)
+            nova_raiz.filhos.append(raiz.numero)
+            self._dividir_filho(nova_raiz, 0, raiz)
+            self.raiz = nova_raiz.numero
+            raiz = nova_raiz
+
+        atual = raiz
+        while not atual.folha:
+            i = bisect_right(atual.chaves, chave)
+            filho = self.cache.ler(atual.filhos[i])
+            if len(filho.chaves) == 2 * self.ordem - 1:
+                self._dividir_filho(atual, i, filho)
+                if chave >= atual.chaves[i]:
+                    filho = self.cache.ler(atual.filhos[i + 1])
+            atual = filho
+
+        i = bisect_right(atual.chaves, chave)
+        atual.chaves.insert(i, chave)
+        atual.dados.insert(i, dado)
+        self.cache.escrever(atual)
+        self.num_registros += 1
+
+    # Realiza uma busca na árvore por uma chave e retorna o registro encontrado, o tempo gasto e o número de páginas acessadas.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        interacoes = 0
+        numero = self.raiz
+        while numero != 0:
+            pagina = self.cache.ler(numero)
+            interacoes += 1
+            i = bisect_left(pagina.chaves, chave)
+            if i < len(pagina.chaves) and pagina.chaves[i] == chave:
+                dado1, dado2 = pagina.dados[i]
+                tempo_fim = time.perf_counter_ns()
+                return Registro(chave, dado1, self._decodificar(dado2)), (tempo_fim - tempo_inicio) / 1e9, interacoes
+            if pagina.folha:
+                break
+            numero = pagina.filhos[i]
+        tempo_fim = time.perf_counter_ns()
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    # Grava as páginas pendentes e o cabeçalho e fecha o arquivo.
+    def fechar(self):
+        if self.arquivo.closed:
+            return
+        self.cache.descarregar()
+        self._gravar_cabecalho()
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    # Divide o filho cheio de índice i, subindo a chave mediana para o pai.
+    def _dividir_filho(self, pai, i, filho):
+        t = self.ordem
+        irmao = self._nova_pagina(folha=filho.folha)
+        irmao.chaves = filho.chaves[t:]
+        irmao.dados = filho.dados[t:]
+        if not filho.folha:
+            irmao.filhos = filho.filhos[t:]
+            filho.filhos = filho.filhos[:t]
+        pai.chaves.insert(i, filho.chaves[t - 1])
+        pai.dados.insert(i, filho.dados[t - 1])
+        pai.filhos.insert(i + 1, irmao.numero)
+        filho.chaves = filho.chaves[:t - 1]
+        filho.dados = filho.dados[:t - 1]
+        self.cache.escrever(filho)
+        self.cache.escrever(irmao)
+        self.cache.escrever(pai)
+
+    def _nova_pagina(self, folha):
+        pagina = PaginaB(self.num_paginas, folha)
+        self.num_paginas += 1
+        return pagina
+
+    def _codificar(self, dado2):
+        if isinstance(dado2, str):
+            dado2 = dado2.encode('ascii')
+        return dado2[:self.tamanho_dado2]
+
+    def _decodificar(self, dado2):
+        return dado2.rstrip(b'\0').decode('ascii')
+
+    def _gravar_cabecalho(self):
+        self.arquivo.seek(0)
+        cabecalho = FORMATO_CABECALHO.pack(IDENTIFICADOR, self.tamanho_pagina, self.tamanho_dado2, self.ordem,
+                                           self.raiz, self.num_paginas, self.num_registros)
+        self.arquivo.write(cabecalho.ljust(self.tamanho_pagina, b'\0'))
+
+    def _ler_cabecalho(self):
+        self.arquivo.seek(0)
+        (identificador, self.tamanho_pagina, self.tamanho_dado2, self.ordem,
+         self.raiz, self.num_paginas, self.num_registros) = FORMATO_CABECALHO.unpack(self.arquivo.read(FORMATO_CABECALHO.size))
+        if identificador != IDENTIFICADOR:
+            raise ValueError(f"{self.nome_arquivo} não é um arquivo de árvore B")
+
+# Gera dados aleatórios com chaves, valores inteiros e combinações de letras.
+def gerar_dados(num_entradas, ordenadas=False):
+    dados = []
+    chaves = list(range(1, num_entradas + 1))
+    if not ordenadas:
+        random.shuffle(chaves)
+    for chave in chaves:
+        dado1 = random.randint(1, 100)
+        dado2 = ''.join(random.choices(string.ascii_letters, k=TAMANHO_DADO2))
+        dados.append((chave, dado1, dado2))
+    return dados
+
+# Função para criar um arquivo com os dados gerados.
+def criar_arquivo_dados(dados, nome_arquivo):
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
+
+# Função principal do programa.
+def main():
+    num_entradas = int(input("Número de chaves no arquivo: "))
+    quant_buscas = int(input("Quantidade de chaves aleatórias a buscar: "))
+    opcao_ordenadas = input("Chaves ordenadas? (S/N): ").strip().lower()
+    dados_ordenados = opcao_ordenadas == 's'
+
+    dados = gerar_dados(num_entradas, ordenadas=dados_ordenados)
+    criar_arquivo_dados(dados, 'dados.txt')
+
+    # A árvore é reconstruída a cada execução a partir dos dados gerados.
+    if os.path.exists('dados_arvoreb.bin'):
+        os.remove('dados_arvoreb.bin')
+    arvore = ArvoreB('dados_arvoreb.bin')
+    for entrada in dados:
+        arvore.inserir(*entrada)
+    arvore.cache.descarregar()
+
+    print(f"\nOrdem da árvore B: {arvore.ordem} (até {2 * arvore.ordem - 1} chaves por página de {arvore.tamanho_pagina} bytes)")
+
+    chaves_existem = random.sample(range(1, num_entradas + 1), quant_buscas)
+    chaves_nao_existem = random.sample(range(num_entradas + 1, num_entradas + 1 + quant_buscas * 2), quant_buscas)
+
+    totais = {}
+    for titulo, chaves in (("existem", chaves_existem), ("não existem", chaves_nao_existem)):
+        if titulo == "não existem":
+            input("\nPressione Enter para continuar e buscar números que não existem...")
+        print(f"\nBusca pelos números que {titulo}:")
+        tempo_total = 0
+        interacoes_total = 0
+        for chave in chaves:
+            resultado, tempo_busca, interacoes = arvore.buscar(chave)
+            tempo_total += tempo_busca
+            interacoes_total += interacoes
+            situacao = "encontrada" if resultado else "não encontrada"
+            print(f"Chave: {chave}, {situacao}, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Páginas acessadas: {interacoes}")
+        totais[titulo] = (tempo_total, interacoes_total)
+
+    print(f"\nTempo total das buscas pelos números que existem: {totais['existem'][0]:.6f} segundos")
+    print(f"Tempo total das buscas pelos números que não existem: {totais['não existem'][0]:.6f} segundos")
+    print(f"Número total de páginas acessadas em todas as buscas: {totais['existem'][1] + totais['não existem'][1]}")
+    print(f"Leituras de páginas no disco: {arvore.cache.leituras_disco}, escritas: {arvore.cache.escritas_disco}")
+    arvore.fechar()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import os
+import random
+import string
+import sys
+import time
+
+# Executado como script (python3 Hash/hashTable.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import Registro
+
+CAPACIDADE_INICIAL = 8
+CARGA_MAXIMA = 0.5             # Fração de posições ocupadas que dispara o redimensionamento
+MULTIPLICADOR = 0x9E3779B97F4A7C15  # Constante de Fibonacci para o hash multiplicativo de 64 bits
+MASCARA_64 = (1 << 64) - 1
+
+# Tabela hash com endereçamento aberto e sondagem linear.
+# As interações contam as posições sondadas (probes) em cada busca.
+class TabelaHash:
+    def __init__(self, capacidade=CAPACIDADE_INICIAL):
+        bits = max(3, (capacidade - 1).bit_length())
+        self._criar_posicoes(bits)
+        self.quantidade = 0   # Registros guardados, com as chaves repetidas
+        self.ocupadas = 0     # Posições ocupadas (chaves distintas)
+
+    def __len__(self):
+        return self.quantidade
+
+    # Insere um registro. Cada chave ocupa uma única posição: os registros repetidos ficam na lista de extras dessa posição,
+    # então uma chave muito repetida não forma um agrupamento de sondagem. A busca devolve o primeiro registro inserido.
+    def inserir(self, chave, dado1, dado2):
+        if (self.ocupadas + 1) > CARGA_MAXIMA * len(self.chaves):
+            self._redimensionar()
+        chaves = self.chaves
+        mascara = len(chaves) - 1
+        posicao = self._posicao(chave)
+        while chaves[posicao] is not None:
+            if chaves[posicao] == chave:
+                if self.extras[posicao] is None:
+                    self.extras[posicao] = [(dado1, dado2)]
+                else:
+                    self.extras[posicao].append((dado1, dado2))
+                self.quantidade += 1
+                return
+            posicao = (posicao + 1) & mascara
+        chaves[posicao] = chave
+        self.registros[posicao] = Registro(chave, dado1, dado2)
+        self.ocupadas += 1
+        self.quantidade += 1
+
+    # Realiza uma busca na tabela por uma chave e retorna o registro encontrado, o tempo gasto e o número de sondagens.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves = self.chaves
+        mascara = len(chaves) - 1
+        posicao = self._posicao(chave)
+        interacoes = 0
+        while True:
+            interacoes += 1
+            atual = chaves[posicao]
+            if atual is None:
+                tempo_fim = time.perf_counter_ns()
+                return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+            if atual == chave:
+                tempo_fim = time.perf_counter_ns()
+                return self.registros[posicao], (tempo_fim - tempo_inicio) / 1e9, interacoes
+            posicao = (posicao + 1) & mascara
+
+    # Retorna todos os registros com a chave, na ordem de inserção, o tempo gasto e o número de sondagens.
+    def buscar_todos(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves = self.chaves
+        mascara = len(chaves) - 1
+        posicao = self._posicao(chave)
+        interacoes = 0
+        registros = []
+        while True:
+            interacoes += 1
+            atual = chaves[posicao]
+            if atual is None:
+                break
+            if atual == chave:
+                registros.append(self.registros[posicao])
+                if self.extras[posicao]:
+                    registros.extend(Registro(chave, dado1, dado2) for dado1, dado2 in self.extras[posicao])
+                break
+            posicao = (posicao + 1) & mascara
+        tempo_fim = time.perf_counter_ns()
+        return registros, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    def _posicao(self, chave):
+        return ((hash(chave) * MULTIPLICADOR) & MASCARA_64) >> self.deslocamento
+
+    def _criar_posicoes(self, bits):
+        self.deslocamento = 64 - bits
+        self.chaves = [None] * (1 << bits)
+        self.registros = [None] * (1 << bits)   # Primeiro registro de cada chave
+        self.extras = [None] * (1 << bits)      # Pares (dado1, dado2) dos demais registros da chave
+
+    # Dobra a capacidade e reposiciona cada chave com o seu registro e a sua lista de extras, sem mudar a ordem deles.
+    def _redimensionar(self):
+        ocupadas = [(registro, extras) for registro, extras in zip(self.registros, self.extras) if registro is not None]
+        self._criar_posicoes((len(self.chaves) * 2 - 1).bit_length())
+        chaves = self.chaves
+        mascara = len(chaves) - 1
+        for registro, extras in ocupadas:
+            posicao = self._posicao(registro.chave)
+            while chaves[posicao] is not None:
+                posicao = (posicao + 1) & mascara
+            chaves[posicao] = registro.chave
+            self.registros[posicao] = registro
+            self.extras[posicao] = extras
+
+# Gera dados aleatórios com chaves, valores inteiros e combinações de letras.
+def gerar_dados(num_entradas, ordenadas=False):
+    dados = []
+    chaves = list(range(1, num_entradas + 1))
+    if not ordenadas:
+        random.shuffle(chaves)
+    for chave in chaves:
+        dado1 = random.randint(1, 100)
+        dado2 = ''.join(random.choices(string.ascii_letters, k=100))
+        dados.append((chave, dado1, dado2))
+    return dados
+
+# Função para criar um arquivo com os dados gerados.
+def criar_arquivo_dados(dados, nome_arquivo):
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
+
+# Função principal do programa.
+def main():
+    num_entradas = int(input("Número de chaves no arquivo: "))
+    quant_buscas = int(input("Quantidade de chaves aleatórias a buscar: "))
+    opcao_ordenadas = input("Chaves ordenadas? (S/N): ").strip().lower()
+    dados_ordenados = opcao_ordenadas == 's'
+
+    dados = gerar_dados(num_entradas, ordenadas=dados_ordenados)
+    criar_arquivo_dados(dados, 'dados.txt')
+
+    tabela = TabelaHash()
+    for entrada in dados:
+        tabela.inserir(*entrada)
+
+    chaves_existem = random.sample(range(1, num_entradas + 1), quant_buscas)
+    chaves_nao_existem = random.sample(range(num_entradas + 1, num_entradas + 1 + quant_buscas * 2), quant_buscas)
+
+    totais = {}
+    for titulo, chaves in (("existem", chaves_existem), ("não existem", chaves_nao_existem)):
+        print(f"\nBusca pelos números que {titulo}:")
+        tempo_total = 0
+        interacoes_total = 0
+        for chave in chaves:
+            resultado, tempo_busca, interacoes = tabela.buscar(chave)
+            tempo_total += tempo_busca
+            interacoes_total += interacoes
+            situacao = "encontrada" if resultado else "não encontrada"
+            print(f"Chave: {chave}, {situacao}, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Sondagens: {interacoes}")
+        totais[titulo] = (tempo_total, interacoes_total)
+
+    print(f"\nTempo total das buscas pelos números que existem: {totais['existem'][0]:.6f} segundos")
+    print(f"Tempo total das buscas pelos números que não existem: {totais['não existem'][0]:.6f} segundos")
+    print(f"Número total de sondagens em todas as buscas: {totais['existem'][1] + totais['não existem'][1]}")
+
+if __name__ == "__main__":
+    main()
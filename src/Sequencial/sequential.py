@@ -1,40 +1,235 @@
+import os
 import random
 import string
+import sys
 import time
+from array import array
+
+# Executado como script (python3 Sequencial/sequential.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import Registro
 
 class No:
+    __slots__ = ('chave', 'dado1', 'dado2', 'proximo')  # Sem __dict__ por nó
+
     def __init__(self, chave, dado1, dado2):
         self.chave = chave
         self.dado1 = dado1
         self.dado2 = dado2
         self.proximo = None
 
+# Modos de auto-organização da lista: a cada busca bem-sucedida o nó encontrado
+# vai para o início (mover para frente) ou troca de lugar com o anterior (transposição).
+MOVER_PARA_FRENTE = 'mover_para_frente'
+TRANSPOSICAO = 'transposicao'
+
+# Iterador preguiçoso sobre os nós da lista com chave em [inicio, fim], na ordem da lista.
+# Como a lista não é ordenada, todos os nós são visitados; as interações contam os nós visitados até o momento.
+class IteradorSequencial:
+    def __init__(self, raiz, inicio, fim):
+        self.interacoes = 0
+        self._gerador = self._percorrer(raiz, inicio, fim)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._gerador)
+
+    def _percorrer(self, atual, inicio, fim):
+        while atual:
+            self.interacoes += 1
+            if inicio <= atual.chave <= fim:
+                yield atual
+            atual = atual.proximo
+
 class ArvoreSequencial:
-    def __init__(self):
+    def __init__(self, auto_organizacao=None):
+        if auto_organizacao not in (None, MOVER_PARA_FRENTE, TRANSPOSICAO):
+            raise ValueError(f"Modo de auto-organização desconhecido: {auto_organizacao}")
         self.raiz = None
+        self.cauda = None  # Último nó da lista, para inserir em O(1)
+        self.auto_organizacao = auto_organizacao
 
     def inserir(self, chave, dado1, dado2):
         novo_no = No(chave, dado1, dado2)
         if not self.raiz:
             self.raiz = novo_no
         else:
-            atual = self.raiz
-            while atual.proximo:
-                atual = atual.proximo
-            atual.proximo = novo_no
+            self.cauda.proximo = novo_no
+        self.cauda = novo_no
+
+    # Substitui o conteúdo da lista pelos registros na ordem recebida, encadeando cada nó uma única vez (O(n)).
+    def carregar(self, registros):
+        self.raiz = None
+        anterior = None
+        for chave, dado1, dado2 in registros:
+            novo_no = No(chave, dado1, dado2)
+            if anterior is None:
+                self.raiz = novo_no
+            else:
+                anterior.proximo = novo_no
+            anterior = novo_no
+        self.cauda = anterior
+
+    # Percorre os nós na ordem da lista.
+    def __iter__(self):
+        atual = self.raiz
+        while atual:
+            yield atual
+            atual = atual.proximo
+
+    # Remove da lista todos os nós com a chave, em uma única passada. Retorna True se a chave existia na lista.
+    def remover(self, chave):
+        removido = False
+        anterior = None
+        atual = self.raiz
+        while atual:
+            proximo = atual.proximo
+            if atual.chave == chave:
+                if anterior is None:
+                    self.raiz = proximo
+                else:
+                    anterior.proximo = proximo
+                atual.proximo = None
+                removido = True
+            else:
+                anterior = atual
+            atual = proximo
+        self.cauda = anterior
+        return removido
 
     def buscar(self, chave):
+        if self.auto_organizacao is not None:
+            return self._buscar_organizando(chave)
         atual = self.raiz
-        tempo_inicial = time.time()
+        tempo_inicial = time.perf_counter_ns()
         interacoes = 0  # Inicializa o contador de interações
         while atual:
             interacoes += 1  # Incrementa o contador de interações a cada passo
             if atual.chave == chave:
-                tempo_final = time.time()
-                return atual, tempo_final - tempo_inicial, interacoes  # Retorna o resultado e o contador de interações
+                tempo_final = time.perf_counter_ns()
+                return atual, (tempo_final - tempo_inicial) / 1e9, interacoes  # Retorna o resultado e o contador de interações
             atual = atual.proximo
-        tempo_final = time.time()
-        return None, tempo_final - tempo_inicial, interacoes  # Retorna None e o contador de interações
+        tempo_final = time.perf_counter_ns()
+        return None, (tempo_final - tempo_inicial) / 1e9, interacoes  # Retorna None e o contador de interações
+
+    # Mesma busca, guardando os dois nós anteriores para reposicionar o nó encontrado.
+    # As interações contam a posição do nó antes da mudança.
+    def _buscar_organizando(self, chave):
+        atual = self.raiz
+        anterior = antes_do_anterior = None
+        tempo_inicial = time.perf_counter_ns()
+        interacoes = 0
+        while atual:
+            interacoes += 1
+            if atual.chave == chave:
+                if anterior is not None:
+                    if self.auto_organizacao == MOVER_PARA_FRENTE:
+                        self._mover_para_frente(atual, anterior)
+                    else:
+                        self._transpor(atual, anterior, antes_do_anterior)
+                tempo_final = time.perf_counter_ns()
+                return atual, (tempo_final - tempo_inicial) / 1e9, interacoes
+            antes_do_anterior, anterior, atual = anterior, atual, atual.proximo
+        tempo_final = time.perf_counter_ns()
+        return None, (tempo_final - tempo_inicial) / 1e9, interacoes
+
+    def _mover_para_frente(self, no, anterior):
+        anterior.proximo = no.proximo
+        if no is self.cauda:
+            self.cauda = anterior
+        no.proximo = self.raiz
+        self.raiz = no
+
+    def _transpor(self, no, anterior, antes_do_anterior):
+        anterior.proximo = no.proximo
+        no.proximo = anterior
+        if antes_do_anterior is None:
+            self.raiz = no
+        else:
+            antes_do_anterior.proximo = no
+        if no is self.cauda:
+            self.cauda = anterior
+
+    # Retorna todos os registros com a chave informada, percorrendo a lista inteira, o tempo gasto e o número de interações.
+    def buscar_todos(self, chave):
+        atual = self.raiz
+        tempo_inicial = time.perf_counter_ns()
+        interacoes = 0
+        registros = []
+        while atual:
+            interacoes += 1
+            if atual.chave == chave:
+                registros.append(Registro(atual.chave, atual.dado1, atual.dado2))
+            atual = atual.proximo
+        tempo_final = time.perf_counter_ns()
+        return registros, (tempo_final - tempo_inicial) / 1e9, interacoes
+
+    # Retorna um iterador preguiçoso sobre os nós com chave entre inicio e fim (inclusive), na ordem da lista.
+    def buscar_intervalo(self, inicio, fim):
+        return IteradorSequencial(self.raiz, inicio, fim)
+
+    # Busca várias chaves percorrendo a lista uma única vez, parando assim que todas forem encontradas.
+    # A busca em lote não reorganiza a lista.
+    # Retorna, na ordem das chaves recebidas, pares (nó ou None, interações que a busca individual teria feito),
+    # o tempo total e o número de nós efetivamente visitados.
+    def buscar_lote(self, chaves):
+        tempo_inicial = time.perf_counter_ns()
+        pendentes = {}  # Chave -> posições dela na lista de chaves recebidas
+        for indice, chave in enumerate(chaves):
+            pendentes.setdefault(chave, []).append(indice)
+        resultados = [None] * len(chaves)
+        atual = self.raiz
+        interacoes = 0
+        while atual and pendentes:
+            interacoes += 1
+            indices = pendentes.pop(atual.chave, None)
+            if indices:
+                for indice in indices:
+                    resultados[indice] = (atual, interacoes)
+            atual = atual.proximo
+        # As chaves que sobraram fizeram a lista ser percorrida até o fim
+        for indices in pendentes.values():
+            for indice in indices:
+                resultados[indice] = (None, interacoes)
+        tempo_final = time.perf_counter_ns()
+        return resultados, (tempo_final - tempo_inicial) / 1e9, interacoes
+
+# Versão compacta da lista: chaves e dado1 ficam em arrays de inteiros e todos os dado2 em um único buffer de bytes.
+# O encadeamento é a própria ordem dos arrays (o próximo do registro i é o registro i + 1).
+class ArvoreSequencialCompacta:
+    def __init__(self):
+        self.chaves = array('q')
+        self.dados1 = array('q')
+        self.dados2 = bytearray()
+        self.inicios_dado2 = array('Q', [0])  # O dado2 do registro i ocupa dados2[inicios_dado2[i]:inicios_dado2[i + 1]]
+
+    def __len__(self):
+        return len(self.chaves)
+
+    def inserir(self, chave, dado1, dado2):
+        self.chaves.append(chave)
+        self.dados1.append(dado1)
+        self.dados2 += dado2.encode('ascii')
+        self.inicios_dado2.append(len(self.dados2))
+
+    def registro(self, indice):
+        dado2 = self.dados2[self.inicios_dado2[indice]:self.inicios_dado2[indice + 1]].decode('ascii')
+        return Registro(self.chaves[indice], self.dados1[indice], dado2)
+
+    def buscar(self, chave):
+        tempo_inicial = time.perf_counter_ns()
+        interacoes = 0
+        for indice, atual in enumerate(self.chaves):
+            interacoes += 1
+            if atual == chave:
+                tempo_final = time.perf_counter_ns()
+                return self.registro(indice), (tempo_final - tempo_inicial) / 1e9, interacoes
+        tempo_final = time.perf_counter_ns()
+        return None, (tempo_final - tempo_inicial) / 1e9, interacoes
 
 class BuscaNumerosQueExistemSequencial:
     def __init__(self, arvore, num_buscas, num_registros):
@@ -47,14 +242,21 @@ class BuscaNumerosQueExistemSequencial:
         total_interacoes = 0  # Inicializa o contador total de interações
         chaves_escolhidas = set()  # Conjunto para armazenar chaves já escolhidas
 
-        while len(resultados) < self.num_buscas:
-            chave = random.randint(1, self.num_registros)
-            if chave not in chaves_escolhidas:
-                resultado, tempo, interacoes = self.arvore.buscar(chave)
-                total_interacoes += interacoes  # Incrementa o contador total de interações
-                if resultado:
-                    resultados.append((chave, resultado, tempo, interacoes))
-                chaves_escolhidas.add(chave)  # Adiciona a chave ao conjunto de chaves escolhidas
+        # Cada rodada sorteia chaves inéditas para as buscas que faltam e as procura em uma única passada pela lista
+        while len(resultados) < self.num_buscas and len(chaves_escolhidas) < self.num_registros:
+            faltam = min(self.num_buscas - len(resultados), self.num_registros - len(chaves_escolhidas))
+            chaves = []
+            while len(chaves) < faltam:
+                chave = random.randint(1, self.num_registros)
+                if chave not in chaves_escolhidas:
+                    chaves_escolhidas.add(chave)
+                    chaves.append(chave)
+            lote, tempo, interacoes_lote = self.arvore.buscar_lote(chaves)
+            total_interacoes += interacoes_lote
+            tempo_medio = tempo / len(chaves)
+            for chave, (resultado, interacoes) in zip(chaves, lote):
+                if resultado and len(resultados) < self.num_buscas:
+                    resultados.append((chave, resultado, tempo_medio, interacoes))
 
         return resultados, total_interacoes  # Retorna os resultados e o contador total de interações
 
@@ -67,17 +269,15 @@ class BuscaNumerosQueNaoExistemSequencial:
 
     def buscar_numeros_que_nao_existem(self):
         numeros_unicos = set(entry[0] for entry in self.dados)
-        numeros_nao_encontrados = []
-
-        total_interacoes = 0  # Inicializa o contador total de interações
-
-        while len(numeros_nao_encontrados) < self.num_buscas:
+        chaves = []
+        while len(chaves) < self.num_buscas:
             num_aleatorio = random.randint(1, self.num_registros * 2)
             if num_aleatorio not in numeros_unicos:
-                resultado, tempo, interacoes = self.arvore.buscar(num_aleatorio)
-                total_interacoes += interacoes  # Incrementa o contador total de interações
-                if not resultado:
-                    numeros_nao_encontrados.append((num_aleatorio, tempo, interacoes))
+                chaves.append(num_aleatorio)
+
+        lote, tempo, total_interacoes = self.arvore.buscar_lote(chaves)
+        tempo_medio = tempo / len(chaves) if chaves else 0
+        numeros_nao_encontrados = [(chave, tempo_medio, interacoes) for chave, (resultado, interacoes) in zip(chaves, lote) if not resultado]
         return numeros_nao_encontrados, total_interacoes  # Retorna os resultados e o contador total de interações
 
 def gerar_dados_sequencial(num_registros, ordenados=False):
@@ -85,14 +285,13 @@ def gerar_dados_sequencial(num_registros, ordenados=False):
     for i in range(num_registros):
         chave = i + 1 if ordenados else random.randint(1, num_registros)
         dado1 = random.randint(1, 100)
-        dado2 = ''.join(random.choice(string.ascii_letters) for _ in range(100))  # Usando 100 letras em vez de 10000
+        dado2 = ''.join(random.choices(string.ascii_letters, k=100))  # Usando 100 letras em vez de 10000
         dados.append((chave, dado1, dado2))
     return dados
 
 def criar_arquivo_de_dados_sequencial(dados, nome_arquivo):
     with open(nome_arquivo, 'w') as arquivo:
-        for entrada in dados:
-            arquivo.write(f"{entrada[0]} {entrada[1]} {entrada[2]}\n")
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
 
 def main_sequencial():
     num_registros = int(input("Número de chaves no arquivo: "))
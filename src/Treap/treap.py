@@ -0,0 +1,168 @@
+import os
+import random
+import string
+import sys
+import time
+
+# Executado como script (python3 Treap/treap.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import MULTIPLOS, NoComRegistros, conferir_duplicatas, guardar_duplicata
+
+# Classe que define um nó da treap.
+class NoTreap(NoComRegistros):
+    __slots__ = ('chave', 'dado1', 'dado2', 'prioridade', 'esquerda', 'direita', 'extras')
+
+    def __init__(self, chave, dado1, dado2, prioridade):
+        self.chave = chave             # Chave do nó
+        self.dado1 = dado1             # Primeiro dado (valor inteiro)
+        self.dado2 = dado2             # Segundo dado (combinação de letras)
+        self.prioridade = prioridade   # Prioridade aleatória (heap: o pai tem prioridade maior que os filhos)
+        self.esquerda = None           # Filho à esquerda
+        self.direita = None            # Filho à direita
+        self.extras = None             # Pares (dado1, dado2) dos demais registros com a mesma chave
+
+# Treap: árvore binária de busca pelas chaves e heap pelas prioridades sorteadas na inserção.
+# A forma da árvore é a de uma árvore binária montada em ordem aleatória, então a altura esperada é O(log n)
+# mesmo com as chaves inseridas em ordem. A semente torna a forma reprodutível.
+class ArvoreTreap:
+    def __init__(self, duplicatas=MULTIPLOS, semente=None):
+        conferir_duplicatas(duplicatas)
+        self.raiz = None
+        self.duplicatas = duplicatas
+        self.aleatorio = random.Random(semente)
+        self.rotacoes = 0
+        self.tamanho = 0
+
+    def __len__(self):
+        return self.tamanho
+
+    # Insere o nó como folha, como na árvore binária, e sobe com rotações enquanto a prioridade dele for maior que a do pai.
+    def inserir(self, chave, dado1, dado2):
+        caminho = []
+        atual = self.raiz
+        while atual is not None:
+            if chave == atual.chave:
+                guardar_duplicata(atual, dado1, dado2, self.duplicatas)
+                return
+            caminho.append(atual)
+            atual = atual.esquerda if chave < atual.chave else atual.direita
+
+        novo = NoTreap(chave, dado1, dado2, self.aleatorio.random())
+        self.tamanho += 1
+        if not caminho:
+            self.raiz = novo
+            return
+        pai = caminho[-1]
+        if chave < pai.chave:
+            pai.esquerda = novo
+        else:
+            pai.direita = novo
+
+        while caminho and caminho[-1].prioridade < novo.prioridade:
+            pai = caminho.pop()
+            if pai.esquerda is novo:
+                pai.esquerda = novo.direita
+                novo.direita = pai
+            else:
+                pai.direita = novo.esquerda
+                novo.esquerda = pai
+            self.rotacoes += 1
+            if not caminho:
+                self.raiz = novo
+            elif caminho[-1].esquerda is pai:
+                caminho[-1].esquerda = novo
+            else:
+                caminho[-1].direita = novo
+
+    # Realiza uma busca na árvore por uma chave e retorna o nó encontrado, o tempo gasto na busca e o número de interações.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        atual = self.raiz
+        interacoes = 0
+        while atual is not None:
+            interacoes += 1
+            atual_chave = atual.chave
+            if atual_chave == chave:
+                tempo_fim = time.perf_counter_ns()
+                return atual, (tempo_fim - tempo_inicio) / 1e9, interacoes
+            atual = atual.esquerda if chave < atual_chave else atual.direita
+        tempo_fim = time.perf_counter_ns()
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    # Retorna todos os registros com a chave, o tempo gasto e o número de interações.
+    def buscar_todos(self, chave):
+        no, tempo, interacoes = self.buscar(chave)
+        return (no.registros() if no else []), tempo, interacoes
+
+    # Percorre a árvore em ordem crescente de chave, sem recursão.
+    def em_ordem(self):
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            atual = pilha.pop()
+            yield atual
+            atual = atual.direita
+
+    def __iter__(self):
+        return self.em_ordem()
+
+# Gera dados aleatórios com chaves, valores inteiros e combinações de letras.
+def gerar_dados(num_entradas, ordenadas=False):
+    dados = []
+    chaves = list(range(1, num_entradas + 1))
+    if not ordenadas:
+        random.shuffle(chaves)
+    for chave in chaves:
+        dado1 = random.randint(1, 100)
+        dado2 = ''.join(random.choices(string.ascii_letters, k=100))
+        dados.append((chave, dado1, dado2))
+    return dados
+
+# Função para criar um arquivo com os dados gerados.
+def criar_arquivo_dados(dados, nome_arquivo):
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
+
+# Função principal do programa.
+def main():
+    num_entradas = int(input("Número de chaves no arquivo: "))
+    quant_buscas = int(input("Quantidade de chaves aleatórias a buscar: "))
+    opcao_ordenadas = input("Chaves ordenadas? (S/N): ").strip().lower()
+    dados_ordenados = opcao_ordenadas == 's'
+
+    dados = gerar_dados(num_entradas, ordenadas=dados_ordenados)
+    criar_arquivo_dados(dados, 'dados.txt')
+
+    tempo_inicio = time.perf_counter()
+    arvore = ArvoreTreap()
+    for chave, dado1, dado2 in dados:
+        arvore.inserir(chave, dado1, dado2)
+    print(f"Tempo de inserção: {time.perf_counter() - tempo_inicio:.6f} segundos, Rotações: {arvore.rotacoes}")
+
+    chaves_existem = random.sample(range(1, num_entradas + 1), quant_buscas)
+    chaves_nao_existem = random.sample(range(num_entradas + 1, num_entradas + 1 + quant_buscas * 2), quant_buscas)
+
+    totais = {}
+    for titulo, chaves in (("existem", chaves_existem), ("não existem", chaves_nao_existem)):
+        print(f"\nBusca pelos números que {titulo}:")
+        tempo_total = 0
+        interacoes_total = 0
+        for chave in chaves:
+            resultado, tempo_busca, interacoes = arvore.buscar(chave)
+            tempo_total += tempo_busca
+            interacoes_total += interacoes
+            situacao = "encontrada" if resultado else "não encontrada"
+            print(f"Chave: {chave}, {situacao}, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Interacoes: {interacoes}")
+        totais[titulo] = (tempo_total, interacoes_total)
+
+    print(f"\nTempo total das buscas pelos números que existem: {totais['existem'][0]:.6f} segundos")
+    print(f"Tempo total das buscas pelos números que não existem: {totais['não existem'][0]:.6f} segundos")
+    print(f"Número total de interações em todas as buscas: {totais['existem'][1] + totais['não existem'][1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import os
+import random
+import string
+import sys
+import time
+from bisect import bisect_left, bisect_right
+
+# Executado como script (python3 VetorOrdenado/sortedArray.py), o diretório src não está no caminho de importação.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arvores import Registro
+
+# Vetor de registros mantido ordenado pela chave, com busca binária.
+# As interações contam as comparações feitas pela busca binária.
+class VetorOrdenado:
+    def __init__(self):
+        self.chaves = []      # Chaves ordenadas
+        self.registros = []   # Registros na mesma ordem das chaves
+
+    def __len__(self):
+        return len(self.chaves)
+
+    # Insere um registro na posição correta (chaves repetidas ficam depois das iguais já existentes).
+    def inserir(self, chave, dado1, dado2):
+        posicao = bisect_right(self.chaves, chave)
+        self.chaves.insert(posicao, chave)
+        self.registros.insert(posicao, Registro(chave, dado1, dado2))
+
+    # Substitui o conteúdo do vetor por registros já ordenados pela chave, em O(n).
+    def carregar_ordenados(self, registros):
+        self.registros = [Registro(*registro) for registro in registros]
+        self.chaves = [registro.chave for registro in self.registros]
+
+    # Realiza uma busca binária pela primeira ocorrência da chave e retorna o registro, o tempo gasto e o número de comparações.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        chaves = self.chaves
+        inicio, fim = 0, len(chaves)
+        interacoes = 0
+        while inicio < fim:
+            interacoes += 1
+            meio = (inicio + fim) // 2
+            if chaves[meio] < chave:
+                inicio = meio + 1
+            else:
+                fim = meio
+        if inicio < len(chaves) and chaves[inicio] == chave:
+            tempo_fim = time.perf_counter_ns()
+            return self.registros[inicio], (tempo_fim - tempo_inicio) / 1e9, interacoes
+        tempo_fim = time.perf_counter_ns()
+        return None, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    # Busca em massa: as chaves são ordenadas e cada uma é localizada com bisect (em C) apenas no trecho
+    # do vetor que sobra depois da chave anterior, sem interpretar a busca binária em Python.
+    # As comparações vêm da largura do trecho, (fim - inicio).bit_length(), que difere da contagem real em no máximo uma;
+    # com contar_comparacoes=True o caminho de cada busca é refeito para a contagem exata (bem mais lento).
+    # Retorna, na ordem das chaves recebidas, pares (registro ou None, comparações de buscar no vetor inteiro),
+    # o tempo total e o total de comparações dos bisect do lote.
+    def buscar_lote(self, chaves, contar_comparacoes=False):
+        tempo_inicio = time.perf_counter_ns()
+        vetor = self.chaves
+        registros = self.registros
+        tamanho = len(vetor)
+        resultados = [None] * len(chaves)
+        interacoes = 0
+        inicio = 0
+        comparacoes = tamanho.bit_length()
+        for indice in sorted(range(len(chaves)), key=chaves.__getitem__):
+            chave = chaves[indice]
+            posicao = bisect_left(vetor, chave, inicio)
+            if contar_comparacoes:
+                interacoes += comparacoes_busca_binaria(inicio, tamanho, posicao)
+                comparacoes = comparacoes_busca_binaria(0, tamanho, posicao)
+            else:
+                interacoes += (tamanho - inicio).bit_length()
+            inicio = posicao
+            if posicao < tamanho and vetor[posicao] == chave:
+                resultados[indice] = (registros[posicao], comparacoes)
+            else:
+                resultados[indice] = (None, comparacoes)
+        tempo_fim = time.perf_counter_ns()
+        return resultados, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+# Número de comparações feitas pela busca binária da primeira ocorrência (a de buscar e a de bisect_left) em
+# [inicio, fim) quando o resultado é "posicao". Cada comparação só depende de o meio estar antes da posição,
+# então o caminho é refeito só com os índices, sem acessar o vetor.
+def comparacoes_busca_binaria(inicio, fim, posicao):
+    comparacoes = 0
+    while inicio < fim:
+        comparacoes += 1
+        meio = (inicio + fim) // 2
+        if meio < posicao:
+            inicio = meio + 1
+        else:
+            fim = meio
+    return comparacoes
+
+# Gera dados aleatórios com chaves, valores inteiros e combinações de letras.
+def gerar_dados(num_entradas, ordenadas=False):
+    dados = []
+    chaves = list(range(1, num_entradas + 1))
+    if not ordenadas:
+        random.shuffle(chaves)
+    for chave in chaves:
+        dado1 = random.randint(1, 100)
+        dado2 = ''.join(random.choices(string.ascii_letters, k=100))
+        dados.append((chave, dado1, dado2))
+    return dados
+
+# Função para criar um arquivo com os dados gerados.
+def criar_arquivo_dados(dados, nome_arquivo):
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(''.join(f"{entrada[0]} {entrada[1]} {entrada[2]}\n" for entrada in dados))
+
+# Função principal do programa.
+def main():
+    num_entradas = int(input("Número de chaves no arquivo: "))
+    quant_buscas = int(input("Quantidade de chaves aleatórias a buscar: "))
+    opcao_ordenadas = input("Chaves ordenadas? (S/N): ").strip().lower()
+    dados_ordenados = opcao_ordenadas == 's'
+
+    dados = gerar_dados(num_entradas, ordenadas=dados_ordenados)
+    criar_arquivo_dados(dados, 'dados.txt')
+
+    vetor = VetorOrdenado()
+    vetor.carregar_ordenados(sorted(dados))
+
+    chaves_existem = random.sample(range(1, num_entradas + 1), quant_buscas)
+    chaves_nao_existem = random.sample(range(num_entradas + 1, num_entradas + 1 + quant_buscas * 2), quant_buscas)
+
+    totais = {}
+    for titulo, chaves in (("existem", chaves_existem), ("não existem", chaves_nao_existem)):
+        print(f"\nBusca pelos números que {titulo}:")
+        tempo_total = 0
+        interacoes_total = 0
+        for chave in chaves:
+            resultado, tempo_busca, interacoes = vetor.buscar(chave)
+            tempo_total += tempo_busca
+            interacoes_total += interacoes
+            situacao = "encontrada" if resultado else "não encontrada"
+            print(f"Chave: {chave}, {situacao}, Tempo médio de pesquisa: {tempo_busca:.6f} segundos, Comparações: {interacoes}")
+        totais[titulo] = (tempo_total, interacoes_total)
+
+    lote, tempo_lote, interacoes_lote = vetor.buscar_lote(chaves_existem + chaves_nao_existem)
+    print(f"\nTempo total das buscas pelos números que existem: {totais['existem'][0]:.6f} segundos")
+    print(f"Tempo total das buscas pelos números que não existem: {totais['não existem'][0]:.6f} segundos")
+    print(f"Número total de comparações em todas as buscas: {totais['existem'][1] + totais['não existem'][1]}")
+    print(f"Todas as buscas em um único lote: {tempo_lote:.6f} segundos, {interacoes_lote} comparações")
+
+if __name__ == "__main__":
+    main()
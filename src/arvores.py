@@ -0,0 +1,107 @@
+from collections import namedtuple
+
+# Definições comuns às árvores com nós em objetos (AVL, Binária, Splay e Treap) e às versões compactas.
+
+# Registro devolvido por buscar_todos, pelas buscas nas versões compactas (árvores e lista), pela Árvore B e pelo arquivo binário;
+# também é o registro guardado pela tabela hash e pelo vetor ordenado (mesmos campos dos nós).
+Registro = namedtuple('Registro', ['chave', 'dado1', 'dado2'])
+
+# Tratamento de chaves repetidas: guardar todos os registros no mesmo nó ou substituir o registro existente.
+MULTIPLOS = 'multiplos'
+SUBSTITUIR = 'substituir'
+
+def conferir_duplicatas(duplicatas):
+    if duplicatas not in (MULTIPLOS, SUBSTITUIR):
+        raise ValueError(f"Modo de duplicatas desconhecido: {duplicatas}")
+
+# Base dos nós que guardam os registros repetidos da chave em "extras" (pares (dado1, dado2)).
+# Os campos ficam nos __slots__ de cada nó; a base não acrescenta nenhum.
+class NoComRegistros:
+    __slots__ = ()
+
+    # Retorna todos os registros guardados no nó, começando pelo primeiro inserido.
+    def registros(self):
+        registros = [Registro(self.chave, self.dado1, self.dado2)]
+        if self.extras:
+            registros.extend(Registro(self.chave, dado1, dado2) for dado1, dado2 in self.extras)
+        return registros
+
+# Guarda um registro com chave repetida no nó existente, conforme o modo de duplicatas.
+def guardar_duplicata(no, dado1, dado2, duplicatas):
+    if duplicatas == SUBSTITUIR:
+        no.dado1 = dado1
+        no.dado2 = dado2
+    elif no.extras is None:
+        no.extras = [(dado1, dado2)]
+    else:
+        no.extras.append((dado1, dado2))
+
+# Junta registros ordenados de mesma chave em um único item (chave, dado1, dado2, extras), conforme o modo de duplicatas.
+def agrupar_duplicatas(registros, duplicatas):
+    grupos = []
+    for chave, dado1, dado2 in registros:
+        if grupos and grupos[-1][0] == chave:
+            if duplicatas == SUBSTITUIR:
+                grupos[-1] = (chave, dado1, dado2, None)
+            else:
+                extras = grupos[-1][3]
+                if extras is None:
+                    grupos[-1] = grupos[-1][:3] + ([(dado1, dado2)],)
+                else:
+                    extras.append((dado1, dado2))
+        else:
+            grupos.append((chave, dado1, dado2, None))
+    return grupos
+
+# Iterador preguiçoso em ordem (crescente ou decrescente) sobre os nós com chave em [inicio, fim].
+# Usa uma pilha explícita com no máximo a altura da árvore e descarta as subárvores fora do intervalo,
+# custando O(log n + k). As interações contam os nós visitados até o momento.
+class IteradorArvore:
+    def __init__(self, raiz, inicio=None, fim=None, reverso=False):
+        self.interacoes = 0
+        if reverso:
+            self._gerador = self._decrescente(raiz, inicio, fim)
+        else:
+            self._gerador = self._crescente(raiz, inicio, fim)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._gerador)
+
+    def _crescente(self, no, inicio, fim):
+        pilha = []
+        while True:
+            while no is not None:
+                self.interacoes += 1
+                if inicio is not None and no.chave < inicio:
+                    no = no.direita  # O nó e a subárvore esquerda ficam abaixo do intervalo
+                else:
+                    pilha.append(no)
+                    no = no.esquerda
+            if not pilha:
+                return
+            no = pilha.pop()
+            if fim is not None and no.chave > fim:
+                return
+            yield no
+            no = no.direita
+
+    def _decrescente(self, no, inicio, fim):
+        pilha = []
+        while True:
+            while no is not None:
+                self.interacoes += 1
+                if fim is not None and no.chave > fim:
+                    no = no.esquerda  # O nó e a subárvore direita ficam acima do intervalo
+                else:
+                    pilha.append(no)
+                    no = no.direita
+            if not pilha:
+                return
+            no = pilha.pop()
+            if inicio is not None and no.chave < inicio:
+                return
+            yield no
+            no = no.esquerda
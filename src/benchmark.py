@@ -0,0 +1,376 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import accumulate
+
+from AAVL.avlTree import ArvoreAVL, ArvoreAVLCompacta
+from ABinaria.binaryTree import ArvoreBinariaBusca, ArvoreBinariaBuscaCompacta
+from ArvoreB.bTree import ArvoreB
+from ASplay.splayTree import ArvoreSplay
+from Hash.hashTable import TabelaHash
+from Sequencial.sequential import MOVER_PARA_FRENTE, TRANSPOSICAO, ArvoreSequencial, ArvoreSequencialCompacta
+from Treap.treap import ArvoreTreap
+from VetorOrdenado.sortedArray import VetorOrdenado
+from gerador import ORDENS, gerar_dados
+from cache import POLITICAS, BuscaComCache
+from instrumentacao import Histograma, Instrumentador
+from lapides import LIMITE, RemocaoPreguicosa
+
+TAMANHO_DADO2 = 100
+PERCENTIS = (50, 90, 99)
+DISTRIBUICOES = ('uniforme', 'zipf')
+FRACAO_FALHAS_FLUXO = 0.1  # Parte do fluxo de buscas com chaves que não existem
+MODOS_REMOCAO = ('direta', 'lapides', 'reconstrucao')
+
+# Estrutura usada no benchmark: como criá-la, como liberá-la e quando ela é cara demais para o tamanho pedido.
+class Motor:
+    def __init__(self, nome, criar, quadratica=lambda ordem: False, fechar=None):
+        self.nome = nome
+        self.criar = criar
+        self.quadratica = quadratica                # Montagem O(n²) ou busca O(n) para essa ordem de chaves
+        self.fechar = fechar or (lambda estrutura: None)
+
+def _criar_arvore_b():
+    descritor, nome_arquivo = tempfile.mkstemp(suffix='.bin')
+    os.close(descritor)
+    os.remove(nome_arquivo)
+    return ArvoreB(nome_arquivo)
+
+def _fechar_arvore_b(arvore):
+    arvore.fechar()
+    os.remove(arvore.nome_arquivo)
+
+MOTORES = {motor.nome: motor for motor in (
+    Motor('sequencial', ArvoreSequencial, quadratica=lambda ordem: True),
+    Motor('sequencial_mtf', lambda: ArvoreSequencial(MOVER_PARA_FRENTE), quadratica=lambda ordem: True),
+    Motor('sequencial_transposicao', lambda: ArvoreSequencial(TRANSPOSICAO), quadratica=lambda ordem: True),
+    Motor('sequencial_compacta', ArvoreSequencialCompacta, quadratica=lambda ordem: True),
+    Motor('binaria', ArvoreBinariaBusca, quadratica=lambda ordem: ordem == 'ordenada'),
+    Motor('binaria_compacta', ArvoreBinariaBuscaCompacta, quadratica=lambda ordem: ordem == 'ordenada'),
+    Motor('avl', ArvoreAVL),
+    Motor('avl_compacta', ArvoreAVLCompacta),
+    Motor('splay', ArvoreSplay),
+    Motor('treap', lambda: ArvoreTreap(semente=0)),
+    Motor('arvore_b', _criar_arvore_b, fechar=_fechar_arvore_b),
+    Motor('hash', TabelaHash),
+    Motor('vetor_ordenado', VetorOrdenado),
+)}
+
+# Gera o mesmo conjunto de dados para todas as estruturas a partir da semente.
+# "duplicadas" repete chaves em três quartos dos registros; "zipf" concentra os registros em poucas chaves.
+def gerar_conjunto(tamanho, ordem, semente):
+    return gerar_dados(tamanho, ordem, f"{semente}-{tamanho}-{ordem}", TAMANHO_DADO2, taxa_duplicatas=0.75)
+
+# Sorteia as chaves das buscas que encontram e das que não encontram registros.
+def gerar_buscas(dados, quantidade, semente):
+    gerador = random.Random(f"{semente}-buscas-{len(dados)}")
+    existentes = sorted({entrada[0] for entrada in dados})
+    maior = existentes[-1] if existentes else 0
+    chaves_existem = [gerador.choice(existentes) for _ in range(quantidade)] if existentes else []
+    chaves_nao_existem = [gerador.choice((-gerador.randint(1, maior + 1), maior + gerador.randint(1, maior + 1)))
+                          for _ in range(quantidade)]
+    return chaves_existem, chaves_nao_existem
+
+# Sorteia um fluxo de buscas sobre as chaves existentes, uniforme ou com distribuição de Zipf (a popularidade das chaves
+# segue uma ordem aleatória, não a ordem das chaves). Uma fração do fluxo busca chaves que não existem.
+def gerar_fluxo(dados, quantidade, distribuicao, semente, expoente_zipf=1.1):
+    gerador = random.Random(f"{semente}-fluxo-{distribuicao}-{len(dados)}")
+    existentes = sorted({entrada[0] for entrada in dados})
+    if not existentes:
+        return []
+    gerador.shuffle(existentes)
+    if distribuicao == 'zipf':
+        pesos = list(accumulate(1 / posicao ** expoente_zipf for posicao in range(1, len(existentes) + 1)))
+        fluxo = gerador.choices(existentes, cum_weights=pesos, k=quantidade)
+    else:
+        fluxo = gerador.choices(existentes, k=quantidade)
+    maior = max(existentes)
+    ausentes = range(maior + 1, maior + 2 + len(existentes) // 100)
+    for i in range(quantidade):
+        if gerador.random() < FRACAO_FALHAS_FLUXO:
+            fluxo[i] = gerador.choice(ausentes)
+    return fluxo
+
+# Mede o mesmo fluxo de buscas sem cache e com cada política. Cada política começa com o cache vazio,
+# então o tempo médio inclui o aquecimento do cache.
+def medir_cache(estrutura, fluxos, politicas, capacidade, tamanho_lote):
+    resumo = {}
+    for distribuicao, fluxo in fluxos.items():
+        sem_cache = Instrumentador(estrutura, tamanho_lote=tamanho_lote)
+        sem_cache.medir_lote(fluxo)
+        resumo[f'fluxo_{distribuicao}_media_ns'] = round(sem_cache.tempo_ns.media())
+        for politica in politicas:
+            com_cache = BuscaComCache(estrutura, capacidade, politica)
+            instrumentado = Instrumentador(com_cache, tamanho_lote=tamanho_lote)
+            instrumentado.medir_lote(fluxo)
+            estatisticas = com_cache.estatisticas()
+            prefixo = f'cache_{politica}_{distribuicao}'
+            resumo[f'{prefixo}_media_ns'] = round(instrumentado.tempo_ns.media())
+            resumo[f'{prefixo}_taxa_acerto'] = estatisticas['taxa_acerto']
+            resumo[f'{prefixo}_despejos'] = estatisticas['despejos']
+            resumo[f'{prefixo}_interacoes_economizadas'] = estatisticas['interacoes_economizadas']
+    return resumo
+
+# Sorteia um fluxo misto de operações sobre os dados: um terço inserções de chaves novas, um terço remoções
+# de chaves presentes e um terço buscas (por chaves presentes ou já removidas). As operações são ('I', chave, dado1, dado2),
+# ('R', chave) ou ('B', chave).
+def gerar_rotatividade(dados, quantidade, semente):
+    gerador = random.Random(f"{semente}-rotatividade-{len(dados)}")
+    presentes = sorted({entrada[0] for entrada in dados})
+    if not presentes:
+        return []
+    gerador.shuffle(presentes)
+    removidas = []
+    proxima = max(presentes) + 1
+    textos = [entrada[2] for entrada in dados[:256]]
+    operacoes = []
+    for _ in range(quantidade):
+        sorteio = gerador.random()
+        if sorteio < 1 / 3 or not presentes:
+            operacoes.append(('I', proxima, gerador.randint(1, 100), gerador.choice(textos)))
+            presentes.append(proxima)
+            proxima += 1
+        elif sorteio < 2 / 3:
+            # Troca a chave sorteada com a última para remover da lista em O(1)
+            indice = gerador.randrange(len(presentes))
+            presentes[indice], presentes[-1] = presentes[-1], presentes[indice]
+            chave = presentes.pop()
+            removidas.append(chave)
+            operacoes.append(('R', chave))
+        elif removidas and gerador.random() < 0.25:
+            operacoes.append(('B', gerador.choice(removidas)))
+        else:
+            operacoes.append(('B', gerador.choice(presentes)))
+    return operacoes
+
+# Executa o fluxo misto medindo cada operação, com remoção direta, com lápides compactadas aos poucos ou com lápides
+# e reconstrução da estrutura, e resume a vazão e as pausas (p99 e maior tempo de uma operação).
+def medir_rotatividade(estrutura, operacoes, modo, limite_lapides=LIMITE):
+    if modo != 'direta':
+        estrutura = RemocaoPreguicosa(estrutura, limite=limite_lapides, reconstruir=modo == 'reconstrucao')
+    relogio = time.perf_counter_ns
+    tempos = Histograma()
+    inicio_total = relogio()
+    for operacao in operacoes:
+        comeco = relogio()
+        if operacao[0] == 'B':
+            estrutura.buscar(operacao[1])
+        elif operacao[0] == 'R':
+            estrutura.remover(operacao[1])
+        else:
+            estrutura.inserir(*operacao[1:])
+        tempos.registrar(relogio() - comeco)
+    tempo_total = relogio() - inicio_total
+    prefixo = f'rotatividade_{modo}'
+    resumo = {f'{prefixo}_ops_s': round(len(operacoes) / (tempo_total / 1e9)) if tempo_total else 0,
+              f'{prefixo}_p50_ns': tempos.percentil(50),
+              f'{prefixo}_p99_ns': tempos.percentil(99),
+              f'{prefixo}_max_ns': tempos.maximo or 0}
+    if modo != 'direta':
+        resumo[f'{prefixo}_compactacoes'] = estrutura.compactacoes
+    return resumo
+
+# Sorteia consultas por intervalo [inicio, inicio + largura - 1] dentro da faixa de chaves existentes.
+def gerar_intervalos(dados, quantidade, largura, semente):
+    gerador = random.Random(f"{semente}-intervalos-{len(dados)}")
+    maior = max((entrada[0] for entrada in dados), default=0)
+    inicios = [gerador.randint(1, max(1, maior - largura + 1)) for _ in range(quantidade)]
+    return [(inicio, inicio + largura - 1) for inicio in inicios]
+
+# Mede as consultas por intervalo consumindo cada iterador até o fim.
+def medir_intervalos(estrutura, intervalos):
+    relogio = time.perf_counter_ns
+    tempo_total = 0
+    interacoes = 0
+    itens = 0
+    for inicio, fim in intervalos:
+        comeco = relogio()
+        iterador = estrutura.buscar_intervalo(inicio, fim)
+        for _ in iterador:
+            itens += 1
+        tempo_total += relogio() - comeco
+        interacoes += iterador.interacoes
+    quantidade = len(intervalos) or 1
+    return {'intervalo_media_ns': round(tempo_total / quantidade),
+            'intervalo_interacoes_media': round(interacoes / quantidade, 3),
+            'intervalo_itens_media': round(itens / quantidade, 3)}
+
+# Mede a busca em massa (buscar_lote) sobre as mesmas chaves das buscas individuais, que encontram e que não encontram.
+# O tempo por chave é o do lote inteiro dividido pelo número de chaves; as interações são as totais do lote.
+def medir_buscar_lote(estrutura, chaves):
+    inicio = time.perf_counter_ns()
+    resultados, _, interacoes = estrutura.buscar_lote(chaves)
+    decorrido = time.perf_counter_ns() - inicio
+    quantidade = len(chaves) or 1
+    return {'buscar_lote_media_ns': round(decorrido / quantidade),
+            'buscar_lote_interacoes_media': round(interacoes / quantidade, 3),
+            'buscar_lote_encontradas': sum(1 for encontrado, _ in resultados if encontrado)}
+
+# Mede as buscas em duas passadas: uma em lotes, com o tempo amortizado, e outra com medição individual
+# de uma a cada "amostragem" chamadas para os percentis de latência.
+def medir_buscas(estrutura, chaves, prefixo, tamanho_lote, amostragem):
+    em_lote = Instrumentador(estrutura, tamanho_lote=tamanho_lote)
+    encontradas = em_lote.medir_lote(chaves)
+    resumo = {f'{prefixo}_encontradas': encontradas,
+              f'{prefixo}_lote_media_ns': round(em_lote.tempo_ns.media())}
+    if amostragem:
+        por_chamada = Instrumentador(estrutura, amostragem=amostragem)
+        for chave in chaves:
+            por_chamada.buscar(chave)
+        tempos = por_chamada.tempo_ns
+    else:
+        tempos = em_lote.tempo_ns
+    for p in PERCENTIS:
+        resumo[f'{prefixo}_p{p}_ns'] = tempos.percentil(p)
+    resumo[f'{prefixo}_interacoes_media'] = round(em_lote.interacoes.media(), 3)
+    resumo[f'{prefixo}_interacoes_max'] = em_lote.interacoes.maximo or 0
+    if prefixo == 'acerto':
+        resumo['profundidade_media'] = round(em_lote.profundidade.media(), 3)
+        resumo['profundidade_max'] = em_lote.profundidade.maximo or 0
+    return resumo
+
+# Mede uma estrutura sobre um conjunto de dados: tempo de montagem e buscas que encontram e que não encontram.
+def medir_motor(motor, dados, chaves_existem, chaves_nao_existem, tamanho_lote=64, amostragem=1, intervalos=(),
+                fluxos=None, politicas=(), capacidade_cache=256, operacoes=(), limite_lapides=LIMITE):
+    estrutura = motor.criar()
+    try:
+        inicio = time.perf_counter()
+        for entrada in dados:
+            estrutura.inserir(*entrada)
+        linha = {'montagem_s': round(time.perf_counter() - inicio, 6)}
+        if hasattr(estrutura, 'rotacoes'):
+            linha['rotacoes'] = estrutura.rotacoes
+        linha.update(medir_buscas(estrutura, chaves_existem, 'acerto', tamanho_lote, amostragem))
+        linha.update(medir_buscas(estrutura, chaves_nao_existem, 'falha', tamanho_lote, amostragem))
+        if hasattr(estrutura, 'buscar_lote'):
+            linha.update(medir_buscar_lote(estrutura, chaves_existem + chaves_nao_existem))
+        if intervalos and hasattr(estrutura, 'buscar_intervalo'):
+            linha.update(medir_intervalos(estrutura, intervalos))
+        if fluxos:
+            linha.update(medir_cache(estrutura, fluxos, politicas, capacidade_cache, tamanho_lote))
+        if operacoes and hasattr(estrutura, 'remover'):
+            # Cada modo recebe uma estrutura nova, montada com os mesmos dados
+            for modo in MODOS_REMOCAO:
+                outra = motor.criar()
+                try:
+                    for entrada in dados:
+                        outra.inserir(*entrada)
+                    linha.update(medir_rotatividade(outra, operacoes, modo, limite_lapides))
+                finally:
+                    motor.fechar(outra)
+        return linha
+    finally:
+        motor.fechar(estrutura)
+
+def executar(tamanhos, ordens, nomes_motores, buscas, semente, limite_quadratico, tamanho_lote=64, amostragem=1,
+             num_intervalos=0, largura_intervalo=100, politicas=(), capacidade_cache=256, distribuicoes=DISTRIBUICOES,
+             rotatividade=0, limite_lapides=LIMITE, registrar=print):
+    linhas = []
+    for tamanho in tamanhos:
+        for ordem in ordens:
+            dados = gerar_conjunto(tamanho, ordem, semente)
+            chaves_existem, chaves_nao_existem = gerar_buscas(dados, buscas, semente)
+            intervalos = gerar_intervalos(dados, num_intervalos, largura_intervalo, semente)
+            fluxos = {distribuicao: gerar_fluxo(dados, buscas, distribuicao, semente) for distribuicao in distribuicoes} if politicas else None
+            operacoes = gerar_rotatividade(dados, rotatividade, semente)
+            for nome in nomes_motores:
+                motor = MOTORES[nome]
+                linha = {'estrutura': nome, 'tamanho': tamanho, 'ordem': ordem, 'semente': semente}
+                if motor.quadratica(ordem) and tamanho > limite_quadratico:
+                    linha['situacao'] = f'ignorada: O(n²)/O(n) por busca acima de {limite_quadratico} registros'
+                else:
+                    linha['situacao'] = 'ok'
+                    linha.update(medir_motor(motor, dados, chaves_existem, chaves_nao_existem, tamanho_lote, amostragem, intervalos,
+                                             fluxos, politicas, capacidade_cache, operacoes, limite_lapides))
+                registrar(formatar_linha(linha))
+                linhas.append(linha)
+    return linhas
+
+def formatar_linha(linha):
+    cabecalho = f"{linha['estrutura']:<24} n={linha['tamanho']:<9} {linha['ordem']:<12}"
+    if linha['situacao'] != 'ok':
+        return f"{cabecalho} {linha['situacao']}"
+    texto = (f"{cabecalho} montagem={linha['montagem_s']:.4f}s "
+             f"acerto p50/p99={linha['acerto_p50_ns']}/{linha['acerto_p99_ns']}ns inter={linha['acerto_interacoes_media']} "
+             f"falha p50/p99={linha['falha_p50_ns']}/{linha['falha_p99_ns']}ns inter={linha['falha_interacoes_media']}")
+    if 'buscar_lote_media_ns' in linha:
+        texto += f" buscar_lote={linha['buscar_lote_media_ns']}ns inter={linha['buscar_lote_interacoes_media']}"
+    if 'intervalo_media_ns' in linha:
+        texto += f" intervalo={linha['intervalo_media_ns']}ns inter={linha['intervalo_interacoes_media']}"
+    for coluna in linha:
+        if coluna.startswith('cache_') and coluna.endswith('_taxa_acerto'):
+            prefixo = coluna[:-len('_taxa_acerto')]
+            texto += f" {prefixo[len('cache_'):]}={linha[coluna]:.0%}/{linha[prefixo + '_media_ns']}ns"
+    for modo in MODOS_REMOCAO:
+        prefixo = f'rotatividade_{modo}'
+        if prefixo + '_ops_s' in linha:
+            texto += f" {modo}={linha[prefixo + '_ops_s']}ops/s p99/max={linha[prefixo + '_p99_ns']}/{linha[prefixo + '_max_ns']}ns"
+    return texto
+
+# Grava os resultados em CSV ou JSON, conforme a extensão do arquivo.
+def salvar(linhas, nome_arquivo):
+    if nome_arquivo.endswith('.json'):
+        with open(nome_arquivo, 'w') as arquivo:
+            json.dump(linhas, arquivo, indent=2, ensure_ascii=False)
+        return
+    colunas = []
+    for linha in linhas:
+        for coluna in linha:
+            if coluna not in colunas:
+                colunas.append(coluna)
+    with open(nome_arquivo, 'w', newline='') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=colunas)
+        escritor.writeheader()
+        escritor.writerows(linhas)
+
+def lista_de_inteiros(texto):
+    return [int(valor) for valor in texto.split(',') if valor]
+
+def lista_de_nomes(opcoes):
+    def converter(texto):
+        nomes = [valor for valor in texto.split(',') if valor]
+        invalidos = [nome for nome in nomes if nome not in opcoes]
+        if invalidos:
+            raise argparse.ArgumentTypeError(f"opções inválidas: {', '.join(invalidos)} (válidas: {', '.join(opcoes)})")
+        return nomes
+    return converter
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark não interativo de todas as estruturas sobre o mesmo conjunto de dados.")
+    parser.add_argument('--tamanhos', type=lista_de_inteiros, default=[1000, 10000], help="lista separada por vírgulas")
+    parser.add_argument('--ordens', type=lista_de_nomes(ORDENS), default=list(ORDENS), help=f"subconjunto de {','.join(ORDENS)}")
+    parser.add_argument('--estruturas', type=lista_de_nomes(list(MOTORES)), default=list(MOTORES), help=f"subconjunto de {','.join(MOTORES)}")
+    parser.add_argument('--buscas', type=int, default=1000, help="buscas que encontram e que não encontram por execução")
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--limite-quadratico', type=int, default=20000,
+                        help="maior tamanho executado para estruturas O(n²) na ordem de chaves pedida")
+    parser.add_argument('--tamanho-lote', type=int, default=64, help="buscas por medição do tempo amortizado")
+    parser.add_argument('--amostragem', type=int, default=1,
+                        help="mede individualmente uma a cada N buscas para os percentis (0 usa só o tempo amortizado)")
+    parser.add_argument('--intervalos', type=int, default=100, help="consultas por intervalo nas estruturas que as suportam")
+    parser.add_argument('--largura-intervalo', type=int, default=100)
+    parser.add_argument('--cache', type=lista_de_nomes(list(POLITICAS)), default=[],
+                        help=f"políticas de cache a medir sobre fluxos de buscas, subconjunto de {','.join(POLITICAS)}")
+    parser.add_argument('--capacidade-cache', type=int, default=256)
+    parser.add_argument('--distribuicoes', type=lista_de_nomes(DISTRIBUICOES), default=list(DISTRIBUICOES),
+                        help=f"fluxos de buscas usados com --cache, subconjunto de {','.join(DISTRIBUICOES)}")
+    parser.add_argument('--rotatividade', type=int, default=0,
+                        help="operações de um fluxo misto de inserções, remoções e buscas, medido com remoção direta, com lápides e com reconstrução")
+    parser.add_argument('--limite-lapides', type=int, default=LIMITE, help="lápides acumuladas antes da compactação")
+    parser.add_argument('--saida', help="arquivo .csv ou .json para gravar os resultados")
+    args = parser.parse_args()
+
+    linhas = executar(args.tamanhos, args.ordens, args.estruturas, args.buscas, args.semente, args.limite_quadratico,
+                      args.tamanho_lote, args.amostragem, args.intervalos, args.largura_intervalo,
+                      args.cache, args.capacidade_cache, args.distribuicoes, args.rotatividade, args.limite_lapides)
+    if args.saida:
+        salvar(linhas, args.saida)
+        print(f"Resultados gravados em {args.saida}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
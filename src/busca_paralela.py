@@ -0,0 +1,156 @@
+import argparse
+import os
+import random
+import time
+from array import array
+from multiprocessing import Pool, shared_memory, util
+
+from AAVL.avlTree import ArvoreAVL
+
+TAMANHO_LOTE = 4096  # Chaves enviadas a um processo por vez
+
+# Achata uma árvore (com nós em objetos ou na versão compacta) em arrays paralelos de chaves e índices dos filhos (-1 = vazio).
+# O formato preserva a forma da árvore, então as interações são as mesmas da busca na árvore original.
+def achatar_arvore(arvore):
+    if isinstance(getattr(arvore, 'chaves', None), array):
+        return arvore.raiz, arvore.chaves, arvore.esquerda, arvore.direita
+    chaves, esquerda, direita = array('q'), array('q'), array('q')
+    pilha = [(arvore.raiz, -1, False)] if arvore.raiz is not None else []
+    while pilha:
+        no, pai, e_direita = pilha.pop()
+        indice = len(chaves)
+        chaves.append(no.chave)
+        esquerda.append(-1)
+        direita.append(-1)
+        if pai != -1:
+            if e_direita:
+                direita[pai] = indice
+            else:
+                esquerda[pai] = indice
+        if no.direita is not None:
+            pilha.append((no.direita, indice, True))
+        if no.esquerda is not None:
+            pilha.append((no.esquerda, indice, False))
+    return 0, chaves, esquerda, direita
+
+# Índice somente leitura publicado em memória compartilhada: [n, raiz, chaves..., esquerda..., direita...] em int64.
+class IndiceCompartilhado:
+    def __init__(self, arvore):
+        raiz, chaves, esquerda, direita = achatar_arvore(arvore)
+        n = len(chaves)
+        self.memoria = shared_memory.SharedMemory(create=True, size=max(1, (2 + 3 * n) * 8))
+        dados = self.memoria.buf.cast('q')
+        dados[0] = n
+        dados[1] = raiz if n else -1
+        dados[2:2 + n] = chaves
+        dados[2 + n:2 + 2 * n] = esquerda
+        dados[2 + 2 * n:2 + 3 * n] = direita
+        dados.release()
+        self.nome = self.memoria.name
+
+    def fechar(self):
+        self.memoria.close()
+        self.memoria.unlink()
+
+# Estado de cada processo trabalhador: visões sobre a memória compartilhada, sem copiar o índice.
+_memoria = None
+_dados = None
+_indice = None
+
+# Inicializador do Pool. A finalização é registrada com multiprocessing.util.Finalize e não com atexit, porque
+# o processo trabalhador termina com os._exit e só executa os finalizadores do multiprocessing.
+def _anexar(nome):
+    global _memoria, _dados, _indice
+    _memoria = shared_memory.SharedMemory(name=nome)
+    _dados = _memoria.buf.cast('q')
+    n = _dados[0]
+    _indice = (_dados[1], _dados[2:2 + n], _dados[2 + n:2 + 2 * n], _dados[2 + 2 * n:2 + 3 * n])
+    util.Finalize(None, _desanexar, exitpriority=10)
+
+# Libera as visões (as fatias antes da visão de onde saíram) e fecha o mapeamento no processo trabalhador.
+def _desanexar():
+    global _memoria, _dados, _indice
+    if _memoria is None:
+        return
+    for visao in _indice[1:]:
+        visao.release()
+    _dados.release()
+    _memoria.close()
+    _memoria = _dados = _indice = None
+
+# Busca um pedaço de chaves no índice compartilhado com o mesmo laço de ArvoreAVL.buscar.
+# Retorna, para cada chave, as interações com sinal positivo quando a chave foi encontrada e negativo quando não.
+def buscar_pedaco(chaves):
+    raiz, vetor_chaves, esquerda, direita = _indice
+    resultados = array('q')
+    for chave in chaves:
+        atual = raiz
+        interacoes = 0
+        encontrada = False
+        while atual != -1:
+            interacoes += 1
+            atual_chave = vetor_chaves[atual]
+            if atual_chave == chave:
+                encontrada = True
+                break
+            atual = esquerda[atual] if chave < atual_chave else direita[atual]
+        resultados.append(interacoes if encontrada else -interacoes)
+    return resultados
+
+# Publica o índice uma vez e distribui lotes de chaves entre vários processos.
+class BuscaParalela:
+    def __init__(self, arvore, processos=None):
+        self.indice = IndiceCompartilhado(arvore)
+        self.processos = processos or os.cpu_count() or 1
+        self.pool = Pool(self.processos, initializer=_anexar, initargs=(self.indice.nome,))
+
+    # Retorna, na ordem das chaves, pares (encontrada, interações), o tempo total e o total de interações.
+    def buscar(self, chaves, tamanho_lote=TAMANHO_LOTE):
+        tempo_inicio = time.perf_counter_ns()
+        pedacos = [chaves[i:i + tamanho_lote] for i in range(0, len(chaves), tamanho_lote)]
+        resultados = []
+        interacoes_total = 0
+        for parcial in self.pool.imap(buscar_pedaco, pedacos):
+            for valor in parcial:
+                resultados.append((valor > 0, abs(valor)))
+                interacoes_total += abs(valor)
+        tempo_fim = time.perf_counter_ns()
+        return resultados, (tempo_fim - tempo_inicio) / 1e9, interacoes_total
+
+    def fechar(self):
+        self.pool.close()
+        self.pool.join()
+        self.indice.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca paralela de chaves em uma árvore AVL publicada em memória compartilhada.")
+    parser.add_argument('--registros', type=int, default=1000000)
+    parser.add_argument('--buscas', type=int, default=500000)
+    parser.add_argument('--processos', type=lambda texto: [int(valor) for valor in texto.split(',')],
+                        default=[1, os.cpu_count() or 1], help="quantidades de processos a comparar, separadas por vírgulas")
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    gerador = random.Random(args.semente)
+    arvore = ArvoreAVL()
+    arvore.carregar_ordenados([(chave, 0, '') for chave in range(1, args.registros + 1)])
+    # Metade das chaves existe e metade não, como nas buscas dos números que não existem
+    chaves = [gerador.randint(1, args.registros * 2) for _ in range(args.buscas)]
+
+    tempo_base = None
+    for processos in args.processos:
+        with BuscaParalela(arvore, processos) as busca:
+            resultados, tempo, interacoes = busca.buscar(chaves)
+        encontradas = sum(1 for encontrada, _ in resultados if encontrada)
+        tempo_base = tempo_base or tempo
+        print(f"{processos} processo(s): {tempo:.3f} segundos, {encontradas} encontradas, "
+              f"{interacoes} interações, aceleração {tempo_base / tempo:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import time
+from collections import OrderedDict
+
+# Políticas de substituição. Todas guardam no máximo "capacidade" chaves e têm a mesma interface:
+# obter(chave) -> (achou, valor), guardar(chave, valor) -> True se outra chave foi despejada, remover(chave).
+
+# LRU: despeja a chave usada há mais tempo.
+class PoliticaLRU:
+    def __init__(self, capacidade):
+        self.capacidade = capacidade
+        self.itens = OrderedDict()
+
+    def __len__(self):
+        return len(self.itens)
+
+    def obter(self, chave):
+        valor = self.itens.get(chave, self)
+        if valor is self:
+            return False, None
+        self.itens.move_to_end(chave)
+        return True, valor
+
+    def guardar(self, chave, valor):
+        self.itens[chave] = valor
+        self.itens.move_to_end(chave)
+        if len(self.itens) > self.capacidade:
+            self.itens.popitem(last=False)
+            return True
+        return False
+
+    def remover(self, chave):
+        self.itens.pop(chave, None)
+
+# CLOCK: aproximação da LRU com um bit de uso por posição e um ponteiro circular, sem reordenar nada a cada acerto.
+class PoliticaCLOCK:
+    def __init__(self, capacidade):
+        self.capacidade = capacidade
+        self.posicoes = {}      # Chave -> posição no relógio
+        self.chaves = []
+        self.valores = []
+        self.usados = bytearray()
+        self.ponteiro = 0
+
+    def __len__(self):
+        return len(self.posicoes)
+
+    def obter(self, chave):
+        posicao = self.posicoes.get(chave)
+        if posicao is None:
+            return False, None
+        self.usados[posicao] = 1
+        return True, self.valores[posicao]
+
+    def guardar(self, chave, valor):
+        posicao = self.posicoes.get(chave)
+        if posicao is not None:
+            self.valores[posicao] = valor
+            self.usados[posicao] = 1
+            return False
+        if len(self.chaves) < self.capacidade:
+            self.posicoes[chave] = len(self.chaves)
+            self.chaves.append(chave)
+            self.valores.append(valor)
+            self.usados.append(0)
+            return False
+        # Avança o ponteiro dando uma segunda chance às posições usadas até achar uma livre ou não usada
+        while True:
+            posicao = self.ponteiro
+            self.ponteiro = (self.ponteiro + 1) % self.capacidade
+            if self.chaves[posicao] is self:
+                despejou = False
+                break
+            if not self.usados[posicao]:
+                del self.posicoes[self.chaves[posicao]]
+                despejou = True
+                break
+            self.usados[posicao] = 0
+        self.posicoes[chave] = posicao
+        self.chaves[posicao] = chave
+        self.valores[posicao] = valor
+        self.usados[posicao] = 0
+        return despejou
+
+    # A posição fica marcada como livre (a própria política é a marca) e é reaproveitada pelo ponteiro.
+    def remover(self, chave):
+        posicao = self.posicoes.pop(chave, None)
+        if posicao is not None:
+            self.chaves[posicao] = self
+            self.valores[posicao] = None
+            self.usados[posicao] = 0
+
+# LFU: despeja a chave com menos acessos; no empate, a usada há mais tempo. obter, guardar e remover são O(1);
+# remover pode deixar menor_frequencia desatualizada, e ela só é recalculada (O(frequências distintas)) no despejo seguinte.
+class PoliticaLFU:
+    def __init__(self, capacidade):
+        self.capacidade = capacidade
+        self.itens = {}                 # Chave -> (valor, frequência)
+        self.frequencias = {}           # Frequência -> chaves com essa frequência, da mais antiga para a mais recente
+        self.menor_frequencia = 0       # Pode ficar desatualizada depois de remover; é conferida no despejo
+
+    def __len__(self):
+        return len(self.itens)
+
+    def _promover(self, chave, valor, frequencia):
+        grupo = self.frequencias[frequencia]
+        del grupo[chave]
+        if not grupo:
+            del self.frequencias[frequencia]
+            if self.menor_frequencia == frequencia:
+                self.menor_frequencia = frequencia + 1
+        self.frequencias.setdefault(frequencia + 1, OrderedDict())[chave] = None
+        self.itens[chave] = (valor, frequencia + 1)
+
+    def obter(self, chave):
+        item = self.itens.get(chave)
+        if item is None:
+            return False, None
+        self._promover(chave, item[0], item[1])
+        return True, item[0]
+
+    def guardar(self, chave, valor):
+        item = self.itens.get(chave)
+        if item is not None:
+            self._promover(chave, valor, item[1])
+            return False
+        despejou = False
+        if len(self.itens) >= self.capacidade:
+            if self.menor_frequencia not in self.frequencias:
+                self.menor_frequencia = min(self.frequencias)
+            grupo = self.frequencias[self.menor_frequencia]
+            antiga, _ = grupo.popitem(last=False)
+            if not grupo:
+                del self.frequencias[self.menor_frequencia]
+            del self.itens[antiga]
+            despejou = True
+        self.itens[chave] = (valor, 1)
+        self.frequencias.setdefault(1, OrderedDict())[chave] = None
+        self.menor_frequencia = 1
+        return despejou
+
+    def remover(self, chave):
+        item = self.itens.pop(chave, None)
+        if item is None:
+            return
+        grupo = self.frequencias[item[1]]
+        del grupo[chave]
+        if not grupo:
+            del self.frequencias[item[1]]
+
+POLITICAS = {
+    'lru': PoliticaLRU,
+    'clock': PoliticaCLOCK,
+    'lfu': PoliticaLFU,
+}
+
+# Cache limitado na frente do buscar de qualquer estrutura com buscar(chave) -> (nó, tempo, interações).
+# Guarda tanto os acertos quanto as falhas (resultado None), e a chave é invalidada quando a estrutura muda (inserir/remover).
+# Uma busca respondida pelo cache conta 0 interações; as interações que a estrutura gastou para aquela chave entram como economizadas.
+class BuscaComCache:
+    def __init__(self, estrutura, capacidade=1024, politica='lru'):
+        self.estrutura = estrutura
+        self.politica = politica
+        self.cache = POLITICAS[politica](max(1, capacidade))
+        self.acertos = 0
+        self.acertos_negativos = 0     # Acertos do cache para chaves que não existem na estrutura
+        self.falhas = 0
+        self.despejos = 0
+        self.interacoes_economizadas = 0
+
+    def inserir(self, chave, dado1, dado2):
+        self.estrutura.inserir(chave, dado1, dado2)
+        self.cache.remover(chave)
+
+    def remover(self, chave):
+        resultado = self.estrutura.remover(chave)
+        self.cache.remover(chave)
+        return resultado
+
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        achou, valor = self.cache.obter(chave)
+        if achou:
+            no, interacoes = valor
+            self.acertos += 1
+            self.interacoes_economizadas += interacoes
+            if no is None:
+                self.acertos_negativos += 1
+            tempo_fim = time.perf_counter_ns()
+            return no, (tempo_fim - tempo_inicio) / 1e9, 0
+        no, _, interacoes = self.estrutura.buscar(chave)
+        self.falhas += 1
+        if self.cache.guardar(chave, (no, interacoes)):
+            self.despejos += 1
+        tempo_fim = time.perf_counter_ns()
+        return no, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+    def taxa_acerto(self):
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0
+
+    def estatisticas(self):
+        return {
+            'politica': self.politica,
+            'capacidade': self.cache.capacidade,
+            'acertos': self.acertos,
+            'acertos_negativos': self.acertos_negativos,
+            'falhas': self.falhas,
+            'taxa_acerto': round(self.taxa_acerto(), 4),
+            'despejos': self.despejos,
+            'interacoes_economizadas': self.interacoes_economizadas,
+        }
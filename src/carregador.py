@@ -0,0 +1,82 @@
+import argparse
+import os
+import random
+import time
+from operator import itemgetter
+
+from AAVL.avlTree import ArvoreAVL
+from ABinaria.binaryTree import ArvoreBinariaBusca
+from Sequencial.sequential import ArvoreSequencial
+from registros import ArquivoRegistros, gravar_registros, ler_registros
+
+# Estruturas que o carregador sabe montar e se elas precisam dos registros ordenados pela chave.
+ESTRUTURAS = {
+    'avl': (ArvoreAVL, True),
+    'binaria': (ArvoreBinariaBusca, True),
+    'sequencial': (ArvoreSequencial, False),
+}
+
+# Nome do instantâneo associado a um arquivo de dados.
+def nome_instantaneo(nome_arquivo, ordenado):
+    return f"{nome_arquivo}.{'ord' if ordenado else 'seq'}.bin"
+
+# Retorna os registros do arquivo de dados prontos para a montagem, usando o instantâneo quando ele estiver atualizado.
+def obter_registros(nome_arquivo, ordenado, usar_instantaneo=True):
+    instantaneo = nome_instantaneo(nome_arquivo, ordenado)
+    if usar_instantaneo and os.path.exists(instantaneo) and os.path.getmtime(instantaneo) >= os.path.getmtime(nome_arquivo):
+        with ArquivoRegistros(instantaneo) as mapeado:
+            return list(mapeado), True
+
+    registros = list(ler_registros(nome_arquivo))
+    if ordenado:
+        registros.sort(key=itemgetter(0))  # Ordenação estável: chaves repetidas mantêm a ordem do arquivo
+    if usar_instantaneo:
+        gravar_registros(registros, instantaneo, ordenado)
+    return registros, False
+
+# Monta a estrutura pedida de uma vez a partir do arquivo de dados.
+def carregar_estrutura(nome_estrutura, nome_arquivo, usar_instantaneo=True):
+    classe, ordenado = ESTRUTURAS[nome_estrutura]
+    registros, do_instantaneo = obter_registros(nome_arquivo, ordenado, usar_instantaneo)
+    estrutura = classe()
+    if ordenado:
+        estrutura.carregar_ordenados(registros)
+    else:
+        estrutura.carregar(registros)
+    return estrutura, registros, do_instantaneo
+
+def main():
+    parser = argparse.ArgumentParser(description="Carrega um arquivo de dados existente e realiza buscas sem gerar os dados novamente.")
+    parser.add_argument('arquivo', help="arquivo de dados no formato 'chave dado1 dado2' (ex.: AAVL/dados.txt)")
+    parser.add_argument('--estrutura', choices=sorted(ESTRUTURAS), default='avl')
+    parser.add_argument('--buscas', type=int, default=1000, help="quantidade de chaves aleatórias a buscar")
+    parser.add_argument('--sem-instantaneo', action='store_true', help="não lê nem grava o instantâneo binário")
+    args = parser.parse_args()
+
+    tempo_inicio = time.perf_counter()
+    estrutura, registros, do_instantaneo = carregar_estrutura(args.estrutura, args.arquivo, not args.sem_instantaneo)
+    tempo_carga = time.perf_counter() - tempo_inicio
+    origem = "instantâneo binário" if do_instantaneo else "arquivo de texto"
+    print(f"{len(registros)} registros carregados do {origem} em {tempo_carga:.6f} segundos")
+    if not registros:
+        return
+
+    chaves = [registro[0] for registro in registros]
+    maior_chave = max(chaves)
+    chaves_existem = random.choices(chaves, k=args.buscas)
+    chaves_nao_existem = [maior_chave + random.randint(1, max(args.buscas, 1) * 2) for _ in range(args.buscas)]
+
+    for titulo, lista in (("existem", chaves_existem), ("não existem", chaves_nao_existem)):
+        tempo_total = 0
+        interacoes_total = 0
+        encontradas = 0
+        for chave in lista:
+            resultado, tempo, interacoes = estrutura.buscar(chave)
+            tempo_total += tempo
+            interacoes_total += interacoes
+            encontradas += 1 if resultado else 0
+        print(f"Busca pelos números que {titulo}: {encontradas}/{len(lista)} encontradas, "
+              f"Tempo total: {tempo_total:.6f} segundos, Interacoes: {interacoes_total}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import argparse
+import random
+import string
+import time
+from array import array
+from itertools import accumulate, count, repeat
+
+from registros import FORMATO_CABECALHO, IDENTIFICADOR, formato_registro
+
+TAMANHO_DADO2 = 100
+REGISTROS_POR_BLOCO = 1 << 16  # Registros gerados e gravados de cada vez
+ORDENS = ('ordenada', 'embaralhada', 'duplicadas', 'zipf')
+
+LETRAS = string.ascii_letters.encode('ascii')
+# Bytes aleatórios de 0 a 207 viram letras (208 = 4 x 52, sem viés); os de 208 a 255 são descartados.
+LIMITE_LETRAS = 4 * len(LETRAS)
+TABELA_LETRAS = bytes(LETRAS[valor % len(LETRAS)] for valor in range(256))
+DESCARTADOS = bytes(range(LIMITE_LETRAS, 256))
+
+# Gera "tamanho" letras aleatórias de uma vez a partir de bytes aleatórios, sem sortear caractere por caractere.
+def gerar_letras(gerador, tamanho):
+    partes = []
+    faltam = tamanho
+    while faltam > 0:
+        bloco = gerador.randbytes(faltam * 256 // LIMITE_LETRAS + 64).translate(TABELA_LETRAS, DESCARTADOS)
+        partes.append(bloco[:faltam])
+        faltam -= len(partes[-1])
+    return b''.join(partes)
+
+# Gera as chaves conforme a ordem pedida:
+#   ordenada    -> 1..n
+#   embaralhada -> permutação de 1..n
+#   duplicadas  -> n * (1 - taxa_duplicatas) chaves distintas, as demais repetem chaves já sorteadas
+#   zipf        -> chaves de 1..n sorteadas com probabilidade proporcional a 1 / k**expoente_zipf
+# gerar_blocos sorteia as chaves zipf bloco a bloco, sem montar todas de uma vez.
+def gerar_chaves(num_registros, ordem, gerador, taxa_duplicatas=0.5, expoente_zipf=1.1):
+    if ordem == 'ordenada':
+        return array('q', range(1, num_registros + 1))
+    if ordem == 'embaralhada':
+        chaves = array('q', range(1, num_registros + 1))
+        gerador.shuffle(chaves)
+        return chaves
+    if ordem == 'duplicadas':
+        distintas = max(1, round(num_registros * (1 - taxa_duplicatas)))
+        chaves = array('q', range(1, distintas + 1))
+        chaves.extend(gerador.choices(chaves, k=num_registros - distintas))
+        gerador.shuffle(chaves)
+        return chaves
+    if ordem == 'zipf':
+        return sortear_zipf(gerador, pesos_zipf(num_registros, expoente_zipf), num_registros)
+    raise ValueError(f"Ordem de chaves desconhecida: {ordem}")
+
+# Pesos acumulados da distribuição Zipf sobre as chaves 1..n (1 / k**expoente), calculados uma única vez por arquivo.
+def pesos_zipf(num_registros, expoente_zipf):
+    return list(accumulate(map(pow, range(1, num_registros + 1), repeat(-expoente_zipf))))
+
+# Sorteia "quantidade" chaves zipf com uma única chamada a choices.
+def sortear_zipf(gerador, pesos, quantidade):
+    return array('q', gerador.choices(range(1, len(pesos) + 1), cum_weights=pesos, k=quantidade))
+
+# Gera os registros em blocos: (chaves, dados1, dados2), com todos os dado2 do bloco em um único buffer de largura fixa.
+def gerar_blocos(num_registros, ordem='embaralhada', semente=None, tamanho_dado2=TAMANHO_DADO2,
+                 taxa_duplicatas=0.5, expoente_zipf=1.1, registros_por_bloco=REGISTROS_POR_BLOCO):
+    gerador = random.Random(semente)
+    if ordem == 'zipf':
+        pesos = pesos_zipf(num_registros, expoente_zipf)
+    else:
+        chaves = gerar_chaves(num_registros, ordem, gerador, taxa_duplicatas, expoente_zipf)
+    valores_dado1 = range(1, 101)
+    for inicio in range(0, num_registros, registros_por_bloco):
+        if ordem == 'zipf':
+            bloco = sortear_zipf(gerador, pesos, min(registros_por_bloco, num_registros - inicio))
+        else:
+            bloco = chaves[inicio:inicio + registros_por_bloco]
+        dados1 = gerador.choices(valores_dado1, k=len(bloco))
+        dados2 = gerar_letras(gerador, len(bloco) * tamanho_dado2)
+        yield bloco, dados1, dados2
+
+# Gera os registros em memória como tuplas (chave, dado1, dado2), o mesmo formato de gerar_dados dos módulos.
+def gerar_dados(num_registros, ordem='embaralhada', semente=None, tamanho_dado2=TAMANHO_DADO2, taxa_duplicatas=0.5, expoente_zipf=1.1):
+    dados = []
+    for chaves, dados1, dados2 in gerar_blocos(num_registros, ordem, semente, tamanho_dado2, taxa_duplicatas, expoente_zipf):
+        texto = dados2.decode('ascii')
+        dados.extend((chave, dado1, texto[i * tamanho_dado2:(i + 1) * tamanho_dado2])
+                     for i, (chave, dado1) in enumerate(zip(chaves, dados1)))
+    return dados
+
+# Grava os blocos no formato de texto dos arquivos dados.txt ("chave dado1 dado2" por linha), um bloco por escrita.
+def gravar_texto(blocos, nome_arquivo, tamanho_dado2=TAMANHO_DADO2):
+    quantidade = 0
+    with open(nome_arquivo, 'wb') as arquivo:
+        for chaves, dados1, dados2 in blocos:
+            arquivo.write(b''.join(b'%d %d %s\n' % (chave, dado1, dados2[i * tamanho_dado2:(i + 1) * tamanho_dado2])
+                                   for i, (chave, dado1) in enumerate(zip(chaves, dados1))))
+            quantidade += len(chaves)
+    return quantidade
+
+# Grava os blocos no formato binário de largura fixa de registros.py (cabeçalho + registros '<qi{largura}s').
+# Cada bloco é empacotado com pack_into em um único bytearray, reaproveitado enquanto os blocos têm o mesmo tamanho.
+def gravar_binario(blocos, nome_arquivo, num_registros, ordenado=False, tamanho_dado2=TAMANHO_DADO2):
+    formato = formato_registro(tamanho_dado2)
+    buffer = bytearray()
+    quantidade = 0
+    with open(nome_arquivo, 'wb') as arquivo:
+        arquivo.write(FORMATO_CABECALHO.pack(IDENTIFICADOR, tamanho_dado2, 1 if ordenado else 0, num_registros))
+        for chaves, dados1, dados2 in blocos:
+            tamanho = formato.size * len(chaves)
+            if len(buffer) != tamanho:
+                buffer = bytearray(tamanho)
+            for deslocamento, chave, dado1, inicio in zip(range(0, tamanho, formato.size), chaves, dados1, count(0, tamanho_dado2)):
+                formato.pack_into(buffer, deslocamento, chave, dado1, dados2[inicio:inicio + tamanho_dado2])
+            arquivo.write(buffer)
+            quantidade += len(chaves)
+    if quantidade != num_registros:
+        raise ValueError(f"Foram gerados {quantidade} registros, mas o cabeçalho indica {num_registros}")
+    return quantidade
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera arquivos de dados grandes rapidamente, com semente reprodutível.")
+    parser.add_argument('arquivo', help="arquivo de saída (.txt para texto, .bin para o formato binário de largura fixa)")
+    parser.add_argument('--registros', type=int, default=1000000)
+    parser.add_argument('--ordem', choices=ORDENS, default='embaralhada')
+    parser.add_argument('--taxa-duplicatas', type=float, default=0.5, help="fração de registros com chave repetida (ordem duplicadas)")
+    parser.add_argument('--expoente-zipf', type=float, default=1.1)
+    parser.add_argument('--tamanho-dado2', type=int, default=TAMANHO_DADO2)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    blocos = gerar_blocos(args.registros, args.ordem, args.semente, args.tamanho_dado2, args.taxa_duplicatas, args.expoente_zipf)
+    if args.arquivo.endswith('.bin'):
+        gravar_binario(blocos, args.arquivo, args.registros, args.ordem == 'ordenada', args.tamanho_dado2)
+    else:
+        gravar_texto(blocos, args.arquivo, args.tamanho_dado2)
+    print(f"{args.registros} registros gravados em {args.arquivo} em {time.perf_counter() - inicio:.3f} segundos")
+
+if __name__ == "__main__":
+    main()
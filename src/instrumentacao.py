@@ -0,0 +1,118 @@
+import time
+
+BITS_PRECISAO = 8  # Valores menores que 2**8 são contados exatamente; acima disso o erro relativo fica abaixo de 1/256
+
+# Histograma com baldes logarítmicos (no estilo HDR): guarda contagens por faixa de valores
+# em vez de cada amostra, então a memória não cresce com o número de medições.
+class Histograma:
+    def __init__(self, bits_precisao=BITS_PRECISAO):
+        self.bits_precisao = bits_precisao
+        self.contagens = {}   # Limite inferior do balde -> quantidade de amostras
+        self.quantidade = 0
+        self.soma = 0
+        self.minimo = None
+        self.maximo = None
+
+    # Registra um valor inteiro não negativo, opcionalmente repetido várias vezes.
+    def registrar(self, valor, vezes=1):
+        deslocamento = valor.bit_length() - self.bits_precisao
+        balde = (valor >> deslocamento) << deslocamento if deslocamento > 0 else valor
+        self.contagens[balde] = self.contagens.get(balde, 0) + vezes
+        self.quantidade += vezes
+        self.soma += valor * vezes
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+
+    def media(self):
+        return self.soma / self.quantidade if self.quantidade else 0
+
+    # Retorna o limite inferior do balde que contém o percentil p (0 a 100).
+    def percentil(self, p):
+        if not self.quantidade:
+            return 0
+        alvo = max(1, round(p / 100 * self.quantidade))
+        acumulado = 0
+        for balde in sorted(self.contagens):
+            acumulado += self.contagens[balde]
+            if acumulado >= alvo:
+                return balde
+        return self.maximo
+
+    def resumo(self, percentis=(50, 90, 99)):
+        resultado = {'quantidade': self.quantidade, 'media': round(self.media(), 3),
+                     'minimo': self.minimo or 0, 'maximo': self.maximo or 0}
+        for p in percentis:
+            resultado[f'p{p}'] = self.percentil(p)
+        return resultado
+
+# Camada de instrumentação que envolve qualquer estrutura com buscar(chave) -> (nó, tempo, interações).
+# A estrutura em si não muda: sem o Instrumentador, o caminho da busca fica exatamente como era.
+class Instrumentador:
+    # amostragem = N mede individualmente uma a cada N chamadas de buscar (0 desliga a medição por chamada).
+    def __init__(self, estrutura, tamanho_lote=64, amostragem=0):
+        self.estrutura = estrutura
+        self.tamanho_lote = max(1, tamanho_lote)
+        self.amostragem = amostragem
+        self.chamadas = 0
+        self.tempo_ns = Histograma()        # Tempo por busca (medido ou amortizado no lote)
+        self.interacoes = Histograma()      # Interações de cada busca
+        self.profundidade = Histograma()    # Interações das buscas que encontraram a chave (profundidade do nó)
+        self.encontradas = 0
+        self.rotacoes_inicio = getattr(estrutura, 'rotacoes', 0)
+
+    def inserir(self, chave, dado1, dado2):
+        self.estrutura.inserir(chave, dado1, dado2)
+
+    # Mesmo contrato da estrutura. O tempo só é medido nas chamadas amostradas.
+    def buscar(self, chave):
+        self.chamadas += 1
+        if self.amostragem and self.chamadas % self.amostragem == 0:
+            inicio = time.perf_counter_ns()
+            resultado = self.estrutura.buscar(chave)
+            self.tempo_ns.registrar(time.perf_counter_ns() - inicio)
+        else:
+            resultado = self.estrutura.buscar(chave)
+        self._contar(resultado[0], resultado[2])
+        return resultado
+
+    # Executa as buscas em lotes de tamanho_lote e mede cada lote inteiro com um único par de leituras do relógio,
+    # atribuindo a cada busca o tempo médio do lote. Retorna o número de chaves encontradas.
+    def medir_lote(self, chaves):
+        buscar = self.estrutura.buscar
+        relogio = time.perf_counter_ns
+        encontradas = 0
+        for inicio_lote in range(0, len(chaves), self.tamanho_lote):
+            lote = chaves[inicio_lote:inicio_lote + self.tamanho_lote]
+            resultados = []
+            inicio = relogio()
+            for chave in lote:
+                resultados.append(buscar(chave))
+            decorrido = relogio() - inicio
+            self.tempo_ns.registrar(decorrido // len(lote), len(lote))
+            for no, _, interacoes in resultados:
+                self._contar(no, interacoes)
+                encontradas += 1 if no else 0
+        self.chamadas += len(chaves)
+        return encontradas
+
+    def _contar(self, no, interacoes):
+        self.interacoes.registrar(interacoes)
+        if no:
+            self.encontradas += 1
+            self.profundidade.registrar(interacoes)
+
+    # Rotações feitas pela estrutura (árvores AVL) desde a criação do Instrumentador.
+    def rotacoes(self):
+        return getattr(self.estrutura, 'rotacoes', 0) - self.rotacoes_inicio
+
+    def relatorio(self):
+        return {
+            'buscas': self.chamadas,
+            'encontradas': self.encontradas,
+            'tempo_ns': self.tempo_ns.resumo(),
+            'interacoes': self.interacoes.resumo(),
+            'profundidade': self.profundidade.resumo(),
+            'rotacoes': self.rotacoes(),
+        }
@@ -0,0 +1,118 @@
+LIMITE = 1024   # Lápides acumuladas que disparam a compactação
+PASSO = 4       # Remoções físicas feitas a cada operação enquanto a compactação não termina
+
+# Registros de todas as chaves que não estão marcadas como removidas, na ordem da estrutura
+# (a lista sequencial é percorrida pelos nós; as árvores, em ordem de chave).
+def registros_vivos(estrutura, lapides):
+    if hasattr(estrutura, 'cauda'):
+        atual = estrutura.raiz
+        while atual:
+            if atual.chave not in lapides:
+                yield atual.chave, atual.dado1, atual.dado2
+            atual = atual.proximo
+        return
+    for no in estrutura.em_ordem():
+        if no.chave not in lapides:
+            yield from no.registros()
+
+# Remoção preguiçosa: remover(chave) só marca a chave com uma lápide e as buscas passam a ignorá-la.
+# Quando as lápides chegam ao limite, a compactação começa e é feita aos poucos: cada operação seguinte remove
+# de fato "passo" chaves marcadas, então nenhuma operação sozinha paga por todas as remoções acumuladas.
+# Com reconstruir=True, a compactação é feita de uma vez, montando a estrutura de novo só com os registros vivos
+# (carregar_ordenados nas árvores, carregar na lista). Esse modo PAUSA: a chamada de remover que atinge o limite
+# reconstrói a estrutura inteira antes de retornar (O(n)). Em troca, a lista faz uma passada só em vez de uma remoção O(n)
+# por chave, e a Árvore Binária volta a ficar balanceada. O benchmark informa essa pausa no modo "reconstrucao".
+class RemocaoPreguicosa:
+    def __init__(self, estrutura, limite=LIMITE, passo=PASSO, reconstruir=False):
+        if not hasattr(estrutura, 'remover'):
+            raise TypeError(f"{type(estrutura).__name__} não tem remover(chave)")
+        if reconstruir and not (hasattr(estrutura, 'carregar_ordenados') or hasattr(estrutura, 'carregar')):
+            raise TypeError(f"{type(estrutura).__name__} não pode ser reconstruída a partir dos registros")
+        self.estrutura = estrutura
+        self.limite = max(1, limite)
+        self.passo = max(1, passo)
+        self.reconstruir = reconstruir
+        self.lapides = set()
+        self.compactando = False
+        self.remocoes_fisicas = 0
+        self.reconstrucoes = 0
+        self.compactacoes = 0
+
+    # Remove de fato algumas chaves marcadas, se a compactação estiver em andamento.
+    def _avancar_compactacao(self):
+        if not self.compactando:
+            return
+        for _ in range(min(self.passo, len(self.lapides))):
+            self.estrutura.remover(self.lapides.pop())
+            self.remocoes_fisicas += 1
+        if not self.lapides:
+            self.compactando = False
+
+    def _marcar(self, chave):
+        self.lapides.add(chave)
+        if not self.compactando and len(self.lapides) >= self.limite:
+            self.compactacoes += 1
+            if self.reconstruir:
+                self._reconstruir()
+            else:
+                self.compactando = True
+
+    def _reconstruir(self):
+        registros = list(registros_vivos(self.estrutura, self.lapides))
+        if hasattr(self.estrutura, 'carregar_ordenados'):
+            self.estrutura.carregar_ordenados(registros)
+        else:
+            self.estrutura.carregar(registros)
+        self.lapides.clear()
+        self.reconstrucoes += 1
+
+    # Uma chave marcada que volta a ser inserida tem os registros antigos removidos antes, para não reaparecerem.
+    def inserir(self, chave, dado1, dado2):
+        self._avancar_compactacao()
+        if chave in self.lapides:
+            self.lapides.discard(chave)
+            self.estrutura.remover(chave)
+            self.remocoes_fisicas += 1
+        self.estrutura.inserir(chave, dado1, dado2)
+
+    # Marca a chave como removida. Retorna False se ela já estava marcada; a existência da chave não é conferida.
+    def remover(self, chave):
+        self._avancar_compactacao()
+        if chave in self.lapides:
+            return False
+        self._marcar(chave)
+        return True
+
+    # Uma chave marcada é dada como não encontrada sem percorrer a estrutura (zero interações).
+    def buscar(self, chave):
+        self._avancar_compactacao()
+        if chave in self.lapides:
+            return None, 0.0, 0
+        return self.estrutura.buscar(chave)
+
+    def buscar_todos(self, chave):
+        self._avancar_compactacao()
+        if chave in self.lapides:
+            return [], 0.0, 0
+        return self.estrutura.buscar_todos(chave)
+
+    # Termina a compactação pendente de uma vez.
+    def compactar(self):
+        if self.reconstruir:
+            if self.lapides:
+                self.compactacoes += 1
+                self._reconstruir()
+            return
+        while self.lapides:
+            self.estrutura.remover(self.lapides.pop())
+            self.remocoes_fisicas += 1
+        self.compactando = False
+
+    def estatisticas(self):
+        return {
+            'lapides': len(self.lapides),
+            'compactando': self.compactando,
+            'compactacoes': self.compactacoes,
+            'remocoes_fisicas': self.remocoes_fisicas,
+            'reconstrucoes': self.reconstrucoes,
+        }
@@ -0,0 +1,84 @@
+import argparse
+import gc
+import random
+import string
+import tracemalloc
+from contextlib import contextmanager
+
+from AAVL import avlTree
+from ABinaria import binaryTree
+from Sequencial import sequential
+
+# Estruturas comparadas no relatório: (nome, módulo e nome da classe de nó, estrutura com objetos, estrutura compacta).
+ESTRUTURAS = [
+    ('sequencial', sequential, 'No', sequential.ArvoreSequencial, sequential.ArvoreSequencialCompacta),
+    ('binaria', binaryTree, 'NoArvoreBinaria', binaryTree.ArvoreBinariaBusca, binaryTree.ArvoreBinariaBuscaCompacta),
+    ('avl', avlTree, 'NoAVL', avlTree.ArvoreAVL, avlTree.ArvoreAVLCompacta),
+]
+
+# Cópia da classe de nó com os mesmos métodos, mas sem __slots__: os campos ficam no __dict__ de cada nó,
+# como nos nós originais das estruturas. É a referência ("antes") do relatório.
+def sem_slots(classe):
+    atributos = {nome: valor for nome, valor in vars(classe).items()
+                 if nome not in classe.__slots__ and nome != '__slots__'}
+    return type(classe.__name__, classe.__bases__, atributos)
+
+# Troca temporariamente a classe de nó usada pelo módulo da estrutura pela versão sem __slots__.
+@contextmanager
+def nos_com_dict(modulo, nome_classe):
+    original = getattr(modulo, nome_classe)
+    setattr(modulo, nome_classe, sem_slots(original))
+    try:
+        yield
+    finally:
+        setattr(modulo, nome_classe, original)
+
+# Mede quantos bytes por registro continuam alocados depois de montar a estrutura.
+# Os dados são gerados dentro da medição e descartados em seguida, para que o dado2 só seja contado se a estrutura o mantiver.
+def medir_bytes_por_registro(classe, num_registros, tamanho_dado2, semente):
+    if num_registros < 1:
+        raise ValueError(f"É preciso ao menos um registro para medir os bytes por registro: {num_registros}")
+    gc.collect()
+    tracemalloc.start()
+    try:
+        gerador = random.Random(semente)
+        chaves = list(range(1, num_registros + 1))
+        gerador.shuffle(chaves)
+        dados = [(chave, gerador.randint(1, 100), ''.join(gerador.choices(string.ascii_letters, k=tamanho_dado2)))
+                 for chave in chaves]
+        del chaves
+        estrutura = classe()
+        for entrada in dados:
+            estrutura.inserir(*entrada)
+        del dados, entrada
+        gc.collect()
+        atual, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del estrutura
+    return atual / num_registros
+
+def inteiro_positivo(texto):
+    valor = int(texto)
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"deve ser pelo menos 1: {valor}")
+    return valor
+
+def main():
+    parser = argparse.ArgumentParser(description="Relatório de bytes por registro das estruturas com objetos e compactas.")
+    parser.add_argument('--registros', type=inteiro_positivo, default=100000)
+    parser.add_argument('--tamanho-dado2', type=int, default=100)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    # Bytes por registro com nós em __dict__ (original), com nós em __slots__ e na versão compacta; a redução é da original para a compacta.
+    print(f"{'estrutura':<12}{'__dict__':>12}{'__slots__':>12}{'compacta':>12}{'redução':>10}")
+    for nome, modulo, nome_no, classe_objetos, classe_compacta in ESTRUTURAS:
+        with nos_com_dict(modulo, nome_no):
+            antes = medir_bytes_por_registro(classe_objetos, args.registros, args.tamanho_dado2, args.semente)
+        slots = medir_bytes_por_registro(classe_objetos, args.registros, args.tamanho_dado2, args.semente)
+        depois = medir_bytes_por_registro(classe_compacta, args.registros, args.tamanho_dado2, args.semente)
+        print(f"{nome:<12}{antes:>12.1f}{slots:>12.1f}{depois:>12.1f}{antes / depois:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+import argparse
+import sys
+import time
+from array import array
+from collections import Counter
+
+from benchmark import MOTORES, ORDENS, gerar_conjunto, lista_de_inteiros, lista_de_nomes, salvar
+from instrumentacao import Histograma
+
+AMOSTRA = 10000        # Nós usados para estimar a memória e arestas usadas para a localidade
+TAMANHO_PAGINA = 4096  # Pai e filho a menos que isso de distância na memória contam como "mesma página"
+
+# Gera os níveis de uma árvore com nós em objetos, da raiz para baixo (largura, sem recursão).
+def niveis_objetos(raiz):
+    nivel = [raiz] if raiz is not None else []
+    while nivel:
+        yield nivel
+        nivel = [filho for no in nivel for filho in (no.esquerda, no.direita) if filho is not None]
+
+# Mesmo percurso para as versões compactas, em que os nós são índices e -1 é o filho vazio.
+def niveis_compactos(raiz, esquerda, direita):
+    nivel = [raiz] if raiz != -1 else []
+    while nivel:
+        yield nivel
+        nivel = [filho for no in nivel for filho in (esquerda[no], direita[no]) if filho != -1]
+
+# Bytes ocupados por um nó em objeto, incluindo o dado2 e os registros extras de chaves repetidas.
+def tamanho_no(no):
+    tamanho = sys.getsizeof(no) + sys.getsizeof(no.dado2)
+    extras = getattr(no, 'extras', None)
+    if extras:
+        tamanho += sys.getsizeof(extras) + sum(sys.getsizeof(par) + sys.getsizeof(par[1]) for par in extras)
+    return tamanho
+
+# Bytes dos arrays e buffers de uma estrutura compacta (com a sobra reservada pelo crescimento).
+def tamanho_compacto(estrutura):
+    return sum(sys.getsizeof(valor) for valor in vars(estrutura).values() if isinstance(valor, (array, bytearray)))
+
+def resumo_localidade(distancias):
+    if not distancias:
+        return {'arestas': 0, 'distancia_media_bytes': 0, 'mesma_pagina': 0}
+    return {'arestas': len(distancias),
+            'distancia_media_bytes': round(sum(distancias) / len(distancias)),
+            'mesma_pagina': round(sum(1 for distancia in distancias if distancia < TAMANHO_PAGINA) / len(distancias), 4)}
+
+# Percorre uma árvore nível a nível e junta as estatísticas. Uma busca que encontra o nó da profundidade d faz d interações;
+# uma que não encontra termina em um filho vazio de um nó da profundidade d, também com d interações.
+def perfil_arvore(niveis, nos_do_nivel, fatores, tamanho_amostra, distancia_aresta):
+    profundidades = Histograma()
+    nos = 0
+    soma_acertos = 0
+    folhas_vazias = 0
+    soma_falhas = 0
+    altura = 0
+    registros = 0
+    balanceamento = Counter()
+    amostra_memoria = []
+    distancias = []
+    anterior = None
+    for profundidade, nivel in enumerate(niveis, 1):
+        if anterior is not None:
+            vazias = 2 * len(anterior) - len(nivel)
+            folhas_vazias += vazias
+            soma_falhas += vazias * (profundidade - 1)
+            if len(distancias) < AMOSTRA:
+                distancias.extend(distancia_aresta(anterior, AMOSTRA - len(distancias)))
+        quantidade = len(nivel)
+        nos += quantidade
+        altura = profundidade
+        soma_acertos += quantidade * profundidade
+        profundidades.registrar(profundidade, quantidade)
+        registros += nos_do_nivel(nivel)
+        if fatores is not None:
+            balanceamento.update(fatores(nivel))
+        if len(amostra_memoria) < AMOSTRA:
+            amostra_memoria.extend(tamanho_amostra(no) for no in nivel[:AMOSTRA - len(amostra_memoria)])
+        anterior = nivel
+    if anterior is not None:
+        folhas_vazias += 2 * len(anterior)
+        soma_falhas += 2 * len(anterior) * altura
+    else:
+        folhas_vazias = 1  # Árvore vazia: toda busca termina sem interações
+
+    resultado = {
+        'nos': nos,
+        'registros': registros,
+        'altura': altura,
+        'altura_minima': nos.bit_length(),
+        'profundidade': profundidades.resumo(),
+        'acerto_media': round(soma_acertos / nos, 3) if nos else 0,
+        'acerto_pior': altura,
+        'falha_media': round(soma_falhas / folhas_vazias, 3),
+        'falha_pior': altura,
+        'localidade': resumo_localidade(distancias),
+    }
+    if fatores is not None:
+        resultado['fatores_balanceamento'] = {str(fator): balanceamento[fator] for fator in sorted(balanceamento)}
+    if amostra_memoria:
+        resultado['memoria_bytes_por_no'] = round(sum(amostra_memoria) / len(amostra_memoria), 1)
+    return resultado
+
+def perfil_objetos(estrutura):
+    def altura(no):
+        return no.altura if no is not None else 0
+
+    def distancias(nivel, limite):
+        resultado = []
+        for no in nivel:
+            for filho in (no.esquerda, no.direita):
+                if filho is not None:
+                    resultado.append(abs(id(filho) - id(no)))
+            if len(resultado) >= limite:
+                break
+        return resultado
+
+    avl = estrutura.raiz is not None and hasattr(estrutura.raiz, 'altura')
+    resultado = perfil_arvore(
+        niveis_objetos(estrutura.raiz),
+        lambda nivel: len(nivel) + sum(len(no.extras) for no in nivel if getattr(no, 'extras', None)),
+        (lambda nivel: (altura(no.esquerda) - altura(no.direita) for no in nivel)) if avl else None,
+        tamanho_no,
+        distancias)
+    resultado['memoria_bytes'] = round(resultado.pop('memoria_bytes_por_no', 0) * resultado['nos'])
+    return resultado
+
+# Nas versões compactas os registros repetidos ficam fora da árvore, na lista de repetidos do nó da chave.
+def perfil_compacto(estrutura):
+    esquerda, direita = estrutura.esquerda, estrutura.direita
+    repetidos = estrutura.repetidos
+    alturas = getattr(estrutura, 'alturas', None)
+
+    def altura(no):
+        return alturas[no] if no != -1 else 0
+
+    def distancias(nivel, limite):
+        resultado = []
+        for no in nivel:
+            for filho in (esquerda[no], direita[no]):
+                if filho != -1:
+                    resultado.append(abs(filho - no) * esquerda.itemsize)
+            if len(resultado) >= limite:
+                break
+        return resultado
+
+    resultado = perfil_arvore(
+        niveis_compactos(estrutura.raiz, esquerda, direita),
+        lambda nivel: len(nivel) + sum(len(repetidos[no]) for no in nivel if no in repetidos),
+        (lambda nivel: (altura(esquerda[no]) - altura(direita[no]) for no in nivel)) if alturas is not None else None,
+        lambda no: 0,
+        distancias)
+    resultado.pop('memoria_bytes_por_no', None)
+    resultado['memoria_bytes'] = tamanho_compacto(estrutura)
+    return resultado
+
+# Pesquisa sequencial: o registro da posição i é encontrado com i interações (a primeira ocorrência da chave)
+# e toda busca que não encontra percorre a lista inteira.
+def perfil_lista(chaves, tamanho_memoria, distancias):
+    primeiras = {}
+    for posicao, chave in enumerate(chaves, 1):
+        if chave not in primeiras:
+            primeiras[chave] = posicao
+    registros = len(chaves)
+    profundidades = Histograma()
+    for posicao in primeiras.values():
+        profundidades.registrar(posicao)
+    return {
+        'nos': registros,
+        'registros': registros,
+        'altura': registros,
+        'altura_minima': registros,
+        'profundidade': profundidades.resumo(),
+        'acerto_media': round(profundidades.media(), 3),
+        'acerto_pior': profundidades.maximo or 0,
+        'falha_media': registros,
+        'falha_pior': registros,
+        'localidade': resumo_localidade(distancias),
+        'memoria_bytes': tamanho_memoria,
+    }
+
+def perfil_sequencial(estrutura):
+    chaves = []
+    amostra = []
+    distancias = []
+    no = estrutura.raiz
+    while no is not None:
+        chaves.append(no.chave)
+        if len(amostra) < AMOSTRA:
+            amostra.append(tamanho_no(no))
+            if no.proximo is not None:
+                distancias.append(abs(id(no.proximo) - id(no)))
+        no = no.proximo
+    memoria = round(sum(amostra) / len(amostra) * len(chaves)) if amostra else 0
+    return perfil_lista(chaves, memoria, distancias)
+
+# Perfil de saúde de uma estrutura: altura, distribuição das profundidades, caminhos médio e pior das buscas que
+# encontram e que não encontram, fatores de balanceamento e rotações (AVL), memória estimada e localidade
+# (distância na memória entre um nó e o seguinte no caminho de busca). Tudo é calculado sem recursão.
+def perfilar(estrutura):
+    inicio = time.perf_counter()
+    if hasattr(estrutura, 'cauda'):
+        resultado = perfil_sequencial(estrutura)
+    elif isinstance(getattr(estrutura, 'esquerda', None), array):
+        resultado = perfil_compacto(estrutura)
+    elif isinstance(getattr(estrutura, 'chaves', None), array) and hasattr(estrutura, 'inicios_dado2'):
+        resultado = perfil_lista(estrutura.chaves, tamanho_compacto(estrutura), [estrutura.chaves.itemsize] * min(len(estrutura.chaves), AMOSTRA))
+    elif hasattr(estrutura, 'raiz') and hasattr(estrutura, 'em_ordem'):
+        resultado = perfil_objetos(estrutura)
+    else:
+        raise TypeError(f"Estrutura sem perfil: {type(estrutura).__name__}")
+    if resultado['registros']:
+        resultado['memoria_bytes_por_registro'] = round(resultado['memoria_bytes'] / resultado['registros'], 1)
+    if hasattr(estrutura, 'rotacoes'):
+        resultado['rotacoes'] = estrutura.rotacoes
+    resultado['tempo_perfil_s'] = round(time.perf_counter() - inicio, 3)
+    return resultado
+
+# Achata os dicionários aninhados do perfil em colunas ("profundidade_p50", "localidade_mesma_pagina", ...) para o CSV.
+def achatar(dados, prefixo=''):
+    linha = {}
+    for chave, valor in dados.items():
+        if isinstance(valor, dict):
+            linha.update(achatar(valor, f"{prefixo}{chave}_"))
+        else:
+            linha[f"{prefixo}{chave}"] = valor
+    return linha
+
+def formatar_perfil(linha):
+    cabecalho = f"{linha['estrutura']:<24} n={linha['tamanho']:<9} {linha['ordem']:<12}"
+    if linha['situacao'] != 'ok':
+        return f"{cabecalho} {linha['situacao']}"
+    texto = (f"{cabecalho} altura={linha['altura']} (mín. {linha['altura_minima']}) "
+             f"acerto média/pior={linha['acerto_media']}/{linha['acerto_pior']} "
+             f"falha média/pior={linha['falha_media']}/{linha['falha_pior']} "
+             f"memória={linha['memoria_bytes_por_registro'] if 'memoria_bytes_por_registro' in linha else 0}B/registro "
+             f"mesma página={linha['localidade_mesma_pagina']:.0%} perfil={linha['tempo_perfil_s']}s")
+    fatores = [coluna for coluna in linha if coluna.startswith('fatores_balanceamento_')]
+    if fatores:
+        texto += " fb=" + ",".join(f"{coluna[len('fatores_balanceamento_'):]}:{linha[coluna]}" for coluna in fatores)
+    return texto
+
+def main():
+    suportadas = [nome for nome in MOTORES if nome not in ('arvore_b', 'hash', 'vetor_ordenado')]
+    parser = argparse.ArgumentParser(description="Perfil de saúde das estruturas: profundidades, caminhos de busca, balanceamento, memória e localidade.")
+    parser.add_argument('--tamanhos', type=lista_de_inteiros, default=[100000])
+    parser.add_argument('--ordens', type=lista_de_nomes(ORDENS), default=['ordenada', 'embaralhada'])
+    parser.add_argument('--estruturas', type=lista_de_nomes(suportadas), default=['binaria', 'avl', 'avl_compacta'])
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--limite-quadratico', type=int, default=20000,
+                        help="maior tamanho montado para estruturas O(n²) na ordem de chaves pedida")
+    parser.add_argument('--saida', help="arquivo .csv ou .json para gravar os resultados")
+    args = parser.parse_args()
+
+    linhas = []
+    for tamanho in args.tamanhos:
+        for ordem in args.ordens:
+            dados = gerar_conjunto(tamanho, ordem, args.semente)
+            for nome in args.estruturas:
+                motor = MOTORES[nome]
+                linha = {'estrutura': nome, 'tamanho': tamanho, 'ordem': ordem, 'semente': args.semente}
+                if motor.quadratica(ordem) and tamanho > args.limite_quadratico:
+                    linha['situacao'] = f'ignorada: montagem O(n²) acima de {args.limite_quadratico} registros'
+                else:
+                    estrutura = motor.criar()
+                    try:
+                        for entrada in dados:
+                            estrutura.inserir(*entrada)
+                        linha['situacao'] = 'ok'
+                        linha.update(achatar(perfilar(estrutura)))
+                    finally:
+                        motor.fechar(estrutura)
+                print(formatar_perfil(linha))
+                linhas.append(linha)
+    if args.saida:
+        salvar(linhas, args.saida)
+        print(f"Resultados gravados em {args.saida}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+import argparse
+import os
+import random
+import re
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+
+from AAVL.avlTree import ArvoreAVL
+from registros import ArquivoRegistros, gravar_registros
+
+# Cada operação do log: tipo, chave, dado1 e tamanho do dado2, seguidos do dado2 e do CRC32 de tudo isso.
+# Um registro incompleto ou com CRC errado no fim do log (queda no meio de uma gravação) é descartado na recuperação.
+FORMATO_OPERACAO = struct.Struct('<BqiH')
+FORMATO_CRC = struct.Struct('<I')
+INSERIR = ord('I')
+REMOVER = ord('R')
+GRUPO = 256  # Operações acumuladas antes de cada gravação + fsync (group commit)
+
+# Os arquivos de cada geração: o instantâneo N contém tudo o que foi feito antes do log N.
+NOME_LOG = re.compile(r'operacoes\.(\d+)\.log$')
+NOME_INSTANTANEO = re.compile(r'instantaneo\.(\d+)\.bin$')
+
+def nome_log(diretorio, geracao):
+    return os.path.join(diretorio, f'operacoes.{geracao}.log')
+
+def nome_instantaneo(diretorio, geracao):
+    return os.path.join(diretorio, f'instantaneo.{geracao}.bin')
+
+def geracoes(diretorio, padrao):
+    encontradas = []
+    for nome in os.listdir(diretorio):
+        correspondencia = padrao.match(nome)
+        if correspondencia:
+            encontradas.append(int(correspondencia.group(1)))
+    return sorted(encontradas)
+
+# Log de operações só de acréscimo. As operações ficam em um buffer e são gravadas juntas a cada "grupo"
+# operações (ou em confirmar/fechar), com um único fsync por grupo em vez de um por operação.
+class LogOperacoes:
+    def __init__(self, nome_arquivo, grupo=GRUPO, sincronizar=True):
+        self.nome_arquivo = nome_arquivo
+        self.grupo = max(1, grupo)
+        self.sincronizar = sincronizar
+        self.arquivo = open(nome_arquivo, 'ab')
+        self.buffer = bytearray()
+        self.pendentes = 0
+        self.operacoes = 0
+        self.gravacoes = 0
+
+    def _acrescentar(self, tipo, chave, dado1, dado2):
+        dado2 = dado2.encode('ascii')
+        inicio = len(self.buffer)
+        self.buffer += FORMATO_OPERACAO.pack(tipo, chave, dado1, len(dado2))
+        self.buffer += dado2
+        self.buffer += FORMATO_CRC.pack(zlib.crc32(memoryview(self.buffer)[inicio:]))
+        self.pendentes += 1
+        self.operacoes += 1
+        if self.pendentes >= self.grupo:
+            self.confirmar()
+
+    def registrar_insercao(self, chave, dado1, dado2):
+        self._acrescentar(INSERIR, chave, dado1, dado2)
+
+    def registrar_remocao(self, chave):
+        self._acrescentar(REMOVER, chave, 0, '')
+
+    # Grava o grupo pendente e força a ida para o disco.
+    def confirmar(self):
+        if not self.pendentes:
+            return
+        self.arquivo.write(self.buffer)
+        self.arquivo.flush()
+        if self.sincronizar:
+            os.fsync(self.arquivo.fileno())
+        self.buffer.clear()
+        self.pendentes = 0
+        self.gravacoes += 1
+
+    def fechar(self):
+        self.confirmar()
+        self.arquivo.close()
+
+# Lê as operações válidas de um log: (tipo, chave, dado1, dado2). Se o fim do log estiver incompleto ou corrompido,
+# ele é truncado no último registro válido.
+def ler_log(nome_arquivo):
+    with open(nome_arquivo, 'rb') as arquivo:
+        dados = arquivo.read()
+    operacoes = []
+    posicao = 0
+    tamanho_cabecalho = FORMATO_OPERACAO.size
+    while posicao + tamanho_cabecalho <= len(dados):
+        tipo, chave, dado1, tamanho = FORMATO_OPERACAO.unpack_from(dados, posicao)
+        fim = posicao + tamanho_cabecalho + tamanho
+        if fim + FORMATO_CRC.size > len(dados):
+            break
+        (crc,) = FORMATO_CRC.unpack_from(dados, fim)
+        if crc != zlib.crc32(dados[posicao:fim]) or tipo not in (INSERIR, REMOVER):
+            break
+        operacoes.append((tipo, chave, dado1, dados[posicao + tamanho_cabecalho:fim].decode('ascii')))
+        posicao = fim + FORMATO_CRC.size
+    if posicao < len(dados):
+        with open(nome_arquivo, 'r+b') as arquivo:
+            arquivo.truncate(posicao)
+    return operacoes
+
+# Todos os registros da estrutura na ordem em que ela os percorre (em ordem de chave nas árvores), com as chaves repetidas.
+def registros_da_estrutura(estrutura):
+    for no in estrutura:
+        if hasattr(no, 'registros'):
+            yield from no.registros()
+        else:
+            yield no.chave, no.dado1, no.dado2
+
+# Estrutura persistente: cada inserir/remover vai primeiro para o log e depois para a estrutura em memória.
+# instantaneo() grava a sequência em ordem no formato de registros.py e começa um log novo; na abertura,
+# a estrutura é recuperada do instantâneo mais recente mais as operações dos logs seguintes.
+class EstruturaPersistente:
+    def __init__(self, diretorio, criar=ArvoreAVL, grupo=GRUPO, sincronizar=True):
+        self.diretorio = diretorio
+        self.criar = criar
+        self.grupo = grupo
+        self.sincronizar = sincronizar
+        os.makedirs(diretorio, exist_ok=True)
+        self.estrutura, self.geracao, self.operacoes_recuperadas = self._recuperar()
+        self.log = LogOperacoes(nome_log(diretorio, self.geracao), grupo, sincronizar)
+
+    def _recuperar(self):
+        estrutura = self.criar()
+        instantaneos = geracoes(self.diretorio, NOME_INSTANTANEO)
+        geracao = instantaneos[-1] if instantaneos else 0
+        if instantaneos:
+            with ArquivoRegistros(nome_instantaneo(self.diretorio, geracao)) as arquivo:
+                registros = list(arquivo)
+            if hasattr(estrutura, 'carregar_ordenados'):
+                estrutura.carregar_ordenados(registros)
+            else:
+                for registro in registros:
+                    estrutura.inserir(*registro)
+
+        recuperadas = 0
+        logs = [numero for numero in geracoes(self.diretorio, NOME_LOG) if numero >= geracao]
+        for numero in logs:
+            for tipo, chave, dado1, dado2 in ler_log(nome_log(self.diretorio, numero)):
+                if tipo == INSERIR:
+                    estrutura.inserir(chave, dado1, dado2)
+                else:
+                    estrutura.remover(chave)
+                recuperadas += 1
+        return estrutura, max([geracao] + logs), recuperadas
+
+    def inserir(self, chave, dado1, dado2):
+        self.log.registrar_insercao(chave, dado1, dado2)
+        self.estrutura.inserir(chave, dado1, dado2)
+
+    def remover(self, chave):
+        self.log.registrar_remocao(chave)
+        return self.estrutura.remover(chave)
+
+    def buscar(self, chave):
+        return self.estrutura.buscar(chave)
+
+    # Garante que todas as operações já feitas estão no disco.
+    def confirmar(self):
+        self.log.confirmar()
+
+    # Grava um instantâneo da estrutura e descarta os logs e o instantâneo anteriores.
+    # O log novo é aberto antes, então uma queda no meio do instantâneo ainda é recuperada pela geração anterior.
+    def instantaneo(self):
+        self.log.fechar()
+        anterior = self.geracao
+        self.geracao += 1
+        self.log = LogOperacoes(nome_log(self.diretorio, self.geracao), self.grupo, self.sincronizar)
+
+        registros = list(registros_da_estrutura(self.estrutura))
+        temporario = nome_instantaneo(self.diretorio, self.geracao) + '.tmp'
+        gravar_registros(registros, temporario, hasattr(self.estrutura, 'carregar_ordenados'))
+        if self.sincronizar:
+            with open(temporario, 'rb') as arquivo:
+                os.fsync(arquivo.fileno())
+        os.replace(temporario, nome_instantaneo(self.diretorio, self.geracao))
+
+        for numero in geracoes(self.diretorio, NOME_LOG):
+            if numero <= anterior:
+                os.remove(nome_log(self.diretorio, numero))
+        for numero in geracoes(self.diretorio, NOME_INSTANTANEO):
+            if numero < self.geracao:
+                os.remove(nome_instantaneo(self.diretorio, numero))
+        return len(registros)
+
+    def fechar(self):
+        self.log.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede a vazão de inserção com o log de operações e o tempo de recuperação.")
+    parser.add_argument('--registros', type=int, default=100000)
+    parser.add_argument('--grupos', type=lambda texto: [int(valor) for valor in texto.split(',')], default=[1, 64, 1024],
+                        help="tamanhos de grupo (operações por fsync) a comparar, separados por vírgulas")
+    parser.add_argument('--logs', type=lambda texto: [int(valor) for valor in texto.split(',')], default=[10000, 50000, 100000],
+                        help="tamanhos do log a recuperar, separados por vírgulas")
+    parser.add_argument('--sem-fsync', action='store_true', help="grava os grupos sem forçar a ida para o disco")
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    gerador = random.Random(args.semente)
+    chaves = list(range(1, args.registros + 1))
+    gerador.shuffle(chaves)
+    dados = [(chave, gerador.randint(1, 100), ''.join(gerador.choices('abcdefghij', k=100))) for chave in chaves]
+
+    inicio = time.perf_counter()
+    arvore = ArvoreAVL()
+    for registro in dados:
+        arvore.inserir(*registro)
+    tempo_base = time.perf_counter() - inicio
+    print(f"Sem log: {len(dados) / tempo_base:,.0f} inserções/s")
+
+    for grupo in args.grupos:
+        diretorio = tempfile.mkdtemp()
+        try:
+            # Com grupo 1 e fsync cada inserção vai ao disco sozinha; limita a quantidade para o teste não demorar demais
+            quantidade = len(dados) if grupo > 1 or args.sem_fsync else min(len(dados), 2000)
+            inicio = time.perf_counter()
+            with EstruturaPersistente(diretorio, grupo=grupo, sincronizar=not args.sem_fsync) as persistente:
+                for registro in dados[:quantidade]:
+                    persistente.inserir(*registro)
+            tempo = time.perf_counter() - inicio
+            print(f"Com log, grupo de {grupo}: {quantidade / tempo:,.0f} inserções/s ({persistente.log.gravacoes} gravações)")
+        finally:
+            shutil.rmtree(diretorio)
+
+    for tamanho_log in args.logs:
+        tamanho_log = min(tamanho_log, len(dados))
+        diretorio = tempfile.mkdtemp()
+        try:
+            with EstruturaPersistente(diretorio, grupo=GRUPO, sincronizar=False) as persistente:
+                for registro in dados[:tamanho_log]:
+                    persistente.inserir(*registro)
+            inicio = time.perf_counter()
+            with EstruturaPersistente(diretorio, sincronizar=False) as recuperada:
+                tempo_log = time.perf_counter() - inicio
+                recuperada.instantaneo()
+            inicio = time.perf_counter()
+            with EstruturaPersistente(diretorio, sincronizar=False):
+                tempo_instantaneo = time.perf_counter() - inicio
+            print(f"Recuperação de {tamanho_log} operações: {tempo_log:.3f} s reaplicando o log, "
+                  f"{tempo_instantaneo:.3f} s a partir do instantâneo")
+        finally:
+            shutil.rmtree(diretorio)
+
+if __name__ == "__main__":
+    main()
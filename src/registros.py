@@ -0,0 +1,208 @@
+import argparse
+import mmap
+import random
+import struct
+import time
+import weakref
+from operator import itemgetter
+
+from AAVL.avlTree import ArvoreAVLCompacta
+from arvores import Registro
+
+TAMANHO_BLOCO = 1 << 20  # Quantidade de bytes lida ou gravada por vez
+
+# Cabeçalho do arquivo binário: identificador, largura do dado2, se os registros estão ordenados e quantidade de registros.
+# Depois do cabeçalho vêm os registros, todos com o mesmo tamanho: chave '<q', dado1 '<i' e dado2 com 'largura' bytes
+# (completado com zeros), então o registro de posição i começa em FORMATO_CABECALHO.size + i * tamanho do registro.
+FORMATO_CABECALHO = struct.Struct('<4sIIQ')
+IDENTIFICADOR = b'TP1I'
+
+def formato_registro(largura):
+    return struct.Struct(f'<qi{largura}s')
+
+# Lê um arquivo de dados no formato "chave dado1 dado2" em blocos grandes e gera uma tupla por registro.
+def ler_registros(nome_arquivo, tamanho_bloco=TAMANHO_BLOCO):
+    with open(nome_arquivo, 'rb') as arquivo:
+        resto = b''
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            linhas = (resto + bloco).split(b'\n')
+            resto = linhas.pop()  # A última linha do bloco pode estar incompleta
+            for linha in linhas:
+                if linha:
+                    chave, dado1, dado2 = linha.split(b' ', 2)
+                    yield int(chave), int(dado1), dado2.rstrip(b'\r').decode('ascii')
+        if resto.strip():
+            chave, dado1, dado2 = resto.split(b' ', 2)
+            yield int(chave), int(dado1), dado2.rstrip(b'\r').decode('ascii')
+
+# Grava os registros, na ordem recebida, no formato binário de largura fixa e retorna a quantidade gravada.
+# Sem a largura, ela é a do maior dado2 (e os registros precisam estar em uma lista); com ela, os registros podem vir de um gerador.
+def gravar_registros(registros, nome_arquivo, ordenado=False, largura=None):
+    if largura is None:
+        largura = max((len(dado2) for _, _, dado2 in registros), default=0)
+    formato = formato_registro(largura)
+    quantidade = 0
+    with open(nome_arquivo, 'wb') as arquivo:
+        arquivo.write(FORMATO_CABECALHO.pack(IDENTIFICADOR, largura, 1 if ordenado else 0, 0))
+        buffer = bytearray()
+        for chave, dado1, dado2 in registros:
+            buffer += formato.pack(chave, dado1, dado2.encode('ascii'))
+            quantidade += 1
+            if len(buffer) >= TAMANHO_BLOCO:
+                arquivo.write(buffer)
+                buffer.clear()
+        arquivo.write(buffer)
+        # A quantidade só é conhecida no fim, então o cabeçalho é regravado
+        arquivo.seek(0)
+        arquivo.write(FORMATO_CABECALHO.pack(IDENTIFICADOR, largura, 1 if ordenado else 0, quantidade))
+    return quantidade
+
+# Arquivo de registros mapeado em memória. Qualquer registro é acessado diretamente pelo deslocamento, sem reinterpretar texto.
+class ArquivoRegistros:
+    def __init__(self, nome_arquivo):
+        with open(nome_arquivo, 'rb') as arquivo:
+            self.mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        identificador, self.largura, ordenado, self.quantidade = FORMATO_CABECALHO.unpack_from(self.mapa, 0)
+        if identificador != IDENTIFICADOR:
+            self.mapa.close()
+            raise ValueError(f"{nome_arquivo} não é um arquivo de registros")
+        self.ordenado = ordenado == 1
+        self.formato = formato_registro(self.largura)
+        self.visao = memoryview(self.mapa)
+        self.percursos = weakref.WeakSet()  # Percursos em andamento, encerrados por fechar()
+
+    def __len__(self):
+        return self.quantidade
+
+    # Deslocamento, em bytes, do registro de posição i.
+    def deslocamento(self, posicao):
+        return FORMATO_CABECALHO.size + posicao * self.formato.size
+
+    # Desempacota todos os registros com o formato. A fatia do mapa usada pelo percurso é liberada quando ele termina
+    # ou é encerrado (close), então um percurso interrompido não impede fechar() de fechar o mapa.
+    def _desempacotar(self, formato):
+        corpo = self.visao[FORMATO_CABECALHO.size:self.deslocamento(self.quantidade)]
+        valores = formato.iter_unpack(corpo)
+        try:
+            yield from valores
+        finally:
+            del valores
+            corpo.release()
+
+    def _percorrer(self, gerador):
+        self.percursos.add(gerador)
+        return gerador
+
+    def __iter__(self):
+        return self._percorrer(self._registros())
+
+    def _registros(self):
+        for chave, dado1, dado2 in self._desempacotar(self.formato):
+            yield chave, dado1, dado2.rstrip(b'\0').decode('ascii')
+
+    # Gera (chave, deslocamento) de todos os registros, sem decodificar o dado2.
+    def deslocamentos(self):
+        return self._percorrer(self._deslocamentos())
+
+    def _deslocamentos(self):
+        tamanho = self.formato.size
+        deslocamento = FORMATO_CABECALHO.size
+        for (chave,) in self._desempacotar(struct.Struct(f'<q{tamanho - 8}x')):
+            yield chave, deslocamento
+            deslocamento += tamanho
+
+    # Lê o registro que começa no deslocamento. O dado2 é uma fatia do mapa (memoryview), sem cópia:
+    # use bytes(dado2) ou dado2.tobytes().decode() para obter o texto.
+    def ler(self, deslocamento):
+        chave, dado1 = struct.unpack_from('<qi', self.mapa, deslocamento)
+        inicio = deslocamento + 12
+        fim = self.mapa.find(b'\0', inicio, inicio + self.largura)
+        return Registro(chave, dado1, self.visao[inicio:fim if fim != -1 else inicio + self.largura])
+
+    # Os percursos ainda suspensos são encerrados aqui; as fatias de dado2 entregues por ler() precisam ter sido
+    # liberadas antes de fechar o mapa.
+    def fechar(self):
+        for percurso in list(self.percursos):
+            percurso.close()
+        self.visao.release()
+        self.mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+# Converte um arquivo de dados em texto (dados.txt, dados_sequencial.txt) para o formato binário.
+# Sem a largura, o arquivo de texto é lido duas vezes: a primeira só para descobrir o maior dado2.
+def converter_texto(nome_texto, nome_binario, ordenado=False, largura=None):
+    if ordenado:
+        registros = sorted(ler_registros(nome_texto), key=itemgetter(0))
+        return gravar_registros(registros, nome_binario, True, largura)
+    if largura is None:
+        largura = max((len(dado2) for _, _, dado2 in ler_registros(nome_texto)), default=0)
+    return gravar_registros(ler_registros(nome_texto), nome_binario, False, largura)
+
+# Índice em memória que guarda só chave -> deslocamento do registro no arquivo; o registro é lido do mapa quando a chave é encontrada.
+# Por padrão usa a AVL compacta (arrays de inteiros), com o deslocamento no lugar do dado1 e o dado2 vazio.
+class IndiceDeslocamentos:
+    def __init__(self, arquivo, estrutura=None):
+        self.arquivo = arquivo
+        self.arvore = estrutura if estrutura is not None else ArvoreAVLCompacta()
+        if hasattr(self.arvore, 'carregar_ordenados'):
+            pares = list(arquivo.deslocamentos())
+            if not arquivo.ordenado:
+                pares.sort(key=itemgetter(0))
+            self.arvore.carregar_ordenados([(chave, deslocamento, '') for chave, deslocamento in pares])
+        else:
+            for chave, deslocamento in arquivo.deslocamentos():
+                self.arvore.inserir(chave, deslocamento, '')
+
+    # Mesmo contrato das estruturas: retorna o registro (com o dado2 sem cópia), o tempo gasto e o número de interações.
+    def buscar(self, chave):
+        tempo_inicio = time.perf_counter_ns()
+        no, _, interacoes = self.arvore.buscar(chave)
+        registro = self.arquivo.ler(no.dado1) if no else None
+        tempo_fim = time.perf_counter_ns()
+        return registro, (tempo_fim - tempo_inicio) / 1e9, interacoes
+
+def main():
+    parser = argparse.ArgumentParser(description="Converte um arquivo de dados em texto para o formato binário de largura fixa e busca pelo índice de deslocamentos.")
+    parser.add_argument('arquivo', help="arquivo de dados em texto (ex.: AAVL/dados.txt) ou binário já convertido (.bin)")
+    parser.add_argument('--saida', help="arquivo binário gerado (padrão: <arquivo>.bin)")
+    parser.add_argument('--ordenado', action='store_true', help="grava os registros ordenados pela chave")
+    parser.add_argument('--buscas', type=int, default=1000, help="quantidade de chaves aleatórias a buscar")
+    args = parser.parse_args()
+
+    nome_binario = args.arquivo
+    if not args.arquivo.endswith('.bin'):
+        nome_binario = args.saida or f"{args.arquivo}.bin"
+        tempo_inicio = time.perf_counter()
+        quantidade = converter_texto(args.arquivo, nome_binario, args.ordenado)
+        print(f"{quantidade} registros convertidos para {nome_binario} em {time.perf_counter() - tempo_inicio:.6f} segundos")
+
+    with ArquivoRegistros(nome_binario) as arquivo:
+        tempo_inicio = time.perf_counter()
+        indice = IndiceDeslocamentos(arquivo)
+        print(f"Índice de {len(arquivo)} chaves montado em {time.perf_counter() - tempo_inicio:.6f} segundos")
+        if not len(arquivo):
+            return
+        chaves = [chave for chave, _ in arquivo.deslocamentos()]
+        tempo_total = 0
+        interacoes_total = 0
+        encontradas = 0
+        for chave in random.choices(chaves, k=args.buscas):
+            registro, tempo, interacoes = indice.buscar(chave)
+            tempo_total += tempo
+            interacoes_total += interacoes
+            if registro:
+                encontradas += 1
+                registro.dado2.release()
+        print(f"Busca pelos números que existem: {encontradas}/{args.buscas} encontradas, "
+              f"Tempo total: {tempo_total:.6f} segundos, Interacoes: {interacoes_total}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+import argparse
+import asyncio
+import heapq
+import random
+import time
+from operator import itemgetter
+
+from AAVL.avlTree import ArvoreAVL, Registro
+from instrumentacao import Histograma
+
+TAMANHO_LOTE = 256          # Buscas acumuladas antes de o lote ser executado imediatamente
+ESPERA_LOTE = 0             # Tempo máximo, em segundos, que uma busca espera por outras (0 = só as que chegam na mesma volta do laço)
+LIMITE_DELTA = 4096         # Chaves inseridas que disparam a reconstrução do instantâneo em segundo plano
+
+# Todos os registros de uma árvore em ordem de chave, com as chaves repetidas na ordem de inserção.
+def registros_em_ordem(arvore):
+    for no in arvore:
+        yield from no.registros()
+
+# Monta uma árvore nova a partir dos registros do instantâneo antigo e das inserções pendentes.
+# Roda fora do laço de eventos; só lê o instantâneo antigo, que nunca é alterado.
+def reconstruir(instantaneo, delta):
+    novos = [(chave, dado1, dado2) for chave in sorted(delta) for dado1, dado2 in delta[chave]]
+    arvore = ArvoreAVL()
+    arvore.carregar_ordenados(list(heapq.merge(registros_em_ordem(instantaneo), novos, key=itemgetter(0))))
+    return arvore
+
+# Fachada assíncrona de buscas. As buscas concorrentes são agrupadas em lotes e executadas com buscar_lote
+# sobre um instantâneo somente leitura da árvore. As inserções vão para um dicionário de pendentes (delta);
+# quando ele cresce, uma árvore nova é montada em segundo plano e troca de lugar com o instantâneo
+# (cópia na escrita), então as leituras nunca esperam pelas escritas.
+class ServicoBuscas:
+    def __init__(self, arvore=None, tamanho_lote=TAMANHO_LOTE, espera_lote=ESPERA_LOTE, limite_delta=LIMITE_DELTA):
+        self.instantaneo = arvore if arvore is not None else ArvoreAVL()
+        self.tamanho_lote = max(1, tamanho_lote)
+        self.espera_lote = espera_lote
+        self.limite_delta = limite_delta
+        self.delta = {}             # Chave -> [(dado1, dado2), ...] inseridos depois do instantâneo
+        self.congelado = {}         # Delta que está sendo incorporado pela reconstrução em andamento
+        self.reconstrucao = None
+        self.pendentes = []         # (chave, futuro) das buscas que aguardam o próximo lote
+        self.agendado = None
+        self.lotes = 0
+        self.buscas = 0
+        self.reconstrucoes = 0
+
+    # Busca uma chave e retorna o primeiro registro com ela (ou None).
+    async def buscar(self, chave):
+        futuro = asyncio.get_running_loop().create_future()
+        self.pendentes.append((chave, futuro))
+        if len(self.pendentes) >= self.tamanho_lote:
+            self._executar_lote()
+        elif self.agendado is None:
+            laco = asyncio.get_running_loop()
+            if self.espera_lote:
+                self.agendado = laco.call_later(self.espera_lote, self._executar_lote)
+            else:
+                self.agendado = laco.call_soon(self._executar_lote)
+        return await futuro
+
+    def _executar_lote(self):
+        if self.agendado is not None:
+            self.agendado.cancel()
+            self.agendado = None
+        pendentes, self.pendentes = self.pendentes, []
+        if not pendentes:
+            return
+        chaves = [chave for chave, _ in pendentes]
+        resultados, _, _ = self.instantaneo.buscar_lote(chaves)
+        for (chave, futuro), (no, _) in zip(pendentes, resultados):
+            if futuro.cancelled():
+                continue
+            if no is not None:
+                futuro.set_result(Registro(no.chave, no.dado1, no.dado2))
+                continue
+            inseridos = self.congelado.get(chave) or self.delta.get(chave)
+            futuro.set_result(Registro(chave, *inseridos[0]) if inseridos else None)
+        self.lotes += 1
+        self.buscas += len(pendentes)
+
+    # Registra a inserção no delta; o registro já é visível para as buscas seguintes.
+    async def inserir(self, chave, dado1, dado2):
+        self.delta.setdefault(chave, []).append((dado1, dado2))
+        if len(self.delta) >= self.limite_delta and self.reconstrucao is None:
+            self.reconstrucao = asyncio.get_running_loop().create_task(self._reconstruir())
+
+    async def _reconstruir(self):
+        self.congelado, self.delta = self.delta, {}
+        try:
+            nova = await asyncio.get_running_loop().run_in_executor(None, reconstruir, self.instantaneo, self.congelado)
+            self.instantaneo = nova
+            self.reconstrucoes += 1
+        except BaseException:
+            # Sem a árvore nova, as inserções congeladas voltam para o delta, antes das que chegaram depois
+            for chave, inseridos in self.delta.items():
+                self.congelado.setdefault(chave, []).extend(inseridos)
+            self.delta = self.congelado
+            raise
+        finally:
+            self.congelado = {}
+            self.reconstrucao = None
+
+    # Incorpora todas as inserções pendentes ao instantâneo e espera a troca.
+    async def consolidar(self):
+        if self.reconstrucao is not None:
+            await self.reconstrucao
+        if self.delta:
+            self.reconstrucao = asyncio.get_running_loop().create_task(self._reconstruir())
+            await self.reconstrucao
+
+    def estatisticas(self):
+        return {
+            'buscas': self.buscas,
+            'lotes': self.lotes,
+            'lote_medio': round(self.buscas / self.lotes, 2) if self.lotes else 0,
+            'pendentes_delta': len(self.delta) + len(self.congelado),
+            'reconstrucoes': self.reconstrucoes,
+        }
+
+# Protocolo de linhas pelo soquete local, uma requisição por linha:
+#   B <chave>                   -> "1 <dado1> <dado2>" ou "0"
+#   I <chave> <dado1> <dado2>   -> "OK"
+# Um cliente pode mandar várias requisições sem esperar as respostas; elas voltam na mesma ordem.
+class ServidorBuscas:
+    def __init__(self, servico):
+        self.servico = servico
+        self.conexoes = set()
+
+    async def _responder(self, linha):
+        partes = linha.split(b' ', 3)
+        try:
+            if partes[0] == b'B' and len(partes) == 2:
+                registro = await self.servico.buscar(int(partes[1]))
+                return b'0\n' if registro is None else f"1 {registro.dado1} {registro.dado2}\n".encode('ascii')
+            if partes[0] == b'I' and len(partes) == 4:
+                await self.servico.inserir(int(partes[1]), int(partes[2]), partes[3].decode('ascii'))
+                return b'OK\n'
+        except ValueError:
+            pass
+        return b'ERRO\n'
+
+    async def atender(self, leitor, escritor):
+        self.conexoes.add(asyncio.current_task())
+        respostas = asyncio.Queue()
+
+        async def escrever():
+            while True:
+                tarefa = await respostas.get()
+                if tarefa is None:
+                    break
+                escritor.write(await tarefa)
+                if respostas.empty():
+                    await escritor.drain()
+
+        escrita = asyncio.create_task(escrever())
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                respostas.put_nowait(asyncio.ensure_future(self._responder(linha.rstrip(b'\r\n'))))
+        finally:
+            respostas.put_nowait(None)
+            await escrita
+            escritor.close()
+            self.conexoes.discard(asyncio.current_task())
+
+    async def iniciar(self, endereco='127.0.0.1', porta=0):
+        self.servidor = await asyncio.start_server(self.atender, endereco, porta)
+        return self.servidor.sockets[0].getsockname()[1]
+
+    # Para de aceitar conexões e espera as conexões abertas terminarem de responder.
+    async def fechar(self):
+        self.servidor.close()
+        await asyncio.gather(*self.conexoes, return_exceptions=True)
+        await self.servidor.wait_closed()
+
+# Gerador de carga: cada conexão mantém até "profundidade" requisições em andamento e mede a latência de cada uma.
+async def gerar_carga(endereco, porta, chaves, conexoes=8, profundidade=16, fracao_insercoes=0.0, semente=42):
+    latencias = Histograma()
+    por_conexao = [chaves[i::conexoes] for i in range(conexoes)]
+    maior = max(chaves, default=0)
+
+    async def cliente(numero, lista):
+        gerador = random.Random(f"{semente}-{numero}")
+        leitor, escritor = await asyncio.open_connection(endereco, porta)
+        enviados = asyncio.Queue(profundidade)
+        encontradas = 0
+
+        async def ler():
+            nonlocal encontradas
+            for _ in range(len(lista)):
+                resposta = await leitor.readline()
+                latencias.registrar(time.perf_counter_ns() - enviados.get_nowait())
+                encontradas += resposta.startswith(b'1')
+
+        leitura = asyncio.create_task(ler())
+        for chave in lista:
+            await enviados.put(time.perf_counter_ns())
+            if fracao_insercoes and gerador.random() < fracao_insercoes:
+                escritor.write(f"I {maior + gerador.randint(1, maior + 1)} {gerador.randint(1, 100)} novo\n".encode('ascii'))
+            else:
+                escritor.write(f"B {chave}\n".encode('ascii'))
+            if enviados.full():
+                await escritor.drain()
+        await escritor.drain()
+        await leitura
+        escritor.close()
+        await escritor.wait_closed()
+        return encontradas
+
+    inicio = time.perf_counter()
+    encontradas = sum(await asyncio.gather(*(cliente(i, lista) for i, lista in enumerate(por_conexao))))
+    tempo = time.perf_counter() - inicio
+    return {'requisicoes': len(chaves), 'segundos': round(tempo, 3), 'vazao': round(len(chaves) / tempo) if tempo else 0,
+            'encontradas': encontradas, 'latencia_ns': latencias.resumo((50, 99, 99.9))}
+
+def montar_arvore(registros):
+    arvore = ArvoreAVL()
+    arvore.carregar_ordenados([(chave, chave % 100 + 1, 'dado') for chave in range(1, registros + 1)])
+    return arvore
+
+async def executar_local(args):
+    servico = ServicoBuscas(montar_arvore(args.registros), args.tamanho_lote, args.espera_lote / 1e6)
+    servidor = ServidorBuscas(servico)
+    porta = await servidor.iniciar(args.endereco, args.porta)
+    gerador = random.Random(args.semente)
+    chaves = [gerador.randint(1, args.registros * 2) for _ in range(args.requisicoes)]  # Metade existe, metade não
+    resultado = await gerar_carga(args.endereco, porta, chaves, args.conexoes, args.profundidade, args.fracao_insercoes, args.semente)
+    await servico.consolidar()
+    await servidor.fechar()
+    return resultado, servico.estatisticas()
+
+async def executar_servidor(args):
+    servico = ServicoBuscas(montar_arvore(args.registros), args.tamanho_lote, args.espera_lote / 1e6)
+    servidor = ServidorBuscas(servico)
+    porta = await servidor.iniciar(args.endereco, args.porta)
+    print(f"Servindo {args.registros} chaves em {args.endereco}:{porta}")
+    async with servidor.servidor:
+        await servidor.servidor.serve_forever()
+
+async def executar_carga(args):
+    gerador = random.Random(args.semente)
+    chaves = [gerador.randint(1, args.registros * 2) for _ in range(args.requisicoes)]
+    return await gerar_carga(args.endereco, args.porta, chaves, args.conexoes, args.profundidade, args.fracao_insercoes, args.semente), None
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço de buscas assíncrono com lotes, instantâneo somente leitura e gerador de carga.")
+    parser.add_argument('modo', nargs='?', choices=('local', 'servidor', 'carga'), default='local',
+                        help="local: servidor e carga no mesmo processo; servidor: só atende; carga: só gera carga")
+    parser.add_argument('--endereco', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=0, help="0 escolhe uma porta livre (modos local e servidor)")
+    parser.add_argument('--registros', type=int, default=100000)
+    parser.add_argument('--requisicoes', type=int, default=100000)
+    parser.add_argument('--conexoes', type=int, default=8)
+    parser.add_argument('--profundidade', type=int, default=16, help="requisições em andamento por conexão")
+    parser.add_argument('--fracao-insercoes', type=float, default=0.0)
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_LOTE)
+    parser.add_argument('--espera-lote', type=float, default=ESPERA_LOTE * 1e6,
+                        help="microssegundos que uma busca espera por outras para formar o lote (0 = só a mesma volta do laço)")
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+    if args.modo == 'carga' and not args.porta:
+        parser.error("o modo carga precisa da --porta do servidor")
+
+    if args.modo == 'servidor':
+        asyncio.run(executar_servidor(args))
+        return
+    resultado, estatisticas = asyncio.run(executar_local(args) if args.modo == 'local' else executar_carga(args))
+    latencia = resultado['latencia_ns']
+    print(f"{resultado['requisicoes']} requisições em {resultado['segundos']} s: {resultado['vazao']} req/s, "
+          f"{resultado['encontradas']} encontradas")
+    print(f"Latência p50/p99/p99.9: {latencia['p50'] / 1e3:.0f}/{latencia['p99'] / 1e3:.0f}/{latencia['p99.9'] / 1e3:.0f} µs")
+    if estatisticas:
+        print(f"Lotes: {estatisticas['lotes']}, tamanho médio {estatisticas['lote_medio']}, "
+              f"reconstruções do instantâneo: {estatisticas['reconstrucoes']}")
+
+if __name__ == "__main__":
+    main()